@@ -80,10 +80,12 @@ from .helpers import (
     entity,
     entity_registry,
     floor_registry,
+    import_profile,
     issue_registry,
     label_registry,
     recorder,
     restore_state,
+    setup_scheduler,
     template,
     translation,
 )
@@ -452,6 +454,9 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_code_cache(hass)),
+        create_eager_task(import_profile.async_load(hass)),
+        create_eager_task(setup_scheduler.async_load(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -983,6 +988,15 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+def _profiled_import_time(
+    integration_profile: import_profile.IntegrationImportProfile,
+) -> float:
+    """Return the seconds an integration took to import at the last startup."""
+    return integration_profile["component"] + sum(
+        integration_profile["platforms"].values()
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -1026,6 +1040,33 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    # Import the integrations imported at the last startup in the
+    # background, ahead of the stage that sets them up
+    profile = import_profile.async_get(hass)
+    last_startup = profile.last_startup
+    preload_order: dict[str, None] = {}
+    for stage_domains in (
+        *(domain_group for _, domain_group in pre_stage_domains),
+        stage_1_domains,
+        stage_2_domains,
+    ):
+        for domain in sorted(
+            stage_domains & last_startup.keys(),
+            key=lambda domain: _profiled_import_time(last_startup[domain]),
+            reverse=True,
+        ):
+            preload_order.setdefault(domain)
+    profile.async_preload(
+        integration_cache[domain]
+        for domain in preload_order
+        if domain in integration_cache
+    )
+
+    # Set up the config entries on the longest chains of dependent
+    # setups first when their resource class limits them
+    scheduler = setup_scheduler.async_get(hass)
+    scheduler.async_plan(integration_cache)
+
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1086,9 +1127,30 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    if profile.preloaded:
+        _LOGGER.info(
+            "Preloaded %s integrations, importing for %.2f seconds ahead of setup",
+            len(profile.preloaded),
+            profile.async_preload_time(),
+        )
+
+    if critical_path := scheduler.async_critical_path():
+        _LOGGER.info(
+            "Config entry setups on the critical path of the startup: %s",
+            " -> ".join(
+                f"{step['domain']} {step['title']} ({step['duration']:.2f}s,"
+                f" waited {step['wait']:.2f}s)"
+                for step in critical_path
+            ),
+        )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Integration import times ahead of setup: %s",
+            dict(sorted(profile.preloaded.items(), key=itemgetter(1), reverse=True)),
+        )
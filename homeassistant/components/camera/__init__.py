@@ -75,12 +75,14 @@ from .const import (
     DATA_CAMERA_PREFS,
     DATA_COMPONENT,
     DOMAIN,
+    PREF_FRAME_CACHE_MAX_AGE,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
     SERVICE_RECORD,
     CameraState,
     StreamType,
 )
+from .frame_cache import CameraFrameCache
 from .helper import get_camera_from_entity_id
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
@@ -181,6 +183,30 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+async def _async_fetch_image(
+    camera: Camera, width: int | None = None, height: int | None = None
+) -> Image | None:
+    """Fetch a new snapshot image from a camera, scaled on a best effort basis."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -194,30 +220,15 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    A frame of the camera not older than its frame cache
+    max age is returned from the cache.
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.frame_cache.async_get_image(
+                width, height, camera.async_frame_cache_max_age(), timeout
+            ):
                 return image
 
     raise HomeAssistantError("Unable to get image")
@@ -435,6 +446,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
+    "frame_cache_max_age",
     "frame_interval",
     "frontend_stream_type",
     "is_on",
@@ -455,6 +467,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
 
     # Entity Properties
     _attr_brand: str | None = None
+    _attr_frame_cache_max_age: float = 0
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     # Deprecated in 2024.12. Remove in 2025.6
     _attr_frontend_stream_type: StreamType | None
@@ -475,6 +488,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.stream: Stream | None = None
         self.stream_options: dict[str, str | bool | float] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
+        self.frame_cache = CameraFrameCache(partial(_async_fetch_image, self))
         self.access_tokens: collections.deque = collections.deque([], 2)
         self._warned_old_signature = False
         self.async_update_token()
@@ -554,6 +568,25 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the camera model."""
         return self._attr_model
 
+    @cached_property
+    def frame_cache_max_age(self) -> float:
+        """Return the seconds a snapshot is served to the viewers from the cache.
+
+        By default only the concurrent viewers share a snapshot.
+        """
+        return self._attr_frame_cache_max_age
+
+    @final
+    @callback
+    def async_frame_cache_max_age(self) -> float:
+        """Return the frame cache max age of the preferences or the camera."""
+        # Preview cameras are not added and can exist before the camera setup
+        if (prefs := self.hass.data.get(DATA_CAMERA_PREFS)) is None or (
+            max_age := prefs.get_frame_cache_max_age(self.entity_id)
+        ) is None:
+            return self.frame_cache_max_age
+        return max_age
+
     @cached_property
     def frame_interval(self) -> float:
         """Return the interval between frames of the mjpeg stream."""
@@ -720,10 +753,22 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The viewers of the camera share the frames fetched within
+        half of their interval.
+        """
+        max_age = max(self.async_frame_cache_max_age(), interval / 2)
+
+        async def _async_image() -> bytes | None:
+            """Return the image of the next frame."""
+            image = await self.frame_cache.async_get_image(None, None, max_age)
+            return image.content if image else None
+
+        with self.frame_cache.async_still_stream():
+            return await async_get_still_stream(
+                request, _async_image, self.content_type, interval
+            )
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -1096,6 +1141,9 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.Coerce(Orientation),
+        vol.Optional(PREF_FRAME_CACHE_MAX_AGE): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0, max=60))
+        ),
     }
 )
 @websocket_api.async_response
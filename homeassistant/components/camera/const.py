@@ -20,6 +20,7 @@ DATA_CAMERA_PREFS: HassKey[CameraPreferences] = HassKey("camera_prefs")
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_FRAME_CACHE_MAX_AGE: Final = "frame_cache_max_age"
 
 SERVICE_RECORD: Final = "record"
 
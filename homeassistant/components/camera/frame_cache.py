@@ -0,0 +1,165 @@
+"""Share the frames of a camera between its viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING
+
+import attr
+
+from homeassistant.util.async_ import create_eager_task
+
+from .const import CAMERA_IMAGE_TIMEOUT
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Sizes of the frames of a camera kept in the cache
+MAX_FRAME_SIZES = 8
+
+type FrameSize = tuple[int | None, int | None]
+
+_FULL_SIZE: FrameSize = (None, None)
+
+
+@dataclass(slots=True)
+class _Frame:
+    """A frame of a camera and the time it was fetched."""
+
+    image: Image
+    fetched: float
+
+
+@dataclass(slots=True)
+class _Fetch:
+    """A fetch of a frame shared by its callers."""
+
+    task: asyncio.Task[Image | None]
+    timeout: asyncio.Timeout
+    # If a caller serves the frame from the cache later
+    keep: bool
+
+
+def _is_jpeg(content_type: str) -> bool:
+    """Return if the content type is a jpeg."""
+    return "jpeg" in content_type or "jpg" in content_type
+
+
+class CameraFrameCache:
+    """Cache the latest frames of a camera and coalesce the fetches.
+
+    A frame is kept per requested size. A request is served from the
+    cache when the frame is not older than the max age of the request,
+    and concurrent requests for the same size share a single fetch,
+    which times out once the caller waiting the longest gives up.
+    A thumbnail is scaled from a fresh full size jpeg frame when there
+    is one, so the camera is only asked for a new frame once.
+
+    The frames are only kept for the requests with a max age, and are
+    dropped once the last still stream of the camera ends.
+    """
+
+    def __init__(
+        self, fetch: Callable[[int | None, int | None], Awaitable[Image | None]]
+    ) -> None:
+        """Initialize the frame cache."""
+        self._fetch = fetch
+        self._frames: dict[FrameSize, _Frame] = {}
+        self._fetches: dict[FrameSize, _Fetch] = {}
+        self._streams = 0
+
+    def _fresh_frame(self, size: FrameSize, max_age: float) -> _Frame | None:
+        """Return the frame of a size if it is not too old."""
+        if (frame := self._frames.get(size)) is None or (
+            time.monotonic() - frame.fetched > max_age
+        ):
+            return None
+        return frame
+
+    def _store(self, size: FrameSize, frame: _Frame) -> None:
+        """Store the frame of a size, evicting the least recent size."""
+        self._frames.pop(size, None)
+        self._frames[size] = frame
+        if len(self._frames) > MAX_FRAME_SIZES:
+            del self._frames[next(iter(self._frames))]
+
+    @contextmanager
+    def async_still_stream(self) -> Generator[None]:
+        """Keep the frames until the last still stream ends."""
+        self._streams += 1
+        try:
+            yield
+        finally:
+            self._streams -= 1
+            if not self._streams:
+                self._frames.clear()
+
+    async def async_get_image(
+        self,
+        width: int | None,
+        height: int | None,
+        max_age: float,
+        timeout: float = CAMERA_IMAGE_TIMEOUT,
+    ) -> Image | None:
+        """Return a frame not older than max_age seconds."""
+        size = (width, height)
+        if max_age > 0:
+            if (frame := self._fresh_frame(size, max_age)) is not None:
+                return frame.image
+            if (
+                width is not None
+                and height is not None
+                and (full := self._fresh_frame(_FULL_SIZE, max_age)) is not None
+                and _is_jpeg(full.image.content_type)
+            ):
+                image = attr.evolve(
+                    full.image,
+                    content=scale_jpeg_camera_image(full.image, width, height),
+                )
+                self._store(size, _Frame(image, full.fetched))
+                return image
+
+        loop = asyncio.get_running_loop()
+        if (fetch := self._fetches.get(size)) is None:
+            fetch_timeout = asyncio.Timeout(loop.time() + timeout)
+            task = create_eager_task(
+                self._async_fetch(size, fetch_timeout, max_age > 0)
+            )
+            if not task.done():
+                self._fetches[size] = _Fetch(task, fetch_timeout, max_age > 0)
+        else:
+            task = fetch.task
+            fetch.keep = fetch.keep or max_age > 0
+            # The caller waiting the longest governs the shared fetch
+            deadline = loop.time() + timeout
+            if (when := fetch.timeout.when()) is not None and when < deadline:
+                fetch.timeout.reschedule(deadline)
+        # The fetch is shared, a caller giving up must not cancel it
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, size: FrameSize, fetch_timeout: asyncio.Timeout, keep: bool
+    ) -> Image | None:
+        """Fetch a frame and store it if it is served from the cache."""
+        try:
+            async with fetch_timeout:
+                image = await self._fetch(*size)
+        finally:
+            if (fetch := self._fetches.pop(size, None)) is not None:
+                keep = fetch.keep
+        if image is None:
+            return None
+        if keep:
+            self._store(size, _Frame(image, time.monotonic()))
+        elif not self._streams:
+            # Without a still stream no caller is served from the cache
+            self._frames.clear()
+        else:
+            # The frame of the size is older than the one just fetched
+            self._frames.pop(size, None)
+        return image
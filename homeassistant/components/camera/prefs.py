@@ -7,13 +7,18 @@ from dataclasses import asdict, dataclass
 from typing import Final, cast
 
 from homeassistant.components.stream import Orientation
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import (
+    DOMAIN,
+    PREF_FRAME_CACHE_MAX_AGE,
+    PREF_ORIENTATION,
+    PREF_PRELOAD_STREAM,
+)
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -25,19 +30,21 @@ class DynamicStreamSettings:
 
     preload_stream: bool = False
     orientation: Orientation = Orientation.NO_TRANSFORM
+    # Seconds a snapshot is served from the cache, None for the camera default
+    frame_cache_max_age: float | None = None
 
 
 class CameraPreferences:
     """Handle camera preferences."""
 
-    _preload_prefs: dict[str, dict[str, bool | Orientation]]
+    _preload_prefs: dict[str, dict[str, bool | float | None]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize camera prefs."""
         self._hass = hass
         # The orientation prefs are stored in in the entity registry options
-        # The preload_stream prefs are stored in this Store
-        self._store = Store[dict[str, dict[str, bool | Orientation]]](
+        # The preload_stream and frame_cache_max_age prefs are stored in this Store
+        self._store = Store[dict[str, dict[str, bool | float | None]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
         self._dynamic_stream_settings_by_entity_id: dict[
@@ -54,11 +61,12 @@ class CameraPreferences:
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: Orientation | UndefinedType = UNDEFINED,
-    ) -> dict[str, bool | Orientation]:
+        frame_cache_max_age: float | None | UndefinedType = UNDEFINED,
+    ) -> dict[str, bool | Orientation | float | None]:
         """Update camera preferences.
 
         Also update the DynamicStreamSettings if they exist.
-        preload_stream is stored in a Store
+        preload_stream and frame_cache_max_age are stored in a Store
         orientation is stored in the Entity Registry
 
         Returns a dict with the preferences on success.
@@ -70,7 +78,17 @@ class CameraPreferences:
         if preload_stream is not UNDEFINED:
             if dynamic_stream_settings:
                 dynamic_stream_settings.preload_stream = preload_stream
-            self._preload_prefs[entity_id] = {PREF_PRELOAD_STREAM: preload_stream}
+            self._preload_prefs.setdefault(entity_id, {})[PREF_PRELOAD_STREAM] = (
+                preload_stream
+            )
+            await self._store.async_save(self._preload_prefs)
+
+        if frame_cache_max_age is not UNDEFINED:
+            if dynamic_stream_settings:
+                dynamic_stream_settings.frame_cache_max_age = frame_cache_max_age
+            self._preload_prefs.setdefault(entity_id, {})[PREF_FRAME_CACHE_MAX_AGE] = (
+                frame_cache_max_age
+            )
             await self._store.async_save(self._preload_prefs)
 
         if orientation is not UNDEFINED:
@@ -103,6 +121,15 @@ class CameraPreferences:
                 self._preload_prefs.get(entity_id, {}).get(PREF_PRELOAD_STREAM, False),
             ),
             orientation=er_prefs.get(PREF_ORIENTATION, Orientation.NO_TRANSFORM),
+            frame_cache_max_age=self.get_frame_cache_max_age(entity_id),
         )
         self._dynamic_stream_settings_by_entity_id[entity_id] = settings
         return settings
+
+    @callback
+    def get_frame_cache_max_age(self, entity_id: str) -> float | None:
+        """Get the frame cache max age of the entity, None if not set."""
+        return cast(
+            float | None,
+            self._preload_prefs.get(entity_id, {}).get(PREF_FRAME_CACHE_MAX_AGE),
+        )
@@ -1,7 +1,24 @@
 """History integration constants."""
 
+from typing import Final, Literal
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of states sent in one columnar history message
+COLUMNAR_CHUNK_SIZE = 5000
+MAX_COLUMNAR_CHUNK_SIZE = 50000
+
+# Graph resolutions and the smallest time span, in seconds, a pixel
+# must cover for rollups of that period to be used instead of raw states
+RESOLUTION_RAW: Final = "raw"
+RESOLUTION_5MINUTE: Final = "5minute"
+RESOLUTION_HOUR: Final = "hour"
+type GraphResolution = Literal["raw", "5minute", "hour"]
+RESOLUTION_MIN_SECONDS_PER_PIXEL: dict[GraphResolution, int] = {
+    RESOLUTION_HOUR: 3600,
+    RESOLUTION_5MINUTE: 300,
+}
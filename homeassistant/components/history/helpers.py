@@ -8,6 +8,8 @@ from datetime import datetime as dt
 from homeassistant.components.recorder import get_instance
 from homeassistant.core import HomeAssistant
 
+from .const import RESOLUTION_MIN_SECONDS_PER_PIXEL, RESOLUTION_RAW, GraphResolution
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -32,3 +34,12 @@ def has_states_before(hass: HomeAssistant, run_time: dt) -> bool:
     """
     oldest_ts = get_instance(hass).states_manager.oldest_ts
     return oldest_ts is not None and run_time.timestamp() >= oldest_ts
+
+
+def resolution_for_period(start_time: dt, end_time: dt, width: int) -> GraphResolution:
+    """Return the coarsest resolution that still gives each pixel a data point."""
+    seconds_per_pixel = (end_time - start_time).total_seconds() / width
+    for resolution, min_seconds in RESOLUTION_MIN_SECONDS_PER_PIXEL.items():
+        if seconds_per_pixel >= min_seconds:
+            return resolution
+    return RESOLUTION_RAW
@@ -12,7 +12,7 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import get_instance, history, statistics
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -38,8 +38,19 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_states_before
+from .const import (
+    COLUMNAR_CHUNK_SIZE,
+    EVENT_COALESCE_TIME,
+    MAX_COLUMNAR_CHUNK_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+    RESOLUTION_RAW,
+    GraphResolution,
+)
+from .helpers import (
+    entities_may_have_state_changes_after,
+    has_states_before,
+    resolution_for_period,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,6 +70,8 @@ class HistoryLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_columnar_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_graph_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -176,6 +189,304 @@ async def ws_get_history_during_period(
     )
 
 
+def _ws_get_graph_history(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    resolution: GraphResolution,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch graph history and convert it to json in the executor.
+
+    Entities with mean statistics are read from the rollups of the
+    resolution, all other entities fall back to their significant states.
+    A period is only compiled once it has ended, so the states after the
+    last rollup of an entity are added to fill the tail of the graph.
+    """
+    rollups: dict[str, list[statistics.StatisticsRow]] = {}
+    if resolution != RESOLUTION_RAW and (
+        statistic_ids := {
+            statistic_id
+            for statistic_id, (_, metadata) in statistics.get_metadata(
+                hass, statistic_ids=set(entity_ids)
+            ).items()
+            if metadata["has_mean"]
+        }
+    ):
+        rollups = statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            statistic_ids,
+            resolution,
+            None,
+            {"mean", "min", "max"},
+        )
+    # The states are read from the start for the entities without rollups
+    # and from the state at the end of the last rollup for the others
+    states_queries: list[tuple[dt, list[str], bool]] = []
+    if raw_entity_ids := [
+        entity_id for entity_id in entity_ids if entity_id not in rollups
+    ]:
+        states_queries.append((start_time, raw_entity_ids, include_start_time_state))
+    end_time_ts = end_time.timestamp()
+    tail_entity_ids: dict[float, list[str]] = {}
+    for entity_id, rows in rollups.items():
+        if (tail_start_ts := rows[-1]["end"]) < end_time_ts:
+            tail_entity_ids.setdefault(tail_start_ts, []).append(entity_id)
+    states_queries.extend(
+        (dt_util.utc_from_timestamp(tail_start_ts), tail_ids, True)
+        for tail_start_ts, tail_ids in tail_entity_ids.items()
+    )
+    states: dict[str, list[State | dict[str, Any]]] = {}
+    for query_start_time, query_entity_ids, query_start_time_state in states_queries:
+        states.update(
+            history.get_significant_states(
+                hass,
+                query_start_time,
+                end_time,
+                query_entity_ids,
+                None,
+                query_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            )
+        )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {"resolution": resolution, "states": states, "statistics": rollups},
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/graph_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Required("width"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_graph_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle graph history during period websocket command.
+
+    The resolution is picked from the requested period and the width of
+    the graph in pixels so long periods are served from the 5-minute or
+    hourly statistics instead of every recorded state.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    utc_now = dt_util.utcnow()
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = utc_now
+
+    if start_time > utc_now or end_time <= start_time:
+        connection.send_result(
+            msg["id"], {"resolution": RESOLUTION_RAW, "states": {}, "statistics": {}}
+        )
+        return
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg["id"], "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    connection.send_message(
+        await get_instance(hass).async_add_executor_job(
+            _ws_get_graph_history,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            resolution_for_period(start_time, end_time, msg["width"]),
+            msg["include_start_time_state"],
+            msg["significant_changes_only"],
+            msg["minimal_response"],
+            msg["no_attributes"],
+        )
+    )
+
+
+def _generate_columnar_history_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time_ts: float,
+    after_state_id: int | None,
+    end_time_ts: float,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    chunk_size: int,
+) -> tuple[bytes | None, float | None, int | None]:
+    """Fetch a chunk of columnar history and convert it to json in the executor."""
+    timestamps, values, last_state_id = history.get_significant_states_columnar(
+        hass,
+        start_time_ts,
+        end_time_ts,
+        entity_id,
+        include_start_time_state,
+        significant_changes_only,
+        chunk_size,
+        after_state_id,
+    )
+    if not timestamps:
+        return None, None, None
+    return (
+        json_bytes(
+            messages.event_message(
+                msg_id,
+                {
+                    "entity_id": entity_id,
+                    COMPRESSED_STATE_LAST_UPDATED: timestamps,
+                    COMPRESSED_STATE_STATE: values,
+                },
+            )
+        ),
+        timestamps[-1],
+        last_state_id,
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/columnar_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("chunk_size", default=COLUMNAR_CHUNK_SIZE): vol.All(
+            int, vol.Range(min=1, max=MAX_COLUMNAR_CHUNK_SIZE)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_columnar_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle columnar history during period websocket command.
+
+    The states of each entity are streamed in chunks of at most chunk_size
+    states, with the timestamps and the state values as parallel lists, so
+    memory use does not grow with the length of the requested period.
+    A final message with the time period is sent when all chunks are sent.
+    """
+    msg_id: int = msg["id"]
+    utc_now = dt_util.utcnow()
+
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = utc_now
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg_id, "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    instance = get_instance(hass)
+    if not instance.states_meta_manager.active:
+        connection.send_error(
+            msg_id,
+            "not_supported",
+            "Columnar history is not available during the database migration",
+        )
+        return
+
+    include_start_time_state = msg["include_start_time_state"]
+    significant_changes_only = msg["significant_changes_only"]
+    chunk_size = msg["chunk_size"]
+
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    if start_time <= utc_now and has_states_before(hass, end_time):
+        for entity_id in entity_ids:
+            chunk_start_time_ts = start_time_ts
+            include_chunk_start_time_state = include_start_time_state
+            # The chunks are paged on the timestamp and the state_id of
+            # their last row, as several rows can share a timestamp
+            after_state_id: int | None = None
+            has_more = True
+            while has_more:
+                (
+                    payload,
+                    last_time_ts,
+                    after_state_id,
+                ) = await instance.async_add_executor_job(
+                    _generate_columnar_history_chunk,
+                    hass,
+                    msg_id,
+                    chunk_start_time_ts,
+                    after_state_id,
+                    end_time_ts,
+                    entity_id,
+                    include_chunk_start_time_state,
+                    significant_changes_only,
+                    chunk_size,
+                )
+                if msg_id not in connection.subscriptions:
+                    # Unsubscribe happened while fetching the chunk
+                    return
+                if payload:
+                    connection.send_message(payload)
+                if last_time_ts is not None:
+                    chunk_start_time_ts = last_time_ts
+                include_chunk_start_time_state = False
+                has_more = after_state_id is not None
+
+    connection.send_message(
+        json_bytes(
+            messages.event_message(
+                msg_id,
+                {"start_time": start_time_ts, "end_time": end_time_ts},
+            )
+        )
+    )
+    connection.subscriptions.pop(msg_id, None)
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -38,10 +38,12 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    Platform,
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import (
     config_validation as cv,
+    discovery,
     event as event_helper,
     state as state_helper,
 )
@@ -50,6 +52,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -74,6 +77,7 @@ from .const import (
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_SIZE,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
@@ -81,15 +85,12 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_SIZE,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
@@ -99,12 +100,17 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_REPLAY_SIZE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -168,6 +174,7 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_SPOOL_SIZE, default=DEFAULT_SPOOL_SIZE): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -204,10 +211,42 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+def _escape_key(key: str) -> str:
+    """Escape a measurement, tag key, tag value or field key for line protocol."""
+    return (
+        key.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_tag_value(value: Any) -> str:
+    """Escape a tag value for line protocol, empty for no value."""
+    if value is None:
+        return ""
+    escaped = _escape_key(str(value))
+    if escaped.endswith("\\"):
+        escaped += " "
+    return escaped
+
+
+def _encode_field_value(value: float | str) -> str:
+    """Encode a field value for line protocol."""
+    if type(value) is str:
+        return (
+            '"'
+            + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            + '"'
+        )
+    return repr(value)
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:  # noqa: C901
+    """Build event to line protocol converter and add to config."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
+    tags: dict[str, str] = conf[CONF_TAGS]
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr: str = conf[CONF_MEASUREMENT_ATTR]
@@ -218,15 +257,59 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    # Multiplier to the event time in microseconds and divisor
+    # for the timestamp in the configured precision
+    precision: str | None = conf.get(CONF_PRECISION)
+    time_multiplier, time_divisor = {
+        "s": (1, 1_000_000),
+        "ms": (1, 1_000),
+        "us": (1, 1),
+    }.get(precision or "ns", (1_000, 1))
+    # The measurement and tags of each entity as the start of its points,
+    # keyed by the measurement and the tag attributes they were built from
+    entity_keys: dict[str, tuple[tuple[Any, ...], str]] = {}
+
+    def _entity_key(state: State, measurement: Any) -> str:
+        """Return the measurement and tags of the points of an entity."""
+        tag_values = (measurement, *map(state.attributes.get, tags_attributes))
+        if (cached := entity_keys.get(state.entity_id)) is not None and cached[
+            0
+        ] == tag_values:
+            return cached[1]
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
+        }
+        for key in tags_attributes:
+            if key in state.attributes:
+                point_tags[key] = state.attributes[key]
+        point_tags.update(tags)
+        key = ",".join(
+            (
+                _escape_key(str(measurement)),
+                *(
+                    f"{_escape_key(tag_key)}={tag_value}"
+                    for tag_key, value in sorted(point_tags.items())
+                    if (tag_value := _escape_tag_value(value))
+                ),
+            )
+        )
+        entity_keys[state.entity_id] = (tag_values, key)
+        return key
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a point in line protocol."""
         state: State | None = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE, None)
-            or not entity_filter(state.entity_id)
-        ):
+        if state is None:
+            # The entity was removed
+            entity_keys.pop(event.data[CONF_ENTITY_ID], None)
+            return None
+        if state.state in (
+            STATE_UNKNOWN,
+            "",
+            STATE_UNAVAILABLE,
+            None,
+        ) or not entity_filter(state.entity_id):
             return None
 
         try:
@@ -269,59 +352,56 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
-        }
+        fields: dict[str, float | str] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
-            elif (
+                continue
+            if (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
-
-        json[INFLUX_CONF_TAGS].update(tags)
+                    if not math.isfinite(fields[key]):  # type: ignore[arg-type]
+                        del fields[key]
 
-        return json
+        timestamp = (
+            round(event.time_fired_timestamp * 1_000_000)
+            * time_multiplier
+            // time_divisor
+        )
+        encoded_fields = ",".join(
+            f"{_escape_key(key)}={_encode_field_value(value)}"
+            for key, value in sorted(fields.items())
+        )
+        return f"{_entity_key(state, measurement)} {encoded_fields} {timestamp}"
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -329,7 +409,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -357,9 +437,9 @@ def get_influx_connection(  # noqa: C901
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
+        def write_v2(lines):
             """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -370,7 +450,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -434,10 +514,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(lines):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -446,7 +526,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -494,9 +574,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = InfluxSpool(
+        hass.config.path(STORAGE_DIR, SPOOL_FILE), conf[CONF_SPOOL_SIZE] * 1024**2
+    )
+    spool.load()
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_line, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -507,22 +593,26 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
 
+    discovery.load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+
     return True
 
 
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries, spool):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
+        self.spool: InfluxSpool = spool
         self.write_errors = 0
+        self.dropped = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -537,17 +627,17 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded in line protocol."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -559,29 +649,36 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
                     item.set()
 
         if dropped:
+            self.dropped += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
+
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry.
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        The oldest spooled events are written along with the events,
+        and the events are spooled when the write keeps failing.
+        """
+        spooled = self.spool.peek(SPOOL_REPLAY_SIZE)
+        batch = [*spooled, *lines] if spooled else lines
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(batch)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(batch))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -589,17 +686,31 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                    continue
+                if not self.write_errors and not spooled:
+                    _LOGGER.error(err)
+                if dropped := self.spool.append(lines):
+                    self.dropped += dropped
+                    self.write_errors += dropped
+                    _LOGGER.debug(SPOOL_FULL_MESSAGE, dropped)
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    _LOGGER.debug(SPOOLED_MESSAGE, len(lines))
+                return
+        if spooled:
+            self.spool.consume(len(spooled))
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events waiting to be written."""
+        return self.queue.qsize()
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            _, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
+        self.spool.compact()
 
     def block_till_done(self):
         """Block till all events processed.
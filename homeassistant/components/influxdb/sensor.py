@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
     SensorEntity,
+    SensorStateClass,
 )
 from homeassistant.const import (
     CONF_API_VERSION,
@@ -20,6 +21,7 @@ from homeassistant.const import (
     CONF_UNIT_OF_MEASUREMENT,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import PlatformNotReady, TemplateError
@@ -50,6 +52,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -70,6 +73,13 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL: Final = datetime.timedelta(seconds=60)
 
+# Key, name and state class of the sensors of the writer
+WRITER_SENSORS: Final = (
+    ("queue_depth", "InfluxDB queue depth", SensorStateClass.MEASUREMENT),
+    ("dropped", "InfluxDB dropped events", SensorStateClass.TOTAL_INCREASING),
+    ("spooled", "InfluxDB spooled events", SensorStateClass.MEASUREMENT),
+)
+
 
 def _merge_connection_config_into_query(conf, query):
     """Merge connection details into each configured query."""
@@ -162,6 +172,15 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        add_entities(
+            [
+                InfluxWriterSensor(key, name, state_class)
+                for key, name, state_class in WRITER_SENSORS
+            ]
+        )
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -351,3 +370,28 @@ class InfluxQLSensorData:
             if len(points) > 1:
                 _LOGGER.warning(QUERY_MULTIPLE_RESULTS_MESSAGE, self.query)
             self.value = points[0].get(INFLUX_CONF_VALUE)
+
+
+class InfluxWriterSensor(SensorEntity):
+    """Implementation of a sensor of the InfluxDB writer."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = "events"
+
+    def __init__(self, key, name, state_class):
+        """Initialize the sensor."""
+        self._key = key
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._attr_state_class = state_class
+
+    def update(self) -> None:
+        """Get the latest counters of the writer."""
+        if (writer := self.hass.data.get(DOMAIN)) is None:
+            return
+        if self._key == "queue_depth":
+            self._attr_native_value = writer.queue_depth
+        elif self._key == "dropped":
+            self._attr_native_value = writer.dropped
+        else:
+            self._attr_native_value = writer.spool.points
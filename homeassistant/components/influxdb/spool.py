@@ -0,0 +1,126 @@
+"""Spool the points which could not be written to InfluxDB to disk."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from itertools import islice
+import logging
+import os
+
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InfluxSpool:
+    """A bounded file of line protocol points waiting to be written.
+
+    The points are appended when a write fails and are written again
+    from the oldest once InfluxDB is reachable. Points which do not fit
+    in the spool are dropped.
+
+    The written points are skipped with a read offset, and the file is
+    only rewritten without them once they take up half of it or the
+    spool is closed.
+
+    The spool is only used from the InfluxDB thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.points = 0
+        self._offset = 0
+
+    def load(self) -> None:
+        """Load the points spooled before the last shutdown."""
+        try:
+            with open(self.path, encoding="utf-8") as spool:
+                self.points = sum(1 for _ in spool)
+            self.size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.error("Unable to load the InfluxDB spool: %s", err)
+            return
+        if self.points:
+            _LOGGER.info("Loaded %d spooled events", self.points)
+
+    def append(self, lines: list[str]) -> int:
+        """Append points to the spool and return the number dropped."""
+        data = "".join(f"{line}\n" for line in lines)
+        size = len(data.encode())
+        if self._offset + self.size + size > self.max_bytes:
+            # The written points take up the file until it is compacted
+            self.compact()
+            if self.size + size > self.max_bytes:
+                return len(lines)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as spool:
+                spool.write(data)
+        except OSError as err:
+            _LOGGER.error("Unable to spool InfluxDB events: %s", err)
+            return len(lines)
+        self.size += size
+        self.points += len(lines)
+        return 0
+
+    def peek(self, count: int) -> list[str]:
+        """Return the oldest spooled points."""
+        if not self.points:
+            return []
+        try:
+            with open(self.path, "rb") as spool:
+                spool.seek(self._offset)
+                return [line.decode().rstrip("\n") for line in islice(spool, count)]
+        except (OSError, UnicodeDecodeError) as err:
+            _LOGGER.error("Unable to read the InfluxDB spool: %s", err)
+            self.clear()
+            return []
+
+    def consume(self, count: int) -> None:
+        """Skip the oldest spooled points once they are written."""
+        if count >= self.points:
+            self.clear()
+            return
+        try:
+            with open(self.path, "rb") as spool:
+                spool.seek(self._offset)
+                for _ in range(count):
+                    spool.readline()
+                offset = spool.tell()
+        except OSError as err:
+            _LOGGER.error("Unable to read the InfluxDB spool: %s", err)
+            self.clear()
+            return
+        self.size -= offset - self._offset
+        self.points -= count
+        self._offset = offset
+        if self._offset >= self.size:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the spool without the points already written."""
+        if not self._offset:
+            return
+        try:
+            with open(self.path, "rb") as spool:
+                spool.seek(self._offset)
+                remaining = spool.read().decode()
+            write_utf8_file(self.path, remaining, private=True)
+        except (OSError, UnicodeDecodeError, WriteError) as err:
+            _LOGGER.error("Unable to update the InfluxDB spool: %s", err)
+            self.clear()
+            return
+        self._offset = 0
+
+    def clear(self) -> None:
+        """Remove all spooled points."""
+        self.size = 0
+        self.points = 0
+        self._offset = 0
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -20,6 +21,9 @@ from homeassistant.components.recorder.models import (
     extract_metadata_ids,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.table_managers.context_origins import (
+    ContextOrigin,
+)
 from homeassistant.components.recorder.util import (
     execute_stmt_lambda_element,
     session_scope,
@@ -37,6 +41,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.event_type import EventType
 
 from .const import (
@@ -81,6 +86,10 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context_origins import (
+    context_origin_events_stmt,
+    context_origin_states_stmt,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -170,6 +179,16 @@ class EventProcessor:
                     instance.event_type_manager.get_many(self.event_types, session)
                 )
             )
+            # When only entities are requested and the recorder knows the
+            # origins of all contexts in the window, the rows that share a
+            # context with the rows of the entities are not joined in the
+            # query, and the origins are fetched by row id instead.
+            context_origins_manager = instance.context_origins_manager
+            use_context_origins = bool(
+                self.entity_ids
+                and not self.device_ids
+                and context_origins_manager.covers(start_day.timestamp())
+            )
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -179,10 +198,35 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                include_context_rows=not use_context_origins,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if use_context_origins:
+                self._load_context_origins(
+                    session,
+                    context_origins_manager.get_many(
+                        {row[CONTEXT_ID_BIN_POS] for row in rows}
+                    ),
+                    instance.max_bind_vars,
+                )
+            return self.humanify(rows)
+
+    def _load_context_origins(
+        self, session: Session, origins: list[ContextOrigin], max_bind_vars: int
+    ) -> None:
+        """Load the rows that started the contexts into the context lookup."""
+        event_ids = [row_id for is_state, row_id, _ in origins if not is_state]
+        state_ids = [row_id for is_state, row_id, _ in origins if is_state]
+        context_lookup = self.logbook_run.context_lookup
+        for ids, stmt_for_ids in (
+            (event_ids, context_origin_events_stmt),
+            (state_ids, context_origin_states_stmt),
+        ):
+            for ids_chunk in chunked_or_all(ids, max_bind_vars):
+                for row in execute_stmt_lambda_element(
+                    session, stmt_for_ids(ids_chunk), orm_rows=False
+                ):
+                    context_lookup[row[CONTEXT_ID_BIN_POS]] = row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
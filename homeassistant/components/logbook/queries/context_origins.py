@@ -0,0 +1,39 @@
+"""Context origin queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import select_events_context_only, select_states_context_only
+
+
+def context_origin_events_stmt(event_ids: Collection[int]) -> StatementLambdaElement:
+    """Generate a query to fetch the events that started contexts."""
+    return lambda_stmt(
+        lambda: select_events_context_only()
+        .select_from(Events)
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        .where(Events.event_id.in_(event_ids))
+    )
+
+
+def context_origin_states_stmt(state_ids: Collection[int]) -> StatementLambdaElement:
+    """Generate a query to fetch the states that started contexts."""
+    return lambda_stmt(
+        lambda: select_states_context_only()
+        .select_from(States)
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        .where(States.state_id.in_(state_ids))
+    )
@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine
 from functools import lru_cache
+from itertools import chain
 import logging
+from operator import itemgetter
 import os
 from pathlib import Path
 import tempfile
@@ -145,6 +147,108 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A node in a topic trie, one per topic filter level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # Values are mapped to their insertion sequence number so
+        # matches can be returned in the order they were added.
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T]:
+    """Match topics against a set of MQTT topic filters.
+
+    Each level of a topic filter is stored as a node in the trie, so the
+    cost of matching a topic grows with the depth of the topic instead
+    of with the number of filters.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = 0
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if value not in node.values:
+            self._sequence += 1
+            node.values[value] = self._sequence
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        # Prune the nodes that no longer lead to any value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        levels = topic.split("/")
+        # Topics starting with $ are not matched by
+        # wildcards on the first level [MQTT-4.7.2-1]
+        wildcard_first_level = not topic.startswith("$")
+        matches: list[dict[_T, int]] = []
+        nodes = [self._root]
+        for idx, level in enumerate(levels):
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            wildcard = wildcard_first_level or idx > 0
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcard:
+                    continue
+                if (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+                if (child := children.get("#")) is not None and child.values:
+                    matches.append(child.values)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                if node.values:
+                    matches.append(node.values)
+                # A multi-level wildcard also matches its parent level
+                if (child := node.children.get("#")) is not None and child.values:
+                    matches.append(child.values)
+
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(matches[0])
+        return [
+            value
+            for value, _ in sorted(
+                chain.from_iterable(values.items() for values in matches),
+                key=itemgetter(1),
+            )
+        ]
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
@@ -17,16 +17,24 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, listener_profile
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.loop_monitor import LoopMonitor
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+
+PLATFORMS = [Platform.SENSOR]
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +48,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_EVENT_LISTENER_PROFILE = "start_event_listener_profile"
+SERVICE_STOP_EVENT_LISTENER_PROFILE = "stop_event_listener_profile"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +73,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_EVENT_LISTENER_PROFILE,
+    SERVICE_STOP_EVENT_LISTENER_PROFILE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -260,6 +272,42 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    @callback
+    def _async_start_event_listener_profile(call: ServiceCall) -> None:
+        profile = listener_profile.async_get(hass)
+        if profile.running:
+            raise HomeAssistantError("Event listener profiling already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Event listener profiling has started. Stop it to log the time"
+                " each event listener took to run."
+            ),
+            title="Event listener profiling started",
+            notification_id="profile_event_listeners",
+        )
+        profile.async_start()
+
+    @callback
+    def _async_stop_event_listener_profile(call: ServiceCall) -> None:
+        profile = listener_profile.async_get(hass)
+        if not profile.running:
+            raise HomeAssistantError("Event listener profiling not running")
+
+        profile.async_stop()
+        persistent_notification.async_dismiss(hass, "profile_event_listeners")
+        for stats in profile.async_listener_stats():
+            _LOGGER.critical(
+                "Event listener %s for %s of %s: %s calls, %.6fs total, %.6fs p99",
+                stats["listener"],
+                stats["event_type"],
+                stats["integration"],
+                stats["count"],
+                stats["total"],
+                stats["p99"],
+            )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,19 +430,80 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_EVENT_LISTENER_PROFILE,
+        _async_start_event_listener_profile,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_EVENT_LISTENER_PROFILE,
+        _async_stop_event_listener_profile,
+    )
+
+    websocket_api.async_register_command(hass, websocket_event_listener_profile)
+    websocket_api.async_register_command(hass, websocket_loop_health)
+
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass.loop)
+    monitor.start()
+
+    async def _async_stop_monitor(event: Event) -> None:
+        await hass.async_add_executor_job(monitor.stop)
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_monitor)
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    await hass.async_add_executor_job(hass.data[DOMAIN][LOOP_MONITOR].stop)
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    listener_profile.async_get(hass).async_stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/event_listeners"})
+@callback
+def websocket_event_listener_profile(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the time each event listener took to run while profiling."""
+    profile = listener_profile.async_get(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": profile.running,
+            "listeners": profile.async_listener_stats(),
+            "integrations": profile.async_integration_stats(),
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_health"})
+@callback
+def websocket_loop_health(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the scheduling lag histogram and the recent slow callbacks."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    connection.send_result(msg["id"], monitor.health())
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
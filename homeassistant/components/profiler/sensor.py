@@ -0,0 +1,106 @@
+"""Sensors for the scheduling lag of the event loop."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.loop_monitor import LoopMonitor
+
+from .const import DEFAULT_NAME, DOMAIN, LOOP_MONITOR
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of the event loop."""
+
+    value_fn: Callable[[LoopMonitor], float | int]
+
+
+SENSORS: tuple[LoopSensorEntityDescription, ...] = (
+    LoopSensorEntityDescription(
+        key="loop_lag_p50",
+        translation_key="loop_lag_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.recent_lag(0.5) * 1000,
+    ),
+    LoopSensorEntityDescription(
+        key="loop_lag_p99",
+        translation_key="loop_lag_p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.recent_lag(0.99) * 1000,
+    ),
+    LoopSensorEntityDescription(
+        key="loop_lag_max",
+        translation_key="loop_lag_max",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.lag_max * 1000,
+    ),
+    LoopSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda monitor: monitor.slow_callback_count,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event loop sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        LoopSensor(entry.entry_id, monitor, description) for description in SENSORS
+    )
+
+
+class LoopSensor(SensorEntity):
+    """A sensor of the scheduling lag of the event loop."""
+
+    entity_description: LoopSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry_id: str,
+        monitor: LoopMonitor,
+        description: LoopSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            name=DEFAULT_NAME,
+        )
+        self._monitor = monitor
+
+    @property
+    def native_value(self) -> float | int:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._monitor)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import astuple, dataclass
 import logging
 import string
+import time
 from typing import Any, cast
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.metrics_core import Metric
+from prometheus_client.registry import Collector
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -62,7 +67,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import (
     config_validation as cv,
     entityfilter,
@@ -92,6 +103,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -99,6 +111,9 @@ ALLOWED_METRIC_CHARS = set(string.ascii_letters + string.digits + "_:")
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+# Seconds the metrics collected on scrape are served to the following scrapes
+EXPOSITION_CACHE_TTL = 5
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -108,6 +123,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_REQUIRES_AUTH, default=True): cv.boolean,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -126,8 +142,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -140,6 +154,27 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
+    if conf[CONF_COLLECT_ON_SCRAPE]:
+        collector = PrometheusCollector(
+            hass,
+            entity_filter,
+            namespace,
+            climate_units,
+            component_config,
+            override_metric,
+            default_metric,
+        )
+        prometheus_client.REGISTRY.register(collector)
+        hass.bus.listen(EVENT_STATE_CHANGED, collector.async_count_state_change)
+        hass.bus.listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            collector.handle_entity_registry_updated,
+        )
+        hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], collector))
+        return True
+
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH]))
+
     metrics = PrometheusMetrics(
         entity_filter,
         namespace,
@@ -854,24 +889,282 @@ class PrometheusMetrics:
                 ).set(float(alarm_state.value == current_state))
 
 
+@dataclass(slots=True)
+class _StateChanges:
+    """Count of the state changes of an entity."""
+
+    count: int
+    created: float
+
+
+class _ScrapedSample:
+    """A sample of a metric family collected on scrape."""
+
+    __slots__ = ("family", "label_values")
+
+    def __init__(
+        self,
+        family: CounterMetricFamily | GaugeMetricFamily,
+        label_values: tuple[str, ...],
+    ) -> None:
+        """Initialize the sample."""
+        self.family = family
+        self.label_values = label_values
+
+    def set(self, value: float) -> None:
+        """Add the sample with a value to its metric family."""
+        self.family.add_metric(self.label_values, value)
+
+    def set_count(self, state_changes: _StateChanges | None) -> None:
+        """Add the sample of a state changes counter to its metric family."""
+        assert isinstance(self.family, CounterMetricFamily)
+        if state_changes is None:
+            # The state was set before the state changes were counted
+            self.family.add_metric(self.label_values, 1)
+        else:
+            self.family.add_metric(
+                self.label_values, state_changes.count, created=state_changes.created
+            )
+
+
+class PrometheusCollector(PrometheusMetrics, Collector):
+    """Collect the metrics from the state machine when Prometheus scrapes.
+
+    The metrics are built from a snapshot of the states taken on scrape,
+    so nothing is updated on state changes besides the count of state
+    changes per entity. The labels of the entities are cached between
+    scrapes and the exposition is cached for EXPOSITION_CACHE_TTL so
+    several scrapers in a row do not collect the metrics again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_filter: entityfilter.EntityFilter,
+        namespace: str,
+        climate_units: UnitOfTemperature,
+        component_config: EntityValues,
+        override_metric: str | None,
+        default_metric: str | None,
+    ) -> None:
+        """Initialize the Prometheus collector."""
+        super().__init__(
+            entity_filter,
+            namespace,
+            climate_units,
+            component_config,
+            override_metric,
+            default_metric,
+        )
+        self.hass = hass
+        self._states: list[State] = []
+        self._families: dict[str, CounterMetricFamily | GaugeMetricFamily] = {}
+        self._metric_names: dict[str, str] = {}
+        self._entity_labels: dict[str, tuple[Any, dict[str, str]]] = {}
+        self._state_handlers: dict[str, Callable[[State], None] | None] = {}
+        # States of the deleted, disabled or renamed entities, which are
+        # not exported until they change
+        self._hidden_states: dict[str, State] = {}
+        # The states seen at setup count as a state change like they did
+        # when the metrics were updated on each state change
+        created = time.time()
+        self._state_changes: dict[str, _StateChanges] = {
+            state.entity_id: _StateChanges(1, created) for state in hass.states.all()
+        }
+        self._exposition_lock = asyncio.Lock()
+        self._exposition: bytes | None = None
+        self._exposition_time = 0.0
+
+    @callback
+    def async_count_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Count the state changes of an entity."""
+        entity_id = event.data["entity_id"]
+        if event.data["new_state"] is None:
+            self._state_changes.pop(entity_id, None)
+        elif (state_changes := self._state_changes.get(entity_id)) is not None:
+            state_changes.count += 1
+        else:
+            self._state_changes[entity_id] = _StateChanges(1, time.time())
+
+    async def async_exposition(self) -> bytes:
+        """Return the exposition of the metrics, collected at most once per TTL."""
+        async with self._exposition_lock:
+            if (
+                self._exposition is None
+                or time.monotonic() - self._exposition_time > EXPOSITION_CACHE_TTL
+            ):
+                states = self.hass.states
+                if self._hidden_states:
+                    self._hidden_states = {
+                        entity_id: state
+                        for entity_id, state in self._hidden_states.items()
+                        if states.get(entity_id) is state
+                    }
+                self._states = states.async_all()
+                try:
+                    self._exposition = await self.hass.async_add_executor_job(
+                        prometheus_client.generate_latest, prometheus_client.REGISTRY
+                    )
+                finally:
+                    self._states = []
+                self._exposition_time = time.monotonic()
+            return self._exposition
+
+    def describe(self) -> Iterable[Metric]:
+        """Return no metrics so the registry does not collect on register."""
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        """Collect the metrics of the states of the snapshot."""
+        previous_labels = self._entity_labels
+        self._entity_labels = {}
+        hidden_states = self._hidden_states
+        try:
+            for state in self._states:
+                entity_id = state.entity_id
+                if (
+                    self._filter(entity_id)
+                    and hidden_states.get(entity_id) is not state
+                ):
+                    self._collect_state(state, previous_labels)
+            families = self._families
+        finally:
+            self._families = {}
+        return families.values()
+
+    def _collect_state(
+        self, state: State, previous_labels: dict[str, tuple[Any, dict[str, str]]]
+    ) -> None:
+        """Collect the metrics of a state."""
+        entity_id = state.entity_id
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (cached := previous_labels.get(entity_id)) is not None and cached[
+            0
+        ] == friendly_name:
+            self._entity_labels[entity_id] = cached
+        else:
+            self._entity_labels[entity_id] = (
+                friendly_name,
+                {
+                    "entity": entity_id,
+                    "domain": state.domain,
+                    "friendly_name": str(friendly_name),
+                },
+            )
+        labels = self._labels(state)
+
+        self._metric(
+            "state_change",
+            prometheus_client.Counter,
+            "The number of state changes",
+            labels,
+        ).set_count(self._state_changes.get(entity_id))
+
+        self._metric(
+            "entity_available",
+            prometheus_client.Gauge,
+            "Entity is available (not in the unavailable or unknown state)",
+            labels,
+        ).set(float(state.state not in IGNORED_STATES))
+
+        self._metric(
+            "last_updated_time_seconds",
+            prometheus_client.Gauge,
+            "The last_updated timestamp",
+            labels,
+        ).set(state.last_updated_timestamp)
+
+        if state.state in IGNORED_STATES or not state.state:
+            return
+        domain = state.domain
+        try:
+            handler = self._state_handlers[domain]
+        except KeyError:
+            handler = self._state_handlers[domain] = getattr(
+                self, f"_handle_{domain}", None
+            )
+        if handler is not None:
+            handler(state)
+
+    def _remove_labelsets(
+        self,
+        entity_id: str,
+        ignored_metric_names: set[str] | None = None,
+    ) -> None:
+        """Stop exporting the current state of an entity."""
+        if (state := self.hass.states.get(entity_id)) is not None:
+            self._hidden_states[entity_id] = state
+
+    def _metric(  # type: ignore[override]
+        self,
+        metric_name: str,
+        factory: type[MetricWrapperBase],
+        documentation: str,
+        labels: dict[str, str],
+    ) -> _ScrapedSample:
+        if (family := self._families.get(metric_name)) is None:
+            if (full_metric_name := self._metric_names.get(metric_name)) is None:
+                full_metric_name = self._metric_names[metric_name] = (
+                    self._sanitize_metric_name(f"{self.metrics_prefix}{metric_name}")
+                )
+            family_factory = (
+                CounterMetricFamily
+                if factory is prometheus_client.Counter
+                else GaugeMetricFamily
+            )
+            family = self._families[metric_name] = family_factory(
+                full_metric_name, documentation, labels=list(labels)
+            )
+        return _ScrapedSample(family, tuple(labels.values()))
+
+    def _labels(  # type: ignore[override]
+        self,
+        state: State,
+        extra_labels: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        labels = self._entity_labels[state.entity_id][1]
+        if extra_labels is None:
+            return labels
+        if not labels.keys().isdisjoint(extra_labels.keys()):
+            conflicting_keys = labels.keys() & extra_labels.keys()
+            raise ValueError(
+                f"extra_labels contains conflicting keys: {conflicting_keys}"
+            )
+        return labels | extra_labels
+
+    def _handle_automation(self, state: State) -> None:
+        self._metric(
+            "automation_triggered_count",
+            prometheus_client.Counter,
+            "Count of times an automation has been triggered",
+            self._labels(state),
+        ).set_count(self._state_changes.get(state.entity_id))
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(
+        self, requires_auth: bool, collector: PrometheusCollector | None = None
+    ) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._collector = collector
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
+        if self._collector is not None:
+            body = await self._collector.async_exposition()
+        else:
+            hass = request.app[KEY_HASS]
+            body = await hass.async_add_executor_job(
+                prometheus_client.generate_latest, prometheus_client.REGISTRY
+            )
         return web.Response(
             body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
@@ -0,0 +1,138 @@
+"""Support for writing pending rows with bulk inserts."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.schema import Table
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Rows are inserted in this order so the ids of the referenced
+# rows are known before the rows referencing them are inserted.
+INSERT_ORDER: tuple[type[Base], ...] = (
+    StatesMeta,
+    EventTypes,
+    StateAttributes,
+    EventData,
+    Events,
+    States,
+)
+
+# Map each foreign key column to the relationship that
+# may hold the pending row it references.
+RELATIONSHIP_FOREIGN_KEYS: dict[type[Base], tuple[tuple[str, str, str], ...]] = {
+    Events: (
+        ("event_type_id", "event_type_rel", "event_type_id"),
+        ("data_id", "event_data_rel", "data_id"),
+    ),
+    States: (
+        ("old_state_id", "old_state", "state_id"),
+        ("attributes_id", "state_attributes", "attributes_id"),
+        ("metadata_id", "states_meta_rel", "metadata_id"),
+    ),
+}
+
+
+def supports_bulk_insert(dialect: Dialect) -> bool:
+    """Return if the dialect can return the ids of rows inserted with executemany."""
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class BulkInsertBuffer:
+    """Buffer pending rows and write them with one INSERT per table.
+
+    Rows are kept as transient ORM objects so the table managers can
+    link and track them the same way they do for rows added to the
+    session, but they never go through the unit of work. On flush
+    each table is written with an executemany INSERT that returns the
+    primary keys, which are then set on the buffered objects.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._pending: defaultdict[type[Base], list[Base]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return sum(len(rows) for rows in self._pending.values())
+
+    def add(self, obj: Base) -> None:
+        """Add a row to be inserted at the next flush."""
+        self._pending[type(obj)].append(obj)
+
+    def clear(self) -> None:
+        """Forget the buffered rows after they have been committed."""
+        self._pending.clear()
+
+    def flush(self, session: Session) -> None:
+        """Insert the buffered rows.
+
+        The buffer is kept until clear is called so the flush
+        can be retried if the commit fails.
+        """
+        pending = self._pending
+        for cls in INSERT_ORDER:
+            if not (rows := pending.get(cls)):
+                continue
+            if cls is States:
+                # A state links to the previous state of the entity, which
+                # may be pending in this flush as well. Insert the states in
+                # generations so the previous state always has its id
+                # before the state referencing it is inserted.
+                for generation in _states_generations(rows):
+                    _insert_rows(session, cls, generation)
+            else:
+                _insert_rows(session, cls, rows)
+
+
+def _states_generations(states: list[Base]) -> list[list[Base]]:
+    """Split states into generations that do not reference each other."""
+    generations: list[list[Base]] = []
+    generation_of: dict[Base, int] = {}
+    for state in states:
+        old_state = state.__dict__.get("old_state")
+        if old_state is not None and old_state in generation_of:
+            generation = generation_of[old_state] + 1
+        else:
+            generation = 0
+        generation_of[state] = generation
+        if generation == len(generations):
+            generations.append([])
+        generations[generation].append(state)
+    return generations
+
+
+def _insert_rows(session: Session, cls: type[Base], objs: list[Base]) -> None:
+    """Insert rows and set the primary key on each object."""
+    table: Table = cls.__table__  # type: ignore[assignment]
+    primary_key = table.primary_key.columns[0]
+    keys = [column.key for column in table.columns if column is not primary_key]
+    foreign_keys = RELATIONSHIP_FOREIGN_KEYS.get(cls, ())
+    rows: list[dict[str, Any]] = []
+    for obj in objs:
+        obj_dict = obj.__dict__
+        row = {key: obj_dict.get(key) for key in keys}
+        for column_key, relationship_key, id_key in foreign_keys:
+            # The related row was pending when this row was created
+            # and now has its id after being inserted earlier
+            if (related := obj_dict.get(relationship_key)) is not None:
+                row[column_key] = related.__dict__.get(id_key)
+        rows.append(row)
+    ids = session.execute(
+        insert(table).returning(primary_key, sort_by_parameter_order=True), rows
+    ).scalars()
+    for obj, id_ in zip(objs, ids, strict=True):
+        setattr(obj, primary_key.key, id_)
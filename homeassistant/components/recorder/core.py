@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertBuffer, supports_bulk_insert
 from .const import (
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
@@ -80,6 +81,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .table_managers.context_origins import ContextOriginsManager
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -158,10 +160,12 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_time_buckets: bool,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_bulk_insert: bool,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -174,6 +178,7 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_time_buckets = purge_time_buckets
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -181,6 +186,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_bulk_insert = db_bulk_insert
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -206,6 +212,7 @@ class Recorder(threading.Thread):
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.context_origins_manager = ContextOriginsManager(self)
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -213,6 +220,8 @@ class Recorder(threading.Thread):
         self.statistics_meta_manager = StatisticsMetaManager(self)
 
         self.event_session: Session | None = None
+        # Only set when bulk inserts are enabled and supported by the database
+        self._bulk_insert_buffer: BulkInsertBuffer | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
@@ -682,9 +691,12 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
-        """Add an object to the session."""
+    def _add_to_session(self, session: Session, obj: Base) -> None:
+        """Add an object to the session or the bulk insert buffer."""
         self._event_session_has_pending_writes = True
+        if (bulk_insert_buffer := self._bulk_insert_buffer) is not None:
+            bulk_insert_buffer.add(obj)
+            return
         session.add(obj)
 
     def _notify_migration_failed(self) -> None:
@@ -1053,6 +1065,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
+            self.context_origins_manager.add_pending(event, dbevent)
             self._add_to_session(session, dbevent)
             return
 
@@ -1078,6 +1091,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
+        self.context_origins_manager.add_pending(event, dbevent)
         self._add_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
@@ -1160,6 +1174,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
+        self.context_origins_manager.add_pending(event, dbstate)
         self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
@@ -1208,6 +1223,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if bulk_insert_buffer := self._bulk_insert_buffer:
+            bulk_insert_buffer.flush(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1223,14 +1241,18 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        self.context_origins_manager.find_pending_origins()
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if bulk_insert_buffer:
+            bulk_insert_buffer.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        self.context_origins_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1258,11 +1280,14 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.context_origins_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_insert_buffer:
+            self._bulk_insert_buffer.clear()
 
         if not self.event_session:
             return
@@ -1421,6 +1446,16 @@ class Recorder(threading.Thread):
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
+        self._bulk_insert_buffer = None
+        if self.db_bulk_insert:
+            if supports_bulk_insert(self.engine.dialect):
+                self._bulk_insert_buffer = BulkInsertBuffer()
+            else:
+                _LOGGER.warning(
+                    "Bulk inserts are not supported by the %s database, "
+                    "falling back to writing rows through the session",
+                    self.engine.dialect.name,
+                )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
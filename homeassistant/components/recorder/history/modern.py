@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -456,6 +456,108 @@ def state_changes_during_period(
         )
 
 
+def _significant_states_columnar_stmt(
+    start_time_ts: float,
+    after_state_id: int | None,
+    end_time_ts: float | None,
+    metadata_id: int,
+    significant_changes_only: bool,
+    limit: int,
+) -> Select:
+    """Query the database for the significant state values of an entity."""
+    stmt = select(States.state, States.last_updated_ts, States.state_id).filter(
+        States.metadata_id == metadata_id
+    )
+    if after_state_id is None:
+        stmt = stmt.filter(States.last_updated_ts > start_time_ts)
+    else:
+        # Continue after the last row of the previous chunk, which can
+        # share its timestamp with the first rows of this chunk
+        stmt = stmt.filter(
+            (States.last_updated_ts > start_time_ts)
+            | (
+                (States.last_updated_ts == start_time_ts)
+                & (States.state_id > after_state_id)
+            )
+        )
+    if significant_changes_only:
+        # Attributes are not returned so attribute changes are
+        # never significant, even for the significant domains.
+        stmt = stmt.filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    return stmt.order_by(States.last_updated_ts, States.state_id).limit(limit)
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    limit: int,
+    after_state_id: int | None = None,
+) -> tuple[list[float], list[str | None], int | None]:
+    """Return a chunk of the significant state values of an entity.
+
+    The timestamps and the state values are returned as parallel lists
+    together with the state_id of the last row if the chunk was cut off
+    at limit rows. The next chunk can be fetched by calling again with
+    start_time_ts set to the last returned timestamp and after_state_id
+    set to the returned state_id. Attributes are never returned.
+    """
+    timestamps: list[float] = []
+    values: list[str | None] = []
+    instance = get_instance(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            metadata_id := instance.states_meta_manager.get(entity_id, session, False)
+        ):
+            return timestamps, values, None
+        if (
+            include_start_time_state
+            and (oldest_ts := instance.states_manager.oldest_ts) is not None
+            and oldest_ts < start_time_ts
+        ):
+            start_time_stmt = lambda_stmt(
+                lambda: _get_single_entity_start_time_stmt(
+                    start_time_ts, metadata_id, True, False, False
+                )
+            )
+            for row in execute_stmt_lambda_element(
+                session, start_time_stmt, orm_rows=False
+            ):
+                timestamps.append(start_time_ts)
+                values.append(row[_FIELD_MAP["state"]])
+        stmt = lambda_stmt(
+            lambda: _significant_states_columnar_stmt(
+                start_time_ts,
+                after_state_id,
+                end_time_ts,
+                metadata_id,
+                significant_changes_only,
+                limit,
+            ),
+            track_on=[
+                bool(end_time_ts),
+                significant_changes_only,
+                after_state_id is None,
+            ],
+        )
+        rows = cast(
+            Sequence[Row],
+            execute_stmt_lambda_element(session, stmt, orm_rows=False),
+        )
+        for state, last_updated_ts, _ in rows:
+            timestamps.append(last_updated_ts)
+            values.append(state)
+    return timestamps, values, rows[-1][2] if len(rows) == limit else None
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 import logging
+import math
 import time
 from typing import TYPE_CHECKING
 
@@ -21,22 +22,32 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_before,
+    find_attributes_ids_of_states_before,
+    find_data_ids_of_events_before,
     find_entity_ids_to_purge,
+    find_event_ts_after_oldest,
     find_event_types_to_purge,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
+    find_state_ids_before,
+    find_state_ts_after_oldest,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -52,6 +63,9 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Size of the time buckets purged at once when purging by time buckets
+PURGE_TIME_BUCKET_SECONDS = 3600
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -85,12 +99,20 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+            if instance.purge_time_buckets:
+                has_more_to_purge |= _purge_states_time_bucket(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_time_bucket(
+                    instance, session, events_batch_size, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -246,6 +268,114 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _time_bucket_end(
+    oldest_ts: float | None, next_ts: float | None, purge_before_ts: float
+) -> float | None:
+    """Return the end of the oldest time bucket to purge.
+
+    The bucket ends at the end of the hour of the oldest row, or earlier
+    at next_ts, the timestamp of the first row past the maximum number
+    of rows purged at once, so each bucket has a bounded number of rows.
+
+    Returns None if there is nothing older than purge_before_ts.
+    """
+    if oldest_ts is None or oldest_ts >= purge_before_ts:
+        return None
+    bucket_end = min(
+        (oldest_ts // PURGE_TIME_BUCKET_SECONDS + 1) * PURGE_TIME_BUCKET_SECONDS,
+        purge_before_ts,
+    )
+    if next_ts is not None and next_ts < bucket_end:
+        # More rows than the maximum can share the timestamp of the oldest
+        # row, they are purged together so the purge still makes progress
+        bucket_end = max(next_ts, math.nextafter(oldest_ts, math.inf))
+    return bucket_end
+
+
+def _purge_states_time_bucket(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the oldest time bucket of states and the attributes it used.
+
+    The states are deleted with a single range delete on the
+    last_updated_ts index instead of selecting and deleting them
+    by state id in batches. A bucket holds at most as many states
+    as the batches of a purge by state ids.
+
+    Returns true if there may be more states to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    oldest_ts = session.execute(find_oldest_state()).scalar()
+    next_ts = session.execute(
+        find_state_ts_after_oldest(states_batch_size * instance.max_bind_vars)
+    ).scalar()
+    if (bucket_end := _time_bucket_end(oldest_ts, next_ts, purge_before_ts)) is None:
+        return False
+
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_attributes_ids_of_states_before(bucket_end)
+        )
+        if attributes_id
+    }
+    states_manager = instance.states_manager
+    purged_committed_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(
+        states_manager.get_committed_state_ids(), instance.max_bind_vars
+    ):
+        purged_committed_state_ids.update(
+            state_id
+            for (state_id,) in session.execute(
+                find_state_ids_before(state_ids_chunk, bucket_end)
+            )
+        )
+
+    # See _purge_state_ids for why the states are disconnected first
+    disconnected_rows = session.execute(disconnect_states_rows_before(bucket_end))
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+
+    deleted_rows = session.execute(delete_states_rows_before(bucket_end))
+    _LOGGER.debug("Deleted %s states before %s", deleted_rows, bucket_end)
+
+    states_manager.evict_purged_state_ids(purged_committed_state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    return bucket_end < purge_before_ts
+
+
+def _purge_events_time_bucket(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the oldest time bucket of events and the data it used.
+
+    Returns true if there may be more events to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    oldest_ts = session.execute(find_oldest_event()).scalar()
+    next_ts = session.execute(
+        find_event_ts_after_oldest(events_batch_size * instance.max_bind_vars)
+    ).scalar()
+    if (bucket_end := _time_bucket_end(oldest_ts, next_ts, purge_before_ts)) is None:
+        return False
+
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(find_data_ids_of_events_before(bucket_end))
+        if data_id
+    }
+    deleted_rows = session.execute(delete_event_rows_before(bucket_end))
+    _LOGGER.debug("Deleted %s events before %s", deleted_rows, bucket_end)
+
+    _purge_unused_data_ids(instance, session, data_ids)
+    return bucket_end < purge_before_ts
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -181,6 +181,43 @@ def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Disconnect the states that link to states older than purge_before.
+
+    The states older than purge_before which link to each other are
+    disconnected as well, as MySQL checks the foreign key of each row
+    while the range delete runs.
+    """
+    return lambda_stmt(
+        lambda: update(States)
+        .where(
+            States.old_state_id.in_(
+                # MySQL cannot update a table that is selected from in a
+                # subquery, so the ids are selected from a derived table
+                # which is materialized before the update.
+                select(
+                    select(States.state_id)
+                    .filter(States.last_updated_ts < purge_before)
+                    .distinct()
+                    .subquery()
+                    .c.state_id
+                )
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_data_rows(data_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete event_data rows."""
     return lambda_stmt(
@@ -234,6 +271,15 @@ def delete_event_rows(
     )
 
 
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete event rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_recorder_runs_rows(
     purge_before: datetime, current_run_id: int
 ) -> StatementLambdaElement:
@@ -278,6 +324,104 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_state_ts_after_oldest(rows: int) -> StatementLambdaElement:
+    """Find the last_updated_ts of the state following the oldest rows states."""
+    return lambda_stmt(
+        lambda: select(States.last_updated_ts)
+        .order_by(States.last_updated_ts.asc())
+        .offset(rows)
+        .limit(1)
+    )
+
+
+def find_event_ts_after_oldest(rows: int) -> StatementLambdaElement:
+    """Find the time_fired_ts of the event following the oldest rows events."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .offset(rows)
+        .limit(1)
+    )
+
+
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def find_attributes_ids_of_states_before(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Find the attributes ids of states older than purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id)).filter(
+            States.last_updated_ts < purge_before
+        )
+    )
+
+
+def find_data_ids_of_events_before(purge_before: float) -> StatementLambdaElement:
+    """Find the data ids of events older than purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id)).filter(
+            Events.time_fired_ts < purge_before
+        )
+    )
+
+
+def find_state_ids_before(
+    state_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Find which of the state ids are older than purge_before."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.last_updated_ts < purge_before)
+    )
+
+
+def find_contexts_first_events(context_ids_bin: Iterable[bytes]) -> Select:
+    """Find the first event of each of the contexts.
+
+    This query is intentionally not a lambda statement as the number
+    of context ids changes between calls.
+    """
+    first_ts = (
+        select(Events.context_id_bin, func.min(Events.time_fired_ts).label("ts"))
+        .filter(Events.context_id_bin.in_(context_ids_bin))
+        .group_by(Events.context_id_bin)
+        .subquery()
+    )
+    return select(Events.context_id_bin, Events.event_id, Events.time_fired_ts).join(
+        first_ts,
+        (Events.context_id_bin == first_ts.c.context_id_bin)
+        & (Events.time_fired_ts == first_ts.c.ts),
+    )
+
+
+def find_contexts_first_states(context_ids_bin: Iterable[bytes]) -> Select:
+    """Find the first state of each of the contexts.
+
+    This query is intentionally not a lambda statement as the number
+    of context ids changes between calls.
+    """
+    first_ts = (
+        select(States.context_id_bin, func.min(States.last_updated_ts).label("ts"))
+        .filter(States.context_id_bin.in_(context_ids_bin))
+        .group_by(States.context_id_bin)
+        .subquery()
+    )
+    return select(States.context_id_bin, States.state_id, States.last_updated_ts).join(
+        first_ts,
+        (States.context_id_bin == first_ts.c.context_id_bin)
+        & (States.last_updated_ts == first_ts.c.ts),
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
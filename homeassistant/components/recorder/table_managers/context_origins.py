@@ -0,0 +1,190 @@
+"""Track the row that started each context."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+import time
+from typing import TYPE_CHECKING, Any
+
+from lru import LRU
+
+from homeassistant.core import Event
+from homeassistant.util.collection import chunked_or_all
+
+from ..db_schema import Events, States
+from ..queries import find_contexts_first_events, find_contexts_first_states
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+# Contexts with more than one row for which the origin is kept
+CACHE_SIZE = 32768
+# Recently written rows that may become the origin of their context
+FIRST_ROWS_CACHE_SIZE = 8192
+
+# The origin of a context as (is_state, row_id, recorded_ts)
+type ContextOrigin = tuple[bool, int, float]
+
+
+def _row_origin(row: Events | States, recorded_ts: float) -> ContextOrigin:
+    """Return the origin for a row that has been committed."""
+    if isinstance(row, States):
+        return (True, row.state_id, recorded_ts)
+    return (False, row.event_id, recorded_ts)
+
+
+class ContextOriginsManager:
+    """Track the row that started each context with more than one row.
+
+    The logbook shows what caused a row by looking up the first row
+    written with the same context id. The origins of the contexts
+    written since the recorder started are kept here so the logbook
+    can fetch them by row id instead of joining the states and events
+    tables on the context ids of every row in the requested window.
+
+    Only contexts with more than one row are kept since the origin
+    of a context with a single row is the row itself.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the context origins manager."""
+        self.recorder = recorder
+        self._pending_first_rows: dict[bytes, Events | States] = {}
+        self._pending_origins: dict[bytes, tuple[Events | States, float]] = {}
+        # Rows of contexts started by an earlier row that is no longer in
+        # the recently written rows, with the time they were recorded and
+        # the time the next row of the context was recorded in the batch
+        self._pending_lookups: dict[
+            bytes, tuple[Events | States, float, float | None]
+        ] = {}
+        self._first_rows: LRU[bytes, ContextOrigin] = LRU(FIRST_ROWS_CACHE_SIZE)
+        self._origins: LRU[bytes, ContextOrigin] = LRU(CACHE_SIZE, self._evicted)
+        self._complete_after = time.time()
+
+    def _evicted(self, _context_id_bin: bytes, origin: ContextOrigin) -> None:
+        """Stop covering the time before an evicted origin was recorded."""
+        self._complete_after = max(self._complete_after, origin[2])
+
+    def covers(self, start_ts: float) -> bool:
+        """Return if the origins of all contexts recorded after start_ts are known.
+
+        This call is thread-safe.
+        """
+        return start_ts >= self._complete_after
+
+    def get_many(self, context_ids_bin: Iterable[bytes]) -> list[ContextOrigin]:
+        """Return the known origins of the context ids.
+
+        This call is thread-safe.
+        """
+        origins_get = self._origins.get
+        return [
+            origin
+            for context_id_bin in context_ids_bin
+            if (origin := origins_get(context_id_bin)) is not None
+        ]
+
+    def add_pending(self, event: Event[Any], row: Events | States) -> None:
+        """Track a row about to be written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (context_id_bin := row.context_id_bin) is None or (
+            context_id_bin in self._origins or context_id_bin in self._pending_origins
+        ):
+            return
+        recorded_ts = event.time_fired_timestamp
+        if (first_row := self._pending_first_rows.get(context_id_bin)) is not None:
+            self._pending_origins[context_id_bin] = (first_row, recorded_ts)
+            return
+        if (lookup := self._pending_lookups.get(context_id_bin)) is not None:
+            if lookup[2] is None:
+                self._pending_lookups[context_id_bin] = (*lookup[:2], recorded_ts)
+            return
+        if (first_origin := self._first_rows.get(context_id_bin)) is not None:
+            is_state, row_id, _ = first_origin
+            self._origins[context_id_bin] = (is_state, row_id, recorded_ts)
+            return
+        if event.context.origin_event is not event:
+            # The context was started by an earlier event that is no
+            # longer in the recently written rows or was not recorded,
+            # so it is looked up in the database with the rest of the batch
+            self._pending_lookups[context_id_bin] = (row, recorded_ts, None)
+            return
+        self._pending_first_rows[context_id_bin] = row
+
+    def _find_first_rows(
+        self, context_ids_bin: Collection[bytes]
+    ) -> dict[bytes, ContextOrigin]:
+        """Find the first committed rows of the contexts in the database."""
+        session = self.recorder.event_session
+        assert session is not None
+        first_rows: dict[bytes, ContextOrigin] = {}
+        with session.no_autoflush:
+            for context_ids_chunk in chunked_or_all(
+                context_ids_bin, self.recorder.max_bind_vars
+            ):
+                for is_state, stmt in (
+                    (False, find_contexts_first_events(context_ids_chunk)),
+                    (True, find_contexts_first_states(context_ids_chunk)),
+                ):
+                    for context_id_bin, row_id, first_ts in session.execute(stmt):
+                        if (
+                            known := first_rows.get(context_id_bin)
+                        ) is None or first_ts < known[2]:
+                            first_rows[context_id_bin] = (is_state, row_id, first_ts)
+        return first_rows
+
+    def find_pending_origins(self) -> None:
+        """Find the origins of the pending rows of contexts started earlier.
+
+        The database is queried once for all the contexts of the batch
+        rather than once per context as the rows are added.
+
+        This call is not thread-safe and must be called from the
+        recorder thread before the commit.
+        """
+        if not (lookups := self._pending_lookups):
+            return
+        first_rows = self._find_first_rows(lookups)
+        for context_id_bin, (row, recorded_ts, next_recorded_ts) in lookups.items():
+            first_origin = first_rows.get(context_id_bin)
+            # The row itself is found if it was flushed before the lookup
+            if (
+                first_origin is not None
+                and first_origin[:2] != _row_origin(row, 0.0)[:2]
+            ):
+                is_state, row_id, _ = first_origin
+                self._origins[context_id_bin] = (is_state, row_id, recorded_ts)
+            elif next_recorded_ts is not None:
+                self._pending_origins[context_id_bin] = (row, next_recorded_ts)
+            else:
+                self._pending_first_rows[context_id_bin] = row
+        lookups.clear()
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to track the ids of the rows that were written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for context_id_bin, row in self._pending_first_rows.items():
+            self._first_rows[context_id_bin] = _row_origin(row, 0.0)
+        for context_id_bin, (row, recorded_ts) in self._pending_origins.items():
+            self._origins[context_id_bin] = _row_origin(row, recorded_ts)
+        self._pending_first_rows.clear()
+        self._pending_origins.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_first_rows.clear()
+        self._pending_origins.clear()
+        self._pending_lookups.clear()
+        self._first_rows.clear()
+        self._origins.clear()
+        self._complete_after = time.time()
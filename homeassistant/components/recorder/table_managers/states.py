@@ -107,6 +107,14 @@ class StatesManager:
             ts = result[0].last_updated_ts
         self._oldest_ts = ts
 
+    def get_committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the last committed state of each entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return set(self._last_committed_id.values())
+
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
 
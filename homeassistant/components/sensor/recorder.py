@@ -6,11 +6,11 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
-import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, cast
 
+import numpy as np
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components.recorder import (
@@ -99,51 +99,71 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+def _mean_min_max(
+    entities_fstates: list[list[tuple[float, State]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[list[float], list[float], list[float]]:
+    """Calculate the time weighted average, min and max of many entities.
+
+    The values and timestamps of the states of all entities are put in one
+    array each, so the statistics of all entities are computed at once
+    instead of looping over the states of each entity. Each entity must have
+    at least one state.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
-        # If the only state changed that happened was at the exact moment
-        # at the end of the period, we can't calculate a meaningful average
-        # so we return 0.0 since it represents a time duration smaller than
-        # we can measure. This probably means the precision of statistics
-        # column schema in the database is incorrect but it is actually possible
-        # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+    if not entities_fstates:
+        return [], [], []
+    counts = np.fromiter(map(len, entities_fstates), np.intp, len(entities_fstates))
+    total = int(counts.sum())
+    values = np.fromiter(
+        (fstate for fstates in entities_fstates for fstate, _ in fstates),
+        np.float64,
+        total,
+    )
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    timestamps = np.fromiter(
+        (
+            state.last_updated_timestamp
+            for fstates in entities_fstates
+            for _, state in fstates
+        ),
+        np.float64,
+        total,
+    )
+    np.maximum(timestamps, start_ts, out=timestamps)
+    firsts = np.cumsum(counts) - counts
+    # Each value is weighted by the duration until the next state change
+    # of the entity, or until the end of the period for its last state
+    next_timestamps = np.empty_like(timestamps)
+    next_timestamps[:-1] = timestamps[1:]
+    next_timestamps[firsts + counts - 1] = end_ts
+    accumulated = np.add.reduceat(values * (next_timestamps - timestamps), firsts)
+    # The period starts at the first state if there was no last known state
+    period_seconds = end_ts - timestamps[firsts]
+    # If the only state changed that happened was at the exact moment
+    # at the end of the period, we can't calculate a meaningful average
+    # so we return 0.0 since it represents a time duration smaller than
+    # we can measure. This probably means the precision of statistics
+    # column schema in the database is incorrect but it is actually possible
+    # to happen if the state change event fired at the exact microsecond
+    means = np.divide(
+        accumulated,
+        period_seconds,
+        out=np.zeros_like(accumulated),
+        where=period_seconds != 0,
+    )
+    return (
+        cast(list[float], means.tolist()),
+        cast(list[float], np.minimum.reduceat(values, firsts).tolist()),
+        cast(list[float], np.maximum.reduceat(values, firsts).tolist()),
+    )
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -482,12 +502,15 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
-    for (  # pylint: disable=too-many-nested-blocks
+    means, mins, maxes = _mean_min_max(
+        [valid_float_states for *_, valid_float_states in to_process], start, end
+    )
+    for index, (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
         state_class,
         valid_float_states,
-    ) in to_process:
+    ) in enumerate(to_process):
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
             if not _equivalent_units(
@@ -526,16 +549,12 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["max"] = maxes[index]
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["min"] = mins[index]
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = means[index]
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
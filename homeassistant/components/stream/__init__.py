@@ -20,6 +20,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Mapping
 import copy
+import dataclasses
 import logging
 import secrets
 import threading
@@ -45,6 +46,7 @@ from .const import (
     ATTR_STREAMS,
     CONF_EXTRA_PART_WAIT_TIME,
     CONF_LL_HLS,
+    CONF_LOOKBACK_SPOOL_SIZE,
     CONF_PART_DURATION,
     CONF_RTSP_TRANSPORT,
     CONF_SEGMENT_DURATION,
@@ -75,6 +77,7 @@ from .core import (
 from .diagnostics import Diagnostics
 from .exceptions import StreamOpenClientError, StreamWorkerError
 from .hls import HlsStreamOutput, async_setup_hls
+from .lookback import LookbackSpool
 
 if TYPE_CHECKING:
     from homeassistant.components.camera import DynamicStreamSettings
@@ -221,6 +224,10 @@ DOMAIN_SCHEMA = vol.Schema(
         vol.Optional(CONF_PART_DURATION, default=1): vol.All(
             cv.positive_float, vol.Range(min=0.2, max=1.5)
         ),
+        # Megabytes of segments spooled to disk per stream for recording lookback
+        vol.Optional(CONF_LOOKBACK_SPOOL_SIZE, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=4096)
+        ),
     }
 )
 
@@ -287,6 +294,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
     else:
         hass.data[DOMAIN][ATTR_SETTINGS] = STREAM_SETTINGS_NON_LL_HLS
+    if conf[CONF_LOOKBACK_SPOOL_SIZE]:
+        hass.data[DOMAIN][ATTR_SETTINGS] = dataclasses.replace(
+            hass.data[DOMAIN][ATTR_SETTINGS],
+            lookback_spool_size=conf[CONF_LOOKBACK_SPOOL_SIZE] * 1024 * 1024,
+        )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -348,6 +360,7 @@ class Stream:
             else _LOGGER
         )
         self._diagnostics = Diagnostics()
+        self._lookback_spool: LookbackSpool | None = None
 
     def endpoint_url(self, fmt: str) -> str:
         """Start the stream and returns a url for the output format."""
@@ -463,7 +476,13 @@ class Stream:
         # pylint: disable-next=import-outside-toplevel
         from .worker import StreamState, stream_worker
 
-        stream_state = StreamState(self.hass, self.outputs, self._diagnostics)
+        if self._stream_settings.lookback_spool_size:
+            self._lookback_spool = LookbackSpool(
+                self._stream_settings.lookback_spool_size
+            )
+        stream_state = StreamState(
+            self.hass, self.outputs, self._diagnostics, self._lookback_spool
+        )
         wait_timeout = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
             start_time = time.time()
@@ -514,6 +533,10 @@ class Stream:
                 redact_credentials(str(self.source)),
             )
 
+        if self._lookback_spool is not None:
+            self._lookback_spool.close()
+            self._lookback_spool = None
+
         async def worker_finished() -> None:
             # The worker is no checking availability of the stream and can no longer track
             # availability so mark it as available, otherwise the frontend may not be able to
@@ -580,7 +603,11 @@ class Stream:
 
         # Take advantage of lookback
         hls: HlsStreamOutput = cast(HlsStreamOutput, self.outputs().get(HLS_PROVIDER))
-        if hls:
+        if self._lookback_spool is not None:
+            # The recorder reads the spooled segments one at a time
+            recorder.lookback_spool = self._lookback_spool
+            recorder.lookback = lookback
+        elif hls:
             num_segments = min(int(lookback / hls.target_duration) + 1, MAX_SEGMENTS)
             # Wait for latest segment, then add the lookback
             await hls.recv()
@@ -611,7 +638,22 @@ class Stream:
 
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        diagnostics = self._diagnostics.as_dict()
+        if outputs := list(self._outputs.values()):
+            # The outputs share the segments put by the worker
+            segments = {
+                id(segment): segment
+                for output in outputs
+                for segment in output.get_segments()
+            }
+            diagnostics["segment_bytes_held"] = sum(
+                segment.data_size for segment in segments.values()
+            )
+            if isinstance(hls := self._outputs.get(HLS_PROVIDER), HlsStreamOutput):
+                diagnostics["segments_evicted"] = hls.segments_evicted
+        if (lookback_spool := self._lookback_spool) is not None:
+            diagnostics["lookback_spool_bytes"] = lookback_spool.bytes_held
+        return diagnostics
 
 
 def _should_retry() -> bool:
@@ -60,6 +60,8 @@ class StreamSettings:
     part_target_duration: float
     hls_advance_part_limit: int
     hls_part_timeout: float
+    # Bytes of completed segments spooled to disk for the recording lookback
+    lookback_spool_size: int = 0
 
 
 STREAM_SETTINGS_NON_LL_HLS = StreamSettings(
@@ -329,6 +331,11 @@ class StreamOutput:
         """Retrieve all segments."""
         return self._segments
 
+    @property
+    def bytes_held(self) -> int:
+        """Return the size of the part data held in bytes."""
+        return sum(segment.data_size for segment in self._segments)
+
     async def part_recv(self, timeout: float | None = None) -> bool:
         """Wait for an event signalling the latest part segment."""
         try:
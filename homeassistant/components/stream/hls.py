@@ -14,6 +14,7 @@ from .const import (
     EXT_X_START_NON_LL_HLS,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    MAX_SEGMENT_BYTES,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
 )
@@ -64,6 +65,7 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        self.segments_evicted = 0
 
     @property
     def name(self) -> str:
@@ -89,6 +91,11 @@ class HlsStreamOutput(StreamOutput):
         their GOPs periodically so we need to account for this change.
         """
         super()._async_put(segment)
+        # Drop the oldest segments of a high bitrate stream over the memory
+        # budget, always keeping the segment in progress
+        while len(self._segments) > 1 and self.bytes_held > MAX_SEGMENT_BYTES:
+            self._segments.popleft()
+            self.segments_evicted += 1
         self._target_duration = (
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
@@ -431,9 +438,17 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the parts as they are held instead of joining them, the
+        # segment may still be in progress so only the current parts are sent
+        parts = list(segment.parts)
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        await response.write_eof()
+        return response
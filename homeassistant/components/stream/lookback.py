@@ -0,0 +1,144 @@
+"""Spool the completed segments of a stream to disk for recording lookback."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+import datetime
+import mmap
+import tempfile
+import threading
+
+from .core import Part, Segment
+
+
+@dataclass(slots=True)
+class _SpooledSegment:
+    """The location of a segment in the spool."""
+
+    sequence: int
+    stream_id: int
+    start_time: datetime.datetime
+    duration: float
+    offset: int
+    init_size: int
+    size: int
+
+
+class LookbackSpool:
+    """A ring of the latest completed segments in a memory mapped file.
+
+    The segments are written by the stream worker as they complete and
+    overwrite the oldest segments once the spool is full, so the memory
+    used for the recording lookback is the page cache of the file rather
+    than the segments. The segments are read back one at a time by the
+    recordings of the stream.
+
+    The spool is written from the worker thread and read from executor
+    threads.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the spool."""
+        self.size = size
+        self._lock = threading.Lock()
+        self._file = tempfile.TemporaryFile()
+        self._file.truncate(size)
+        self._map: mmap.mmap | None = mmap.mmap(self._file.fileno(), size)
+        self._segments: deque[_SpooledSegment] = deque()
+        self._offset = 0
+
+    def write(self, segment: Segment, parts: Iterable[Part], duration: float) -> None:
+        """Write a completed segment, overwriting the oldest segments."""
+        init = segment.init
+        parts = list(parts)
+        size = len(init) + sum(len(part.data) for part in parts)
+        with self._lock:
+            if self._map is None or size > self.size:
+                return
+            if self._offset + size > self.size:
+                self._offset = 0
+            start = self._offset
+            end = start + size
+            # Forget the segments being overwritten
+            self._segments = deque(
+                spooled
+                for spooled in self._segments
+                if spooled.offset >= end or spooled.offset + spooled.size <= start
+            )
+            position = self._offset
+            self._map[position : position + len(init)] = init
+            position += len(init)
+            for part in parts:
+                self._map[position : position + len(part.data)] = part.data
+                position += len(part.data)
+            self._segments.append(
+                _SpooledSegment(
+                    sequence=segment.sequence,
+                    stream_id=segment.stream_id,
+                    start_time=segment.start_time,
+                    duration=duration,
+                    offset=self._offset,
+                    init_size=len(init),
+                    size=size,
+                )
+            )
+            self._offset = end
+
+    def lookback(self, seconds: float, before: int) -> list[int]:
+        """Return the sequences of the segments covering the lookback.
+
+        The lookback ends with the latest segment before a sequence and
+        always has a segment if there is one.
+        """
+        with self._lock:
+            sequences: list[int] = []
+            covered = 0.0
+            for spooled in reversed(self._segments):
+                if spooled.sequence >= before:
+                    continue
+                sequences.append(spooled.sequence)
+                covered += spooled.duration
+                if covered >= seconds:
+                    break
+        sequences.reverse()
+        return sequences
+
+    def read(self, sequence: int) -> Segment | None:
+        """Read a segment, or None if it was overwritten."""
+        with self._lock:
+            if self._map is None:
+                return None
+            for spooled in self._segments:
+                if spooled.sequence == sequence:
+                    break
+            else:
+                return None
+            data_offset = spooled.offset + spooled.init_size
+            init = self._map[spooled.offset : data_offset]
+            data = self._map[data_offset : spooled.offset + spooled.size]
+        return Segment(
+            sequence=spooled.sequence,
+            init=init,
+            stream_id=spooled.stream_id,
+            start_time=spooled.start_time,
+            _stream_outputs=(),
+            duration=spooled.duration,
+            parts=[Part(duration=spooled.duration, has_keyframe=True, data=data)],
+        )
+
+    @property
+    def bytes_held(self) -> int:
+        """Return the size of the spooled segments in bytes."""
+        with self._lock:
+            return sum(spooled.size for spooled in self._segments)
+
+    def close(self) -> None:
+        """Close the spool and remove its file."""
+        with self._lock:
+            self._segments.clear()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
@@ -20,6 +20,7 @@ from .const import (
 )
 from .core import PROVIDERS, IdleTimer, Segment, StreamOutput, StreamSettings
 from .fmp4utils import read_init, transform_init
+from .lookback import LookbackSpool
 
 if TYPE_CHECKING:
     from homeassistant.components.camera import DynamicStreamSettings
@@ -46,6 +47,8 @@ class RecorderOutput(StreamOutput):
         """Initialize recorder output."""
         super().__init__(hass, idle_timer, stream_settings, dynamic_stream_settings)
         self.video_path: str
+        self.lookback_spool: LookbackSpool | None = None
+        self.lookback: float = 0
 
     @property
     def name(self) -> str:
@@ -155,6 +158,12 @@ class RecorderOutput(StreamOutput):
 
             source.close()
 
+        def write_spooled_segment(lookback_spool: LookbackSpool, sequence: int) -> None:
+            """Write a segment read from the lookback spool to output."""
+            # The segment is gone if it was overwritten since the recording started
+            if segment := lookback_spool.read(sequence):
+                write_segment(segment)
+
         def write_transform_matrix_and_rename(video_path: str) -> None:
             """Update the transform matrix and write to the desired filename."""
             with (
@@ -194,6 +203,17 @@ class RecorderOutput(StreamOutput):
                     video_path,
                 )
 
+        # Write spooled lookback segments, which are all the completed segments
+        # before the first segment received
+        if (lookback_spool := self.lookback_spool) is not None and (
+            self._segments or await self.recv()
+        ):
+            for sequence in lookback_spool.lookback(
+                self.lookback, self._segments[0].sequence
+            ):
+                await self._hass.async_add_executor_job(
+                    write_spooled_segment, lookback_spool, sequence
+                )
         # Write lookback segments
         while len(self._segments) > 1:  # The last segment is in progress
             await self._hass.async_add_executor_job(
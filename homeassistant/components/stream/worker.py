@@ -7,7 +7,7 @@ from collections.abc import Callable, Generator, Iterator, Mapping
 import contextlib
 from dataclasses import fields
 import datetime
-from io import SEEK_END, BytesIO
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedIOBase, UnsupportedOperation
 import logging
 from threading import Event
 from typing import Any, Self, cast
@@ -44,6 +44,7 @@ from .diagnostics import Diagnostics
 from .exceptions import StreamEndedError, StreamWorkerError
 from .fmp4utils import read_init
 from .hls import HlsStreamOutput
+from .lookback import LookbackSpool
 
 _LOGGER = logging.getLogger(__name__)
 NEGATIVE_INF = float("-inf")
@@ -70,6 +71,7 @@ class StreamState:
         hass: HomeAssistant,
         outputs_callback: Callable[[], Mapping[str, StreamOutput]],
         diagnostics: Diagnostics,
+        lookback_spool: LookbackSpool | None = None,
     ) -> None:
         """Initialize StreamState."""
         self._stream_id: int = 0
@@ -81,6 +83,8 @@ class StreamState:
         # has a sequence number of 0.
         self._sequence = -1
         self._diagnostics = diagnostics
+        # Completed segments are also written here for recording lookback
+        self.lookback_spool = lookback_spool
 
     @property
     def sequence(self) -> int:
@@ -118,11 +122,108 @@ class StreamState:
         return self._diagnostics
 
 
+class SegmentBuffer(BufferedIOBase):
+    """An in memory file a segment is muxed to.
+
+    The data is kept as the chunks written by the muxer and released
+    once it is read as a part, so only the data of the part being
+    muxed is held and reading a part copies it at most once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SegmentBuffer."""
+        super().__init__()
+        self._chunks: list[bytes] = []
+        # Positions of the first held byte, the end of the data and the cursor
+        self._start = 0
+        self._end = 0
+        self._pos = 0
+
+    def readable(self) -> bool:
+        """Return True as the buffer can be read."""
+        return True
+
+    def writable(self) -> bool:
+        """Return True as the buffer can be written."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True as the buffer can be seeked."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._pos
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Move to a position and return it."""
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._end
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def _consolidate(self) -> bytes:
+        """Join the held chunks into a single chunk and return it."""
+        if len(self._chunks) != 1:
+            self._chunks = [b"".join(self._chunks)]
+        return self._chunks[0]
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """Write data at the current position."""
+        data = bytes(data)
+        if self._pos == self._end:
+            self._chunks.append(data)
+            self._end += len(data)
+        else:
+            # The fragmented mp4 muxer only appends, overwrite anyway
+            if self._pos < self._start or self._pos > self._end:
+                raise UnsupportedOperation("Position is outside of the held data")
+            held = bytearray(self._consolidate())
+            offset = self._pos - self._start
+            held[offset : offset + len(data)] = data
+            self._chunks = [bytes(held)]
+            self._end = self._start + len(held)
+        self._pos += len(data)
+        return len(data)
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read data from the current position."""
+        if self._pos < self._start:
+            raise UnsupportedOperation("Data at the position was released")
+        stop = self._end if size is None or size < 0 else self._pos + size
+        stop = min(stop, self._end)
+        if self._pos >= stop:
+            return b""
+        held = self._consolidate()
+        if self._pos == self._start and stop == self._end:
+            data = held
+        else:
+            data = held[self._pos - self._start : stop - self._start]
+        self._pos = stop
+        return data
+
+    def release(self) -> None:
+        """Release the data before the current position."""
+        if self._pos >= self._end:
+            self._chunks = []
+        else:
+            self._chunks = [self._consolidate()[self._pos - self._start :]]
+        self._start = self._pos
+
+    def close(self) -> None:
+        """Release all the data and close the buffer."""
+        self._chunks = []
+        self._start = self._end
+        super().close()
+
+
 class StreamMuxer:
     """StreamMuxer re-packages video/audio packets for output."""
 
     _segment_start_dts: int
-    _memory_file: BytesIO
+    _memory_file: SegmentBuffer
     _av_output: av.container.OutputContainer
     _output_video_stream: av.VideoStream
     _output_audio_stream: av.audio.AudioStream | None
@@ -153,7 +254,7 @@ class StreamMuxer:
 
     def make_new_av(
         self,
-        memory_file: BytesIO,
+        memory_file: SegmentBuffer,
         sequence: int,
         input_vstream: av.VideoStream,
         input_astream: av.audio.AudioStream | None,
@@ -237,7 +338,8 @@ class StreamMuxer:
         """Initialize a new stream segment."""
         self._part_start_dts = self._segment_start_dts = video_dts
         self._segment = None
-        self._memory_file = BytesIO()
+        self._segment_parts: list[Part] = []
+        self._memory_file = SegmentBuffer()
         self._memory_file_pos = 0
         (
             self._av_output,
@@ -356,15 +458,14 @@ class StreamMuxer:
             adjusted_dts = packet.dts
         assert self._segment
         self._memory_file.seek(self._memory_file_pos)
+        part = Part(
+            duration=float((adjusted_dts - self._part_start_dts) * packet.time_base),
+            has_keyframe=self._part_has_keyframe,
+            data=self._memory_file.read(),
+        )
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
-            Part(
-                duration=float(
-                    (adjusted_dts - self._part_start_dts) * packet.time_base
-                ),
-                has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
-            ),
+            part,
             (
                 (
                     segment_duration := float(
@@ -375,15 +476,22 @@ class StreamMuxer:
                 else 0
             ),
         )
+        if (lookback_spool := self._stream_state.lookback_spool) is not None:
+            self._segment_parts.append(part)
+            if last_part:
+                lookback_spool.write(
+                    self._segment, self._segment_parts, segment_duration
+                )
         if last_part:
             # If we've written the last part, we can close the memory_file.
-            self._memory_file.close()  # We don't need the BytesIO object anymore
+            self._memory_file.close()  # We don't need the SegmentBuffer anymore
             self._start_time += datetime.timedelta(seconds=segment_duration)
             # Reinitialize
             self.reset(packet.dts)
         else:
             # For the last part, these will get set again elsewhere so we can skip
             # setting them here.
+            self._memory_file.release()
             self._memory_file_pos = self._memory_file.tell()
             self._part_start_dts = adjusted_dts
         self._part_has_keyframe = False
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
+from dataclasses import asdict
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,9 +21,11 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
+    HassJobType,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -34,7 +38,12 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    import_profile,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -43,6 +52,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_event,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -82,6 +92,7 @@ def async_register_commands(
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
+    async_reg(hass, handle_get_connection_stats)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
@@ -367,6 +378,84 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntityChangeCoalescer:
+    """Merge the entity changes of a subscription within a time window.
+
+    Only the events of the first and the last change of each entity
+    are kept, so an entity changing many times within the window is
+    sent as a single diff.
+    """
+
+    __slots__ = (
+        "_cancel_flush",
+        "_change_counts",
+        "_changes",
+        "_connection",
+        "_message_id",
+        "_window",
+    )
+
+    def __init__(
+        self, connection: ActiveConnection, message_id: int, window: float
+    ) -> None:
+        """Initialize the coalescer."""
+        self._connection = connection
+        self._message_id = message_id
+        self._window = window
+        self._changes: dict[
+            str,
+            tuple[Event[EventStateChangedData], Event[EventStateChangedData]],
+        ] = {}
+        self._change_counts: dict[str, int] = {}
+        self._cancel_flush: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state changed event to be sent when the window ends."""
+        entity_id = event.data["entity_id"]
+        if (change := self._changes.get(entity_id)) is None:
+            self._changes[entity_id] = (event, event)
+            self._change_counts[entity_id] = 1
+        else:
+            self._changes[entity_id] = (change[0], event)
+            self._change_counts[entity_id] += 1
+        if self._cancel_flush is None:
+            self._cancel_flush = self._connection.hass.loop.call_later(
+                self._window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged changes."""
+        self._cancel_flush = None
+        changes = self._changes
+        change_counts = self._change_counts
+        self._changes = {}
+        self._change_counts = {}
+        stats = self._connection.stats
+        if message := messages.coalesced_state_diff_message(self._message_id, changes):
+            self._connection.send_message(message)
+            stats.messages_coalesced += sum(change_counts.values()) - 1
+            stats.bytes_saved += max(
+                messages.separate_state_diff_messages_size(
+                    self._message_id, changes, change_counts
+                )
+                - len(message),
+                0,
+            )
+        else:
+            stats.messages_coalesced += sum(change_counts.values())
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._cancel_flush is not None:
+            self._cancel_flush.cancel()
+            self._cancel_flush = None
+        self._changes.clear()
+        self._change_counts.clear()
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
@@ -374,6 +463,7 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
+    coalescer: _EntityChangeCoalescer | None,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -391,14 +481,27 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
+    if coalescer is not None:
+        coalescer.async_add(event)
+        return
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+@callback
+def _async_unsub_coalesced(
+    unsub: CALLBACK_TYPE, coalescer: _EntityChangeCoalescer
+) -> None:
+    """Unsubscribe a coalesced subscription and drop its pending changes."""
+    unsub()
+    coalescer.async_cancel()
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_window_ms"): vol.All(int, vol.Range(min=50, max=250)),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,17 +518,32 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    coalescer: _EntityChangeCoalescer | None = None
+    if window_ms := msg.get("coalesce_window_ms"):
+        coalescer = _EntityChangeCoalescer(connection, msg_id, window_ms / 1000)
+    forward_entity_changes = partial(
+        _forward_entity_changes,
+        connection.send_message,
+        entity_ids,
+        entity_filter,
+        connection.user,
+        message_id_as_bytes,
+        coalescer,
     )
+    unsub: CALLBACK_TYPE
+    if entity_ids:
+        # Only run for changes of the subscribed entities
+        unsub = async_track_state_change_event(
+            hass, entity_ids, forward_entity_changes, HassJobType.Callback
+        )
+    else:
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, forward_entity_changes)
+    if coalescer is not None:
+        connection.subscriptions[msg_id] = partial(
+            _async_unsub_coalesced, unsub, coalescer
+        )
+    else:
+        connection.subscriptions[msg_id] = unsub
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -561,10 +679,16 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    # Seconds the integrations took to import ahead of their setup
+    preloaded = import_profile.async_get(hass).preloaded
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": seconds}
+            {
+                "domain": integration,
+                "seconds": seconds,
+                "preload_seconds": preloaded.get(integration, 0.0),
+            }
             for integration, seconds in async_get_setup_timings(hass).items()
         ],
     )
@@ -579,6 +703,15 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_connection_stats"})
+def handle_get_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get connection stats command."""
+    connection.send_result(msg["id"], asdict(connection.stats))
+
+
 @lru_cache
 def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
     """Return a cached template."""
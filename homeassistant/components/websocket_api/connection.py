@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -36,6 +37,16 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+@dataclass(slots=True)
+class ConnectionStats:
+    """Statistics of an active websocket client connection."""
+
+    # Messages that were merged into another message instead of being sent
+    messages_coalesced: int = 0
+    # Estimated bytes not sent because messages were merged
+    bytes_saved: int = 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -48,6 +59,7 @@ class ActiveConnection:
         "logger",
         "refresh_token_id",
         "send_message",
+        "stats",
         "subscriptions",
         "supported_features",
         "user",
@@ -75,6 +87,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.stats = ConnectionStats()
         current_connection.set(self)
 
     def __repr__(self) -> str:
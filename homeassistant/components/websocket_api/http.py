@@ -535,6 +535,13 @@ class WebSocketHandler:
                     )
 
                 if connection is not None:
+                    if (stats := connection.stats).messages_coalesced:
+                        logger.debug(
+                            "%s: Coalesced %s messages saving %s bytes",
+                            self.description,
+                            stats.messages_coalesced,
+                            stats.bytes_saved,
+                        )
                     hass.data[DATA_CONNECTIONS] -= 1
                     self._connection = None
 
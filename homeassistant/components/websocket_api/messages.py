@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -118,26 +119,18 @@ def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_event_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
-    )
+    return b"".join((_partial_cached_event_message(event), message_id_as_bytes, b"}"))
 
 
 @lru_cache(maxsize=128)
 def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which appended
-    in cached_event_message.
+    The message is constructed up to the id which is
+    appended in cached_event_message.
     """
-    return (
+    return _message_prefix(
         _message_to_json_bytes_or_none({"type": "event", "event": event.json_fragment})
-        or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
@@ -153,12 +146,7 @@ def cached_state_diff_message(
     we can avoid serializing the same data for each connection.
     """
     return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
+        (_partial_cached_state_diff_message(event), message_id_as_bytes, b"}")
     )
 
 
@@ -166,17 +154,25 @@ def cached_state_diff_message(
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed up to the id which is
+    appended in cached_state_diff_message.
     """
-    return (
+    return _message_prefix(
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
         )
-        or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
+def _message_prefix(message: bytes | None) -> bytes:
+    """Return a serialized message without its closing brace, ready for the id.
+
+    The prefix is shared by every connection, which only
+    has to append its own id and the closing brace.
+    """
+    return b"".join(((message or INVALID_JSON_PARTIAL_MESSAGE)[:-1], b',"id":'))
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -199,6 +195,101 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def coalesced_state_diff_message(
+    iden: int,
+    changes: Mapping[
+        str, tuple[Event[EventStateChangedData], Event[EventStateChangedData]]
+    ],
+) -> bytes | None:
+    """Return one event message with the changes of many entities.
+
+    Each entity maps to the events of its first and last change, so
+    only the difference between the state before the first change and
+    the state after the last change is sent. The serialized change of
+    each entity is shared by all connections that merged the same events.
+    """
+    sections: dict[str, list[bytes]] = {}
+    for first_event, last_event in changes.values():
+        if (change := _cached_entity_change(first_event, last_event)) is not None:
+            sections.setdefault(change[0], []).append(change[1])
+    if not sections:
+        return None
+    parts: list[bytes] = []
+    for kind, (start, stop) in (
+        (ENTITY_EVENT_ADD, (b'"a":{', b"}")),
+        (ENTITY_EVENT_CHANGE, (b'"c":{', b"}")),
+        (ENTITY_EVENT_REMOVE, (b'"r":[', b"]")),
+    ):
+        if fragments := sections.get(kind):
+            parts.append(b"".join((start, b",".join(fragments), stop)))
+    return b"".join(
+        (
+            b'{"id":',
+            str(iden).encode(),
+            b',"type":"event","event":{',
+            b",".join(parts),
+            b"}}",
+        )
+    )
+
+
+def separate_state_diff_messages_size(
+    iden: int,
+    changes: Mapping[
+        str, tuple[Event[EventStateChangedData], Event[EventStateChangedData]]
+    ],
+    counts: Mapping[str, int],
+) -> int:
+    """Estimate the size of the changes when sent as one message per event.
+
+    Each event of an entity is assumed to be the size of the merged
+    change of the entity, which is already serialized and cached for
+    the coalesced message, so no event has to be serialized again.
+    """
+    # {"type":"event","event":{"c":{…}},"id":…}
+    envelope = len(str(iden)) + 39
+    return sum(
+        counts[entity_id] * (envelope + len(change[1]))
+        for entity_id, (first_event, last_event) in changes.items()
+        if (change := _cached_entity_change(first_event, last_event)) is not None
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_entity_change(
+    first_event: Event[EventStateChangedData],
+    last_event: Event[EventStateChangedData],
+) -> tuple[str, bytes] | None:
+    """Cache and serialize the change of an entity between two events.
+
+    Returns the kind of change and the json fragment to add to the
+    section of that kind, or None if there is nothing to send.
+    """
+    entity_id = last_event.data["entity_id"]
+    old_state = first_event.data["old_state"]
+    if (new_state := last_event.data["new_state"]) is None:
+        if old_state is None:
+            # Added and removed again
+            return None
+        return ENTITY_EVENT_REMOVE, json_bytes(entity_id)
+    value: CompressedState | dict[str, dict[str, Any]]
+    if old_state is None:
+        kind, value = ENTITY_EVENT_ADD, new_state.as_compressed_state
+    else:
+        kind, value = ENTITY_EVENT_CHANGE, _state_diff(old_state, new_state)
+    if (fragment := _message_to_json_bytes_or_none({entity_id: value})) is None:
+        return None
+    # Strip the braces to get the "entity_id":value member
+    return kind, fragment[1:-1]
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the difference between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +326,7 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
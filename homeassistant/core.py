@@ -41,6 +41,7 @@ from typing import (
     overload,
 )
 
+from lru import LRU
 from propcache.api import cached_property, under_cached_property
 import voluptuous as vol
 
@@ -198,6 +199,15 @@ EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_STATE_REPORTED,
 }
 
+# How many attribute mappings and values the state machine shares between states
+INTERNED_ATTRIBUTES_SIZE = 1024
+INTERNED_ATTRIBUTE_VALUES_SIZE = 4096
+# Longer strings are rarely shared between states
+INTERNED_ATTRIBUTE_VALUE_MAX_LENGTH = 64
+# Only mappings of these value types are shared, equal containers like (30, 100)
+# and (30.0, 100.0) could hold values of different types
+_INTERNED_MAPPING_VALUE_TYPES = frozenset((str, int, float, bool, type(None)))
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -1420,6 +1430,10 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+type _ListenerProfilerType = Callable[
+    [EventType[Any] | str, HassJob[..., Any], float], None
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1459,7 +1473,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listener_profiler",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1469,6 +1489,7 @@ class EventBus:
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
+        self._listener_profiler: _ListenerProfilerType | None = None
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
 
@@ -1477,6 +1498,21 @@ class EventBus:
         """Handle logging change."""
         self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
+    @callback
+    def async_set_listener_profiler(
+        self, listener_profiler: _ListenerProfilerType | None
+    ) -> None:
+        """Set a callback to pass the time each listener took to run.
+
+        The callback is called with the event type, the listener job
+        and the seconds the job took to run in the event loop. Coroutine
+        listeners are only timed until they first suspend. Pass None to
+        stop timing the listeners.
+
+        This method must be run in the event loop.
+        """
+        self._listener_profiler = listener_profiler
+
     @callback
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
@@ -1555,6 +1591,7 @@ class EventBus:
             match_all_listeners = EMPTY_LIST
 
         event: Event[_DataT] | None = None
+        listener_profiler = self._listener_profiler
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
                 try:
@@ -1573,11 +1610,31 @@ class EventBus:
                     context,
                 )
 
+            if listener_profiler is not None:
+                self._async_run_profiled_job(listener_profiler, event_type, job, event)
+                continue
+
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_run_profiled_job(
+        self,
+        listener_profiler: _ListenerProfilerType,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event: Event[_DataT],
+    ) -> None:
+        """Run a listener job and pass the time it took to the profiler."""
+        start = time.perf_counter()
+        try:
+            self._hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        listener_profiler(event_type, job, time.perf_counter() - start)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1768,13 +1825,15 @@ class State:
 
     __slots__ = (
         "_cache",
+        "_last_changed",
+        "_last_changed_timestamp",
+        "_last_reported",
+        "_last_reported_timestamp",
+        "_last_updated",
         "attributes",
         "context",
         "domain",
         "entity_id",
-        "last_changed",
-        "last_reported",
-        "last_updated",
         "last_updated_timestamp",
         "object_id",
         "state",
@@ -1793,8 +1852,13 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        The datetimes may be left out when their timestamps are passed,
+        in which case they are only created when they are accessed.
+        """
         self._cache: dict[str, Any] = {}
         state = str(state)
 
@@ -1815,26 +1879,44 @@ class State:
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
         # The recorder or the websocket_api will always call the timestamps,
         # so we will set the timestamp values here to avoid the overhead of
         # the function call in the property we know will always be called.
-        last_updated = self.last_updated
+        if last_updated is None and last_updated_timestamp:
+            # async_set passes only the timestamps as most states are
+            # never asked for their datetimes before they are replaced
+            self._last_updated = None
+            self.last_updated_timestamp = last_updated_timestamp
+            self._last_reported = last_reported
+            self._last_reported_timestamp = (
+                None if last_reported else last_updated_timestamp
+            )
+            self._last_changed = last_changed
+            if last_changed_timestamp is None and last_changed is None:
+                last_changed_timestamp = last_updated_timestamp
+            self._last_changed_timestamp = last_changed_timestamp
+            return
+        last_reported = last_reported or dt_util.utcnow()
+        last_updated = last_updated or last_reported
+        last_changed = last_changed or last_updated
         if not last_updated_timestamp:
             last_updated_timestamp = last_updated.timestamp()
+        self._last_reported = last_reported
+        self._last_updated = last_updated
+        self._last_changed = last_changed
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
+        self._last_changed_timestamp = (
+            last_updated_timestamp if last_changed == last_updated else None
+        )
         # If last_reported is the same as last_updated async_set will pass
         # the same datetime object for both values so we can use an identity
         # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+        self._last_reported_timestamp = (
+            last_updated_timestamp if last_reported is last_updated else None
+        )
 
     @under_cached_property
     def name(self) -> str:
@@ -1843,15 +1925,73 @@ class State:
             "_", " "
         )
 
-    @under_cached_property
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        if (last_changed := self._last_changed) is None:
+            last_changed = self._last_changed = dt_util.utc_from_timestamp(
+                self._last_changed_timestamp  # type: ignore[arg-type]
+            )
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self._last_changed = value
+        self._last_changed_timestamp = None
+
+    @property
     def last_changed_timestamp(self) -> float:
         """Timestamp of last change."""
-        return self.last_changed.timestamp()
+        if (last_changed_timestamp := self._last_changed_timestamp) is None:
+            last_changed_timestamp = self._last_changed_timestamp = (
+                self.last_changed.timestamp()
+            )
+        return last_changed_timestamp
 
-    @under_cached_property
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        if (last_reported := self._last_reported) is None:
+            last_reported = self._last_reported = dt_util.utc_from_timestamp(
+                self._last_reported_timestamp  # type: ignore[arg-type]
+            )
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self._last_reported = value
+        self._last_reported_timestamp = None
+
+    @property
     def last_reported_timestamp(self) -> float:
         """Timestamp of last report."""
-        return self.last_reported.timestamp()
+        if (last_reported_timestamp := self._last_reported_timestamp) is None:
+            last_reported_timestamp = self._last_reported_timestamp = (
+                self.last_reported.timestamp()
+            )
+        return last_reported_timestamp
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        if (last_updated := self._last_updated) is None:
+            last_updated = self._last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self._last_updated = value
+        self.last_updated_timestamp = value.timestamp()
+
+    def _async_report(self, timestamp: float) -> None:
+        """Mark the state as reported again without creating a datetime."""
+        self._last_reported = None
+        self._last_reported_timestamp = timestamp
 
     @under_cached_property
     def _as_dict(self) -> dict[str, Any]:
@@ -1861,11 +2001,11 @@ class State:
         as it will mutate the cached version.
         """
         last_changed_isoformat = self.last_changed.isoformat()
-        if self.last_changed == self.last_updated:
+        if self.last_changed_timestamp == self.last_updated_timestamp:
             last_updated_isoformat = last_changed_isoformat
         else:
             last_updated_isoformat = self.last_updated.isoformat()
-        if self.last_changed == self.last_reported:
+        if self.last_changed_timestamp == self.last_reported_timestamp:
             last_reported_isoformat = last_changed_isoformat
         else:
             last_reported_isoformat = self.last_reported.isoformat()
@@ -1941,7 +2081,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -2063,10 +2203,75 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class _AttributesInterner:
+    """Share equal attribute mappings and values between states.
+
+    Integrations usually build a new attributes dict for every state
+    they write, and the ones parsing a payload create new strings for
+    the same units, device classes and modes every time. States written
+    with equal attributes share the same read only mapping, and the
+    keys and short string values are shared between all mappings.
+    """
+
+    __slots__ = ("_mappings", "_values")
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._mappings: LRU[int, ReadOnlyDict[str, Any]] = LRU(INTERNED_ATTRIBUTES_SIZE)
+        self._values: LRU[str, str] = LRU(INTERNED_ATTRIBUTE_VALUES_SIZE)
+
+    def intern(self, attributes: Mapping[str, Any]) -> ReadOnlyDict[str, Any]:
+        """Return a shared read only mapping equal to the attributes."""
+        key: int | None = None
+        value_types = tuple(map(type, attributes.values()))
+        if _INTERNED_MAPPING_VALUE_TYPES.issuperset(value_types):
+            # Equal values of different types like 1 and True must not
+            # share a mapping so the types are part of the key
+            key = hash((tuple(attributes.items()), value_types))
+            if (
+                (interned := self._mappings.get(key)) is not None
+                and interned == attributes
+                and tuple(map(type, interned.values())) == value_types
+            ):
+                return interned
+        # Mappings with other values like lists or tuples only share their
+        # keys and strings
+        if type(attributes) is ReadOnlyDict:
+            interned = attributes
+        else:
+            values = self._values
+            values_get = values.get
+            max_length = INTERNED_ATTRIBUTE_VALUE_MAX_LENGTH
+            mapping: dict[str, Any] = {}
+            for attr_key, attr_value in attributes.items():
+                if type(attr_key) is str:
+                    if (interned_key := values_get(attr_key)) is None:
+                        values[attr_key] = attr_key
+                    else:
+                        attr_key = interned_key
+                if type(attr_value) is str and len(attr_value) <= max_length:
+                    if (interned_value := values_get(attr_value)) is None:
+                        values[attr_value] = attr_value
+                    else:
+                        attr_value = interned_value
+                mapping[attr_key] = attr_value
+            interned = ReadOnlyDict(mapping)
+        if key is not None:
+            self._mappings[key] = interned
+        return interned
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_attributes_interner",
+        "_bus",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2282,7 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._attributes_interner = _AttributesInterner()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2307,30 +2513,24 @@ class StateMachine:
         # python 3.11+ has near zero overhead for
         # try when it does not raise an exception.
         old_state: State | None
+        last_changed: datetime.datetime | None = None
+        last_changed_timestamp: float | None = None
         try:
             old_state = self._states_data[entity_id]
         except KeyError:
             old_state = None
             same_state = False
             same_attr = False
-            last_changed = None
         else:
+            # async_set lowercases the entity id into a new string every
+            # time so the one of the current state is shared instead
+            entity_id = old_state.entity_id
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+            if same_state:
+                # Share the datetime of the last change if it was created
+                last_changed = old_state._last_changed  # noqa: SLF001
+                last_changed_timestamp = old_state.last_changed_timestamp
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2338,8 +2538,7 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            old_state._async_report(timestamp)  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2357,7 +2556,12 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._attributes_interner.intern(attributes or {})
 
+        # The datetimes are created from the timestamps when they are accessed
+        # since it is much cheaper than creating them for every state.
+        #
         # This is intentionally called with positional only arguments for performance
         # reasons
         state = State(
@@ -2365,12 +2569,13 @@ class StateMachine:
             new_state,
             attributes,
             last_changed,
-            now,
-            now,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
         if old_state is not None:
             old_state.expire()
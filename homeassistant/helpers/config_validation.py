@@ -729,7 +729,7 @@ def template(value: Any | None) -> template_helper.Template:
     template_value = template_helper.Template(str(value), hass)
 
     try:
-        template_value.ensure_valid()
+        template_value.ensure_valid(persist_code=True)
     except TemplateError as ex:
         raise vol.Invalid(f"invalid template ({ex})") from ex
     return template_value
@@ -758,7 +758,7 @@ def dynamic_template(value: Any | None) -> template_helper.Template:
     template_value = template_helper.Template(str(value), hass)
 
     try:
-        template_value.ensure_valid()
+        template_value.ensure_valid(persist_code=True)
     except TemplateError as ex:
         raise vol.Invalid(f"invalid template ({ex})") from ex
     return template_value
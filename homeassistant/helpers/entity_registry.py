@@ -549,13 +549,20 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains nine additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
+    - effective area_id -> dict[key, True]
     - label -> dict[key, True]
+    - category_id -> dict[key, True]
+    - platform -> dict[key, True]
+
+    The effective area of an entry is its own area, or the area of its
+    device when it has no area of its own. It is only indexed once the
+    areas of the devices have been set with set_device_area_ids.
     """
 
     def __init__(self) -> None:
@@ -566,7 +573,22 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._effective_area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._categories_index: RegistryIndexType = defaultdict(dict)
+        self._platform_index: RegistryIndexType = defaultdict(dict)
+        # device_id -> area_id of the devices which are in an area
+        self._device_area_ids: dict[str, str] | None = None
+
+    def _effective_area_id(self, entry: RegistryEntry) -> str | None:
+        """Return the area of an entry or of its device."""
+        if (
+            (area_id := entry.area_id) is None
+            and (device_id := entry.device_id) is not None
+            and self._device_area_ids is not None
+        ):
+            return self._device_area_ids.get(device_id)
+        return area_id
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -580,8 +602,15 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._device_id_index[device_id][key] = True
         if (area_id := entry.area_id) is not None:
             self._area_id_index[area_id][key] = True
+        if self._device_area_ids is not None and (
+            effective_area_id := self._effective_area_id(entry)
+        ):
+            self._effective_area_id_index[effective_area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
+        for category_id in entry.categories.values():
+            self._categories_index[category_id][key] = True
+        self._platform_index[entry.platform][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -596,9 +625,54 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._unindex_entry_value(key, device_id, self._device_id_index)
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
+        if self._device_area_ids is not None and (
+            effective_area_id := self._effective_area_id(entry)
+        ):
+            self._unindex_entry_value(
+                key, effective_area_id, self._effective_area_id_index
+            )
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        if categories := entry.categories:
+            # The same category id may be set in more than one scope
+            for category_id in set(categories.values()):
+                self._unindex_entry_value(key, category_id, self._categories_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
+
+    @property
+    def has_device_area_ids(self) -> bool:
+        """Return if the areas of the devices have been set."""
+        return self._device_area_ids is not None
+
+    def set_device_area_ids(self, device_area_ids: dict[str, str]) -> None:
+        """Set the areas of the devices and index the effective areas."""
+        self._device_area_ids = device_area_ids
+        effective_area_id_index = self._effective_area_id_index
+        effective_area_id_index.clear()
+        for key, entry in self.data.items():
+            if effective_area_id := self._effective_area_id(entry):
+                effective_area_id_index[effective_area_id][key] = True
+
+    def set_device_area_id(self, device_id: str, area_id: str | None) -> None:
+        """Move the entries of a device without an area to its new area."""
+        if (device_area_ids := self._device_area_ids) is None:
+            return
+        if (old_area_id := device_area_ids.get(device_id)) == area_id:
+            return
+        if area_id is None:
+            del device_area_ids[device_id]
+        else:
+            device_area_ids[device_id] = area_id
+        data = self.data
+        effective_area_id_index = self._effective_area_id_index
+        for key in self._device_id_index.get(device_id, ()):
+            if data[key].area_id is not None:
+                continue
+            if old_area_id is not None:
+                self._unindex_entry_value(key, old_area_id, effective_area_id_index)
+            if area_id is not None:
+                effective_area_id_index[area_id][key] = True
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -642,6 +716,30 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entries_for_effective_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area, including entries inheriting it from their device.
+
+        The areas of the devices must have been set with set_device_area_ids.
+        """
+        data = self.data
+        return [data[key] for key in self._effective_area_id_index.get(area_id, ())]
+
+    def get_entries_for_category(
+        self, scope: str, category_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for category in a scope."""
+        data = self.data
+        return [
+            entry
+            for key in self._categories_index.get(category_id, ())
+            if (entry := data[key]).categories.get(scope) == category_id
+        ]
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -724,6 +822,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journaled=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -977,6 +1076,8 @@ class EntityRegistry(BaseRegistry):
 
         Disable entities in the registry that are associated to a device when
         the device is disabled.
+
+        Track the area of the device for the effective areas of its entities.
         """
         if event.data["action"] == "remove":
             entities = async_entries_for_device(
@@ -984,10 +1085,7 @@ class EntityRegistry(BaseRegistry):
             )
             for entity in entities:
                 self.async_remove(entity.entity_id)
-            return
-
-        if event.data["action"] != "update":
-            # Ignore "create" action
+            self.entities.set_device_area_id(event.data["device_id"], None)
             return
 
         device_registry = dr.async_get(self.hass)
@@ -998,6 +1096,14 @@ class EntityRegistry(BaseRegistry):
         if not device:
             return
 
+        if event.data["action"] != "update":
+            # Only track the area of a created device
+            self.entities.set_device_area_id(device.id, device.area_id)
+            return
+
+        if "area_id" in event.data["changes"]:
+            self.entities.set_device_area_id(device.id, device.area_id)
+
         # Remove entities which belong to config entries no longer associated with the
         # device
         entities = async_entries_for_device(
@@ -1385,13 +1491,10 @@ class EntityRegistry(BaseRegistry):
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if (
-                existing_category_id := entry.categories.get(scope)
-            ) and category_id == existing_category_id:
-                categories = entry.categories.copy()
-                del categories[scope]
-                self.async_update_entity(entity_id, categories=categories)
+        for entry in self.entities.get_entries_for_category(scope, category_id):
+            categories = entry.categories.copy()
+            del categories[scope]
+            self.async_update_entity(entry.entity_id, categories=categories)
 
     @callback
     def async_clear_label_id(self, label_id: str) -> None:
@@ -1484,14 +1587,38 @@ def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a category in a scope."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if (
-            (existing_category_id := entry.categories.get(scope))
-            and category_id == existing_category_id
+    return registry.entities.get_entries_for_category(scope, category_id)
+
+
+@callback
+def async_entries_for_effective_area(
+    registry: EntityRegistry, area_id: str
+) -> list[RegistryEntry]:
+    """Return entries in an area, directly or through their device.
+
+    Entries with an area of their own are not in the area of their device.
+    """
+    entities = registry.entities
+    if not entities.has_device_area_ids:
+        # The device registry may load after the entity registry, so the
+        # areas of the devices are only looked up once they are needed
+        devices = dr.async_get(registry.hass).devices
+        entities.set_device_area_ids(
+            {
+                device.id: device.area_id
+                for device in devices.values()
+                if device.area_id is not None
+            }
         )
-    ]
+    return entities.get_entries_for_effective_area_id(area_id)
+
+
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.entities.get_entries_for_platform(platform)
 
 
 @callback
@@ -63,6 +63,9 @@ _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = Hass
 _TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
     "track_state_report_data"
 )
+_TRACK_STATE_CHANGE_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
+    HassKey("track_state_change_domain_data")
+)
 _TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
     HassKey("track_state_added_domain_data")
 )
@@ -622,6 +625,69 @@ def _async_dispatch_domain_event(
             )
 
 
+@callback
+def _async_dispatch_domain_event_soon(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event: Event[EventStateChangedData],
+) -> None:
+    """Dispatch to domain listeners soon to ensure one event loop runs first."""
+    hass.loop.call_soon(_async_dispatch_domain_event, hass, callbacks, event)
+
+
+@callback
+def _async_domain_changed_filter(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event_data: EventStateChangedData,
+) -> bool:
+    """Filter state changes by domain."""
+    return split_entity_id(event_data["entity_id"])[0] in callbacks
+
+
+_KEYED_TRACK_STATE_CHANGE_DOMAIN = _KeyedEventTracker(
+    key=_TRACK_STATE_CHANGE_DOMAIN_DATA,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_domain_event_soon,
+    filter_callable=_async_domain_changed_filter,
+)
+
+
+@bind_hass
+def async_track_state_change_domain_event(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None = None,
+) -> CALLBACK_TYPE:
+    """Track state change events indexed by domain.
+
+    Like async_track_state_change_event, but passes the state change
+    events of every entity of the domains, including the entities
+    that are added to or removed from them.
+    The passed in domains will be automatically lower cased.
+    """
+    if not (domains := _async_string_to_lower_list(domains)):
+        return _remove_empty_listener
+    return _async_track_state_change_domain_event(hass, domains, action, job_type)
+
+
+@bind_hass
+def _async_track_state_change_domain_event(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """Faster version of async_track_state_change_domain_event.
+
+    The passed in domains will not be automatically lower cased.
+    """
+    return _async_track_event(
+        _KEYED_TRACK_STATE_CHANGE_DOMAIN, hass, domains, action, job_type
+    )
+
+
 @callback
 def _async_domain_added_filter(
     hass: HomeAssistant,
@@ -816,8 +882,12 @@ class _TrackStateChangeFiltered:
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            # The domain listener already sees the changes of these entities
+            entities = {
+                entity_id
+                for entity_id in entities
+                if split_entity_id(entity_id)[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -827,21 +897,13 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action, self._action_as_hassjob.job_type
         )
 
-    @callback
-    def _state_added(self, event: Event[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added, HassJobType.Callback
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_domain_event(
+            self.hass, domains, self._action, self._action_as_hassjob.job_type
         )
 
     @callback
@@ -1003,12 +1065,19 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # Renders done because of a state change, and renders skipped because
+        # none of the state fields the template read had changed
+        self.renders = 0
+        self.renders_avoided = 0
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
-        return f"<TrackTemplateResultInfo {self._info}>"
+        return (
+            f"<TrackTemplateResultInfo {self._info}"
+            f" renders={self.renders} renders_avoided={self.renders_avoided}>"
+        )
 
     def async_setup(
         self,
@@ -1147,6 +1216,13 @@ class TrackTemplateResultInfo:
             info = self._info[template]
 
             if not _event_triggers_rerender(event, info):
+                if info.filter(event.data["entity_id"]):
+                    self.renders_avoided += 1
+                    _LOGGER.debug(
+                        "Template update %s skipped, no field it read changed: %s",
+                        template.template,
+                        event,
+                    )
                 return False
 
             had_timer = self._rate_limit.async_has_timer(template)
@@ -1168,6 +1244,8 @@ class TrackTemplateResultInfo:
                 event,
             )
 
+        if event:
+            self.renders += 1
         self._rate_limit.async_triggered(template, now)
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
@@ -1968,11 +2046,17 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        return (
+            old_state is None
+            or new_state is None
+            or info.inputs_changed(entity_id, old_state, new_state)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -0,0 +1,153 @@
+"""Preload integrations using the imports recorded at the last startup."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+import time
+from typing import TypedDict
+
+from homeassistant import requirements
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import Integration, async_get_import_timings
+from homeassistant.setup import DATA_SETUP
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+from .storage import Store
+
+DATA_IMPORT_PROFILE: HassKey[ImportProfile] = HassKey("import_profile")
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.import_profile"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class IntegrationImportProfile(TypedDict):
+    """Seconds an integration and its platforms took to import."""
+
+    component: float
+    platforms: dict[str, float]
+
+
+class ImportProfileData(TypedDict):
+    """Imports of the last startup and the version that made them."""
+
+    ha_version: str
+    integrations: dict[str, IntegrationImportProfile]
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the import profile of the last startup."""
+    await async_get(hass).async_load()
+
+
+@callback
+@singleton(DATA_IMPORT_PROFILE)
+def async_get(hass: HomeAssistant) -> ImportProfile:
+    """Get the import profile helper."""
+    return ImportProfile(hass)
+
+
+class ImportProfile:
+    """Record the imports of a startup and preload them on the next one.
+
+    The single import executor imports one module at a time, so the
+    modules of the integrations set up later would otherwise only start
+    importing once their stage asks for them. Preloading them in the
+    order of the stages keeps the executor busy while earlier stages
+    are still setting up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the import profile."""
+        self.hass = hass
+        self._store = Store[ImportProfileData](
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        self.last_startup: dict[str, IntegrationImportProfile] = {}
+        # Seconds each integration took to import ahead of its setup,
+        # including the wait for the import executor
+        self.preloaded: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        """Load the import profile and save the new one once started."""
+        # The imports of another version may have changed
+        if (data := await self._store.async_load()) and data.get(
+            "ha_version"
+        ) == __version__:
+            self.last_startup = data["integrations"]
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_schedule_save
+        )
+
+    @callback
+    def _async_schedule_save(self, _event: Event) -> None:
+        """Save the imports of this startup."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> ImportProfileData:
+        """Return the imports of this startup to store."""
+        integrations: dict[str, IntegrationImportProfile] = {}
+        for domain, timings in async_get_import_timings(self.hass).items():
+            integrations[domain] = {
+                "component": timings.get(None, 0.0),
+                "platforms": {
+                    name: took for name, took in timings.items() if name is not None
+                },
+            }
+        return {"ha_version": __version__, "integrations": integrations}
+
+    @callback
+    def async_preload(self, integrations: Iterable[Integration]) -> None:
+        """Preload the integrations in the background in the given order."""
+        to_preload = [
+            integration
+            for integration in integrations
+            if integration.import_executor and integration.domain in self.last_startup
+        ]
+        if to_preload:
+            self.hass.async_create_background_task(
+                self._async_preload(to_preload), "preload imports", eager_start=False
+            )
+
+    async def _async_preload(self, integrations: list[Integration]) -> None:
+        """Import the integrations one at a time.
+
+        Waiting for each import leaves room in the executor queue for
+        imports requested by integrations that are setting up.
+        """
+        hass = self.hass
+        setup_tasks = hass.data.setdefault(DATA_SETUP, {})
+        for integration in integrations:
+            domain = integration.domain
+            if domain in setup_tasks:
+                # The setup already caught up and imports it itself
+                continue
+            profile = self.last_startup[domain]
+            try:
+                # Install the requirements first so the modules import
+                # the versions of the libraries the setup will use
+                await requirements.async_get_integration_with_requirements(hass, domain)
+                if domain in setup_tasks:
+                    continue
+                start = time.perf_counter()
+                await integration.async_get_component()
+                if platforms := integration.platforms_exists(profile["platforms"]):
+                    await integration.async_get_platforms(platforms)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Unable to preload %s: %s", domain, err)
+                continue
+            self.preloaded[domain] = time.perf_counter() - start
+
+    @callback
+    def async_preload_time(self) -> float:
+        """Return the seconds integrations took to import ahead of their setup.
+
+        This includes the time the imports waited for the import executor.
+        """
+        return sum(self.preloaded.values())
@@ -0,0 +1,166 @@
+"""Profile the time the event bus listeners take to run."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import functools
+import math
+from typing import Any, TypedDict
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.util.event_type import EventType
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_LISTENER_PROFILE: HassKey[ListenerProfile] = HassKey("listener_profile")
+
+# Durations kept per listener to compute the 99th percentile
+MAX_SAMPLES = 1000
+
+_COMPONENTS_PREFIX = "homeassistant.components."
+_CUSTOM_COMPONENTS_PREFIX = "custom_components."
+
+
+class ListenerStats(TypedDict):
+    """Time spent running a listener."""
+
+    event_type: str
+    integration: str
+    listener: str
+    count: int
+    total: float
+    p99: float
+
+
+class IntegrationStats(TypedDict):
+    """Time spent running the listeners of an integration."""
+
+    count: int
+    total: float
+    p99: float
+
+
+@dataclass(slots=True)
+class _ListenerRuns:
+    """Runs of a listener."""
+
+    event_type: str
+    integration: str
+    listener: str
+    count: int = 0
+    total: float = 0.0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=MAX_SAMPLES))
+
+
+def _p99(samples: Iterable[float]) -> float:
+    """Return the 99th percentile of the samples."""
+    if not (ordered := sorted(samples)):
+        return 0.0
+    return ordered[math.ceil(len(ordered) * 0.99) - 1]
+
+
+def _job_owner(job: HassJob[..., Any]) -> tuple[str, str]:
+    """Return the integration owning a job and the name of its target.
+
+    Jobs outside of the integrations are owned by their top level
+    package, which is the homeassistant domain for the core.
+    """
+    target = job.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or ""
+    name = getattr(target, "__qualname__", None) or type(target).__qualname__
+    if module.startswith(_COMPONENTS_PREFIX):
+        integration = module.split(".")[2]
+    elif module.startswith(_CUSTOM_COMPONENTS_PREFIX):
+        integration = module.split(".")[1]
+    else:
+        integration = module.partition(".")[0] or "unknown"
+    return integration, f"{module}.{name}"
+
+
+@callback
+@singleton(DATA_LISTENER_PROFILE)
+def async_get(hass: HomeAssistant) -> ListenerProfile:
+    """Get the listener profile."""
+    return ListenerProfile(hass)
+
+
+class ListenerProfile:
+    """Record the time each event bus listener takes to run.
+
+    The event bus only times its listeners while the profile is
+    running, so the profile costs nothing when it is stopped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the listener profile."""
+        self.hass = hass
+        self.running = False
+        self._runs: dict[
+            tuple[EventType[Any] | str, HassJob[..., Any]], _ListenerRuns
+        ] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start timing the listeners, discarding the previous runs."""
+        self._runs.clear()
+        self.running = True
+        self.hass.bus.async_set_listener_profiler(self._async_record)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop timing the listeners, keeping the runs so far."""
+        self.running = False
+        self.hass.bus.async_set_listener_profiler(None)
+
+    @callback
+    def _async_record(
+        self, event_type: EventType[Any] | str, job: HassJob[..., Any], took: float
+    ) -> None:
+        """Record a run of a listener."""
+        if (runs := self._runs.get((event_type, job))) is None:
+            integration, listener = _job_owner(job)
+            runs = self._runs[(event_type, job)] = _ListenerRuns(
+                str(event_type), integration, listener
+            )
+        runs.count += 1
+        runs.total += took
+        runs.samples.append(took)
+
+    @callback
+    def async_listener_stats(self) -> list[ListenerStats]:
+        """Return the stats of each listener, slowest in total first."""
+        return [
+            {
+                "event_type": runs.event_type,
+                "integration": runs.integration,
+                "listener": runs.listener,
+                "count": runs.count,
+                "total": runs.total,
+                "p99": _p99(runs.samples),
+            }
+            for runs in sorted(
+                self._runs.values(), key=lambda runs: runs.total, reverse=True
+            )
+        ]
+
+    @callback
+    def async_integration_stats(self) -> dict[str, IntegrationStats]:
+        """Return the stats of the listeners of each integration."""
+        by_integration: dict[str, list[_ListenerRuns]] = {}
+        for runs in self._runs.values():
+            by_integration.setdefault(runs.integration, []).append(runs)
+        return {
+            integration: {
+                "count": sum(runs.count for runs in integration_runs),
+                "total": sum(runs.total for runs in integration_runs),
+                "p99": _p99(
+                    sample for runs in integration_runs for sample in runs.samples
+                ),
+            }
+            for integration, integration_runs in by_integration.items()
+        }
@@ -0,0 +1,205 @@
+"""Monitor the scheduling lag of the event loop and what blocks it."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+import logging
+import math
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import TypedDict
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between two samples of the scheduling lag
+LAG_SAMPLE_INTERVAL = 0.25
+# Samples of the scheduling lag the recent percentiles are computed from
+RECENT_LAG_SAMPLES = 240
+# Seconds the event loop must be blocked to record what is running
+SLOW_CALLBACK_THRESHOLD = 0.1
+# Slow callbacks kept to be reported
+MAX_SLOW_CALLBACKS = 50
+# Frames kept in the stack of a slow callback
+MAX_STACK_FRAMES = 20
+# Upper bounds of the buckets of the lag histogram in seconds,
+# the lags above the last bound are counted in an extra bucket
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_INTEGRATION_PATHS = ("custom_components/", "homeassistant/components/")
+
+
+class SlowCallback(TypedDict):
+    """A callback or task which blocked the event loop."""
+
+    timestamp: float
+    duration: float
+    integration: str | None
+    task: str | None
+    stack: list[str]
+
+
+class LoopHealth(TypedDict):
+    """The scheduling lag of the event loop and what blocked it."""
+
+    lag_buckets: list[float]
+    lag_counts: list[int]
+    lag_p50: float
+    lag_p99: float
+    lag_max: float
+    slow_callback_count: int
+    slow_callbacks: list[SlowCallback]
+
+
+def _frame_integration(frame: FrameType | None) -> str | None:
+    """Return the integration of the innermost integration frame of a stack."""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        for path in _INTEGRATION_PATHS:
+            if (index := filename.find(path)) != -1:
+                start = index + len(path)
+                if (end := filename.find("/", start)) != -1:
+                    return filename[start:end]
+        frame = frame.f_back
+    return None
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    """Return a percentile of ordered samples."""
+    if not ordered:
+        return 0.0
+    return ordered[math.ceil(len(ordered) * percentile) - 1]
+
+
+class LoopMonitor:
+    """Sample the scheduling lag of an event loop from a thread.
+
+    Every LAG_SAMPLE_INTERVAL the monitor thread schedules a callback
+    in the event loop and measures how long it takes to run. When the
+    event loop has not run it within SLOW_CALLBACK_THRESHOLD, the stack
+    of the event loop thread is captured to record what is blocking it.
+
+    The event loop only runs one callback per sample, so monitoring
+    costs close to nothing. The results are read from the event loop
+    while the monitor thread records them, so both hold a lock.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the loop monitor."""
+        self._loop = loop
+        self._loop_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._lag_counts = [0] * (len(LAG_BUCKETS) + 1)
+        self._recent_lags: deque[float] = deque(maxlen=RECENT_LAG_SAMPLES)
+        self._lag_max = 0.0
+        self._slow_callback_count = 0
+        self._slow_callbacks: deque[SlowCallback] = deque(maxlen=MAX_SLOW_CALLBACKS)
+
+    def start(self) -> None:
+        """Start monitoring, must be called from the event loop thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(
+            target=self._run, name="LoopMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop monitoring, must not be called from the event loop thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sample the scheduling lag until stopped."""
+        while not self._stopped.wait(LAG_SAMPLE_INTERVAL):
+            try:
+                self._sample()
+            except RuntimeError:
+                # The event loop is closed
+                return
+
+    def _sample(self) -> None:
+        """Measure the time the event loop takes to run a callback."""
+        ran = threading.Event()
+        start = time.monotonic()
+        self._loop.call_soon_threadsafe(ran.set)
+        if not ran.wait(SLOW_CALLBACK_THRESHOLD):
+            slow_callback = self._capture()
+            while not ran.wait(SLOW_CALLBACK_THRESHOLD):
+                if self._stopped.is_set():
+                    return
+            slow_callback["duration"] = time.monotonic() - start
+            with self._lock:
+                self._slow_callback_count += 1
+                self._slow_callbacks.append(slow_callback)
+            _LOGGER.debug("Event loop blocked: %s", slow_callback)
+        lag = time.monotonic() - start
+        with self._lock:
+            self._lag_counts[bisect_left(LAG_BUCKETS, lag)] += 1
+            self._recent_lags.append(lag)
+            self._lag_max = max(self._lag_max, lag)
+
+    def _capture(self) -> SlowCallback:
+        """Capture what is running in the event loop thread."""
+        assert self._loop_thread_id is not None
+        frame = sys._current_frames().get(self._loop_thread_id)  # noqa: SLF001
+        stack = traceback.StackSummary.extract(
+            traceback.walk_stack(frame), limit=MAX_STACK_FRAMES, lookup_lines=False
+        )
+        task_name: str | None = None
+        if (task := asyncio.current_task(self._loop)) is not None:
+            coro = task.get_coro()
+            task_name = f"{task.get_name()} {getattr(coro, '__qualname__', coro)}"
+        return {
+            "timestamp": time.time(),
+            "duration": 0.0,
+            "integration": _frame_integration(frame),
+            "task": task_name,
+            "stack": [
+                f"{summary.filename}:{summary.lineno} in {summary.name}"
+                for summary in reversed(stack)
+            ],
+        }
+
+    @property
+    def lag_max(self) -> float:
+        """Return the longest scheduling lag in seconds."""
+        return self._lag_max
+
+    @property
+    def slow_callback_count(self) -> int:
+        """Return the number of times the event loop was blocked."""
+        return self._slow_callback_count
+
+    def recent_lag(self, percentile: float) -> float:
+        """Return a percentile of the recent scheduling lags in seconds."""
+        with self._lock:
+            recent_lags = list(self._recent_lags)
+        recent_lags.sort()
+        return _percentile(recent_lags, percentile)
+
+    def health(self) -> LoopHealth:
+        """Return the lag histogram and the recent slow callbacks."""
+        with self._lock:
+            recent_lags = list(self._recent_lags)
+            lag_counts = list(self._lag_counts)
+            lag_max = self._lag_max
+            slow_callback_count = self._slow_callback_count
+            slow_callbacks = list(self._slow_callbacks)
+        recent_lags.sort()
+        return {
+            "lag_buckets": list(LAG_BUCKETS),
+            "lag_counts": lag_counts,
+            "lag_p50": _percentile(recent_lags, 0.5),
+            "lag_p99": _percentile(recent_lags, 0.99),
+            "lag_max": lag_max,
+            "slow_callback_count": slow_callback_count,
+            "slow_callbacks": slow_callbacks,
+        }
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+from propcache.api import cached_property
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -17,7 +19,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -34,6 +36,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the stored state of an entity that did not change is kept
+# before it is saved again to update the time the entity was last seen
+STATE_LAST_SEEN_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -59,40 +65,75 @@ class RestoredExtraData(ExtraStoredData):
 
 
 class StoredState:
-    """Object to represent a stored state."""
+    """Object to represent a stored state.
+
+    A stored state loaded from storage only creates its State and
+    parses the time it was last seen when they are accessed, since
+    most of them are never asked for before they are replaced.
+    """
 
     def __init__(
         self,
-        state: State,
+        state: State | None,
         extra_data: ExtraStoredData | None,
-        last_seen: datetime,
+        last_seen: datetime | str,
+        state_dict: dict[str, Any] | None = None,
     ) -> None:
         """Initialize a new stored state."""
         self.extra_data = extra_data
-        self.last_seen = last_seen
-        self.state = state
+        self._last_seen = last_seen
+        self._state = state
+        self._state_dict = state_dict
+
+    @property
+    def last_seen(self) -> datetime:
+        """Return the last time the entity was seen."""
+        if isinstance(last_seen := self._last_seen, str):
+            last_seen = self._last_seen = cast(
+                datetime, dt_util.parse_datetime(last_seen)
+            )
+        return last_seen
+
+    @property
+    def state(self) -> State:
+        """Return the stored state."""
+        if (state := self._state) is None:
+            state = self._state = cast(State, State.from_dict(self._state_dict))  # type: ignore[arg-type]
+            self._state_dict = None
+        return state
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the stored state to be JSON serialized."""
         return {
-            "state": self.state.json_fragment,
+            "state": (
+                self._state_dict if self._state is None else self._state.json_fragment
+            ),
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
-            "last_seen": self.last_seen,
+            "last_seen": self._last_seen,
         }
 
+    @cached_property
+    def json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the stored state.
+
+        The same fragment is returned as long as the stored state is
+        kept, which lets the journaled store skip it when it is saved.
+        """
+        return json_fragment(json_bytes(self.as_dict()))
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
         extra_data_dict = json_dict.get("extra_data")
         extra_data = RestoredExtraData(extra_data_dict) if extra_data_dict else None
-        last_seen = json_dict["last_seen"]
+        return cls(None, extra_data, json_dict["last_seen"], json_dict["state"])
 
-        if isinstance(last_seen, str):
-            last_seen = dt_util.parse_datetime(last_seen)
 
-        return cls(
-            cast(State, State.from_dict(json_dict["state"])), extra_data, last_seen
-        )
+def _stored_state_entity_id(item: dict[str, Any]) -> Any:
+    """Return the entity id of a stored state in storage."""
+    if isinstance(state := item.get("state"), dict):
+        return state.get("entity_id")
+    return None
 
 
 async def async_load(hass: HomeAssistant) -> None:
@@ -118,11 +159,19 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = Store[list[Any]](
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journaled=True,
+            journal_item_id=_stored_state_entity_id,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The stored states of the registered entities at the last
+        # dump and their extra data, to reuse the ones that did not change
+        self._dumped_states: dict[str, tuple[StoredState, dict[str, Any] | None]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -172,16 +221,29 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
-            )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
-        expiration_time = now - STATE_EXPIRATION
+        stored_states: list[StoredState] = []
+        dumped_states = self._dumped_states
+        self._dumped_states = {}
+        last_seen_time = now - STATE_LAST_SEEN_INTERVAL
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            dumped = dumped_states.get(entity_id)
+            if (
+                dumped is None
+                or dumped[0].state is not state
+                or dumped[1] != extra_data_dict
+                or dumped[0].last_seen < last_seen_time
+            ):
+                dumped = (StoredState(state, extra_data, now), extra_data_dict)
+            self._dumped_states[entity_id] = dumped
+            stored_states.append(dumped[0])
+        # The stored states of the current entities are only saved again
+        # once a day when they did not change, so the time they were last
+        # seen may be that much older
+        expiration_time = now - STATE_EXPIRATION - STATE_LAST_SEEN_INTERVAL
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -204,7 +266,7 @@ class RestoreStateData:
         try:
             await self.store.async_save(
                 [
-                    stored_state.as_dict()
+                    stored_state.json_fragment
                     for stored_state in self.async_get_stored_states()
                 ]
             )
@@ -528,7 +528,8 @@ def async_extract_referenced_entity_ids(
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
+    ent_reg = entity_registry.async_get(hass)
+    entities = ent_reg.entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
@@ -599,32 +600,19 @@ def async_extract_referenced_entity_ids(
             )
     selected.referenced_devices.update(referenced_devices_by_area)
 
-    # Add indirectly referenced by area
+    # Add indirectly referenced by area, either because the entity's area
+    # matches a targeted area or because the entity has no explicitly set
+    # area and its device is in a targeted area
     selected.indirectly_referenced.update(
         entry.entity_id
         for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by area through device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
+        for entry in entity_registry.async_entries_for_effective_area(ent_reg, area_id)
         # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
+        # or diagnostic entities, nor disabled entities of a device.
         if (
             entry.entity_category is None
             and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-            )
+            and (entry.area_id is not None or not entry.disabled_by)
         )
     )
 
@@ -1164,10 +1152,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in entity_registry.async_entries_for_platform(reg, domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
@@ -0,0 +1,325 @@
+"""Schedule the setup of the config entries during startup."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+import heapq
+import itertools
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.loader import Integration
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+from .storage import Store
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+DATA_SETUP_SCHEDULER: HassKey[SetupScheduler] = HassKey("setup_scheduler")
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.setup_schedule"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Seconds a config entry waits for a slot of its resource class before
+# it is set up regardless, so a setup waiting on another entry of the
+# same class can not deadlock the startup. Every waiter starts its setup
+# within this time, so the limits delay a stage by at most this much, well
+# within the 120 and 300 seconds stage 1 and 2 of the bootstrap get before
+# the remaining setups are moved to the background
+SLOT_WAIT_TIMEOUT = 20
+
+# Config entry data values naming a serial device
+_SERIAL_DEVICE_PATH = re.compile(r"^(/dev/|COM\d+$)")
+
+
+class ResourceClass(StrEnum):
+    """Resource the setup of a config entry mostly waits on."""
+
+    LOCAL = "local"
+    CLOUD = "cloud"
+    USB = "usb"
+
+
+# Config entries of a resource class set up at the same time during startup,
+# the resource classes without a limit are not limited
+RESOURCE_CLASS_LIMITS: dict[ResourceClass, int] = {
+    ResourceClass.CLOUD: 8,
+    ResourceClass.USB: 1,
+}
+
+
+class CriticalPathStep(TypedDict):
+    """A config entry setup on the critical path of the startup."""
+
+    domain: str
+    entry_id: str
+    title: str
+    resource_class: str
+    wait: float
+    duration: float
+
+
+@dataclass(slots=True)
+class _EntrySetup:
+    """The setup of a config entry during startup."""
+
+    domain: str
+    entry_id: str
+    title: str
+    resource_class: ResourceClass
+    queued: float
+    started: float = 0.0
+    finished: float | None = None
+
+
+def _has_serial_device_path(data: Mapping[str, Any]) -> bool:
+    """Return if config entry data names a serial device."""
+    for value in data.values():
+        if isinstance(value, str):
+            if _SERIAL_DEVICE_PATH.match(value):
+                return True
+        elif isinstance(value, Mapping) and _has_serial_device_path(value):
+            return True
+    return False
+
+
+def _resource_class(entry: ConfigEntry, integration: Integration) -> ResourceClass:
+    """Return the resource class of a config entry.
+
+    The config entries opening a serial device are set up one at a time,
+    the config entries of the integrations discovered over USB that talk
+    to the device through a network server are not.
+    """
+    if _has_serial_device_path(entry.data):
+        return ResourceClass.USB
+    if (iot_class := integration.iot_class) and iot_class.startswith("cloud"):
+        return ResourceClass.CLOUD
+    return ResourceClass.LOCAL
+
+
+class _ResourceSlots:
+    """Slots of a resource class, handed to the waiters by priority."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the slots."""
+        self.limit = limit
+        self.active = 0
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: float) -> None:
+        """Wait for a slot, the highest priority waiter is served first."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), waiter))
+        try:
+            async with asyncio.timeout(SLOT_WAIT_TIMEOUT):
+                await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over before the cancellation
+                self.release()
+            raise
+        except TimeoutError:
+            if waiter.cancelled() or not waiter.done():
+                # The slot was not handed over in time, take one
+                # anyway as the limit is only a soft limit
+                waiter.cancel()
+                self.active += 1
+
+    def release(self) -> None:
+        """Release a slot and hand it to the next waiter."""
+        self.active -= 1
+        while self._waiters and self.active < self.limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the setup durations of the last startup."""
+    await async_get(hass).async_load()
+
+
+@callback
+@singleton(DATA_SETUP_SCHEDULER)
+def async_get(hass: HomeAssistant) -> SetupScheduler:
+    """Get the setup scheduler."""
+    return SetupScheduler(hass)
+
+
+class SetupScheduler:
+    """Limit and order the config entry setups of the startup.
+
+    The config entries talking to a cloud service or opening a serial
+    device are limited per resource class, and the waiting ones are set up by
+    priority. The priority of a config entry is the time it took to set
+    up at the last startup plus the longest chain of setups depending
+    on its integration, so the setups on the critical path of the
+    startup go first. The config entries set up once started are not
+    limited.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the setup scheduler."""
+        self.hass = hass
+        self._store = Store[dict[str, dict[str, float]]](
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        # Seconds each config entry of each domain took at the last startup
+        self.last_startup: dict[str, dict[str, float]] = {}
+        self._slots = {
+            resource_class: _ResourceSlots(limit)
+            for resource_class, limit in RESOURCE_CLASS_LIMITS.items()
+        }
+        self._dependencies: dict[str, set[str]] = {}
+        self._downstream: dict[str, float] = {}
+        self._setups: dict[str, _EntrySetup] = {}
+
+    async def async_load(self) -> None:
+        """Load the setup durations and save the new ones once started."""
+        if data := await self._store.async_load():
+            self.last_startup = data
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_schedule_save
+        )
+
+    @callback
+    def _async_schedule_save(self, _event: Event) -> None:
+        """Save the setup durations of this startup."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, float]]:
+        """Return the setup durations of this startup to store."""
+        data: dict[str, dict[str, float]] = {}
+        for setup in self._setups.values():
+            if setup.finished is not None:
+                data.setdefault(setup.domain, {})[setup.entry_id] = (
+                    setup.finished - setup.started
+                )
+        return data
+
+    def _domain_duration(self, domain: str) -> float:
+        """Return the seconds the config entries of a domain took to set up."""
+        return max(self.last_startup.get(domain, {}).values(), default=0.0)
+
+    @callback
+    def async_plan(self, integrations: Mapping[str, Integration]) -> None:
+        """Plan the startup from the dependencies of the integrations."""
+        dependents: dict[str, set[str]] = {}
+        for domain, integration in integrations.items():
+            try:
+                all_dependencies = integration.all_dependencies
+            except RuntimeError:
+                # The dependencies could not be resolved
+                continue
+            self._dependencies[domain] = all_dependencies
+            for dependency in all_dependencies:
+                dependents.setdefault(dependency, set()).add(domain)
+
+        downstream = self._downstream
+
+        def _downstream(domain: str) -> float:
+            """Return the longest chain of setups depending on a domain."""
+            if (seconds := downstream.get(domain)) is None:
+                # The dependencies are already flattened and free of cycles
+                seconds = downstream[domain] = max(
+                    (
+                        self._domain_duration(dependent) + _downstream(dependent)
+                        for dependent in dependents.get(domain, ())
+                    ),
+                    default=0.0,
+                )
+            return seconds
+
+        for domain in integrations:
+            _downstream(domain)
+
+    def _priority(self, entry: ConfigEntry) -> float:
+        """Return the priority of the setup of a config entry."""
+        domain = entry.domain
+        duration = self.last_startup.get(domain, {}).get(entry.entry_id)
+        if duration is None:
+            duration = self._domain_duration(domain)
+        return duration + self._downstream.get(domain, 0.0)
+
+    async def async_setup_entry(
+        self, entry: ConfigEntry, integration: Integration
+    ) -> None:
+        """Set up a config entry once its resource class has a free slot."""
+        hass = self.hass
+        if hass.is_stopping or hass.state is CoreState.running:
+            await entry.async_setup_locked(hass, integration=integration)
+            return
+
+        resource_class = _resource_class(entry, integration)
+        setup = self._setups[entry.entry_id] = _EntrySetup(
+            entry.domain, entry.entry_id, entry.title, resource_class, time.monotonic()
+        )
+        if (slots := self._slots.get(resource_class)) is not None:
+            await slots.acquire(self._priority(entry))
+        setup.started = time.monotonic()
+        try:
+            await entry.async_setup_locked(hass, integration=integration)
+        finally:
+            setup.finished = time.monotonic()
+            if slots is not None:
+                slots.release()
+
+    @callback
+    def async_critical_path(self) -> list[CriticalPathStep]:
+        """Return the chain of config entry setups the startup waited on.
+
+        The chain ends with the config entry that finished last and goes
+        back through the dependencies, each step being the config entry
+        of a dependency that finished last.
+        """
+        finished = [
+            setup for setup in self._setups.values() if setup.finished is not None
+        ]
+        if not finished:
+            return []
+        step = max(finished, key=lambda setup: setup.finished or 0.0)
+        path: list[CriticalPathStep] = []
+        while True:
+            assert step.finished is not None
+            path.append(
+                {
+                    "domain": step.domain,
+                    "entry_id": step.entry_id,
+                    "title": step.title,
+                    "resource_class": step.resource_class,
+                    "wait": step.started - step.queued,
+                    "duration": step.finished - step.started,
+                }
+            )
+            dependencies = self._dependencies.get(step.domain, set())
+            queued = step.queued
+            if not (
+                previous := [
+                    setup
+                    for setup in finished
+                    if setup.domain in dependencies
+                    and (setup.finished or 0.0) <= queued
+                ]
+            ):
+                break
+            step = max(previous, key=lambda setup: setup.finished or 0.0)
+        path.reverse()
+        return path
@@ -6,11 +6,14 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from propcache.api import cached_property
@@ -33,6 +36,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS
 
 from . import json as json_helper
 
@@ -48,6 +52,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the main file when writing to it
+# would make it larger than the main file or this size
+JOURNAL_MIN_COMPACT_SIZE = 256 * 1024
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,9 +235,74 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class _JournalItems:
+    """Items of a list that a journaled store tracks by their id."""
+
+    __slots__ = ("ids_by_identity", "items")
+
+    def __init__(self) -> None:
+        """Initialize the items."""
+        # The items are kept to make sure their identity is not reused
+        self.items: dict[str, tuple[Any, bytes]] = {}
+        self.ids_by_identity: dict[int, str] = {}
+
+
+class _JournalSnapshot:
+    """What a journaled store last wrote, to find the changes of the next write."""
+
+    __slots__ = (
+        "base_size",
+        "generation",
+        "journal_size",
+        "keyed",
+        "minor_version",
+        "values",
+        "version",
+    )
+
+    def __init__(
+        self, generation: int, version: int, minor_version: int, base_size: int
+    ) -> None:
+        """Initialize the snapshot."""
+        self.generation = generation
+        self.version = version
+        self.minor_version = minor_version
+        self.base_size = base_size
+        self.journal_size = 0
+        # Lists of objects with an id are journaled per item,
+        # other values are journaled as a whole. A list stored
+        # as the whole data is journaled per item under None.
+        self.keyed: dict[str | None, _JournalItems] = {}
+        self.values: dict[str, bytes] = {}
+
+
+def _digest(encoded: bytes) -> bytes:
+    """Return a digest of encoded data to detect changes."""
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _journal_item_id(item: dict[str, Any]) -> Any:
+    """Return the id of an item of a journaled list."""
+    return item.get("id")
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
-    """Class to help storing data."""
+    """Class to help storing data.
+
+    A journaled store appends the changes of each write to a journal
+    next to the main file instead of rewriting it. Only top level
+    values of the stored mapping are compared: lists of objects with
+    a unique "id" are journaled per object and other values as a whole.
+    Stored data that is a list of such objects is journaled per object.
+    The id of the objects can be changed with journal_item_id.
+    Objects that are the same instance as at the last write are assumed
+    unchanged, so the data should be made of immutable values or new
+    objects for what changed. The journal is compacted into the main
+    file once it grows past JOURNAL_MIN_COMPACT_SIZE or the size of the
+    main file, by the first write after loading and at shutdown, so the
+    main file holds all the data when Home Assistant is not running.
+    """
 
     def __init__(
         self,
@@ -241,6 +315,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journaled: bool = False,
+        journal_item_id: Callable[[dict[str, Any]], Any] = _journal_item_id,
     ) -> None:
         """Initialize storage class."""
         self.version = version
@@ -256,6 +332,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journaled = journaled
+        self._journal_item_id = journal_item_id
+        self._journal_snapshot: _JournalSnapshot | None = None
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -387,6 +466,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if (generation := data.pop("journal", None)) is not None:
+            await self.hass.async_add_executor_job(
+                self._load_journal, generation, data["data"]
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -518,6 +602,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journaled:
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Compact the journal into the main file if it has changes."""
+        async with self._write_lock:
+            if (
+                snapshot := self._journal_snapshot
+            ) is None or not snapshot.journal_size:
+                return
+            try:
+                await self.hass.async_add_executor_job(self._compact_journal)
+            except (HomeAssistantError, OSError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -541,16 +639,34 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if (
+                snapshot := self._journal_snapshot
+            ) is not None and snapshot.journal_size:
+                # Compact the journal at shutdown so that the main file
+                # holds all the data for versions without the journal
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self.hass.async_add_executor_job(
+            self._write_data, self.path, data, self.hass.is_stopping
+        )
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+    def _write_data(self, path: str, data: dict, compact: bool = False) -> None:
+        """Write the data, to the main file if compacting the journal."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journaled and not compact and self._write_journal(path, data):
+            return
+
+        generation: int | None = None
+        if self._journaled:
+            # Records of older generations left by an interrupted
+            # compaction are ignored when loading
+            generation = data["journal"] = time.time_ns()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +676,246 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if generation is not None:
+            try:
+                with suppress(FileNotFoundError):
+                    os.unlink(f"{path}{JOURNAL_SUFFIX}")
+                base_size = os.path.getsize(path)
+            except OSError as err:
+                raise WriteError(err) from err
+            self._journal_snapshot = self._create_journal_snapshot(
+                generation, data, base_size
+            )
+
+    def _encode(self, value: Any) -> bytes:
+        """Encode a value the same way it is written to the main file."""
+        if self._encoder and self._encoder is not json_helper.JSONEncoder:
+            return json.dumps(value, cls=self._encoder).encode()
+        return json_helper.json_bytes(value)
+
+    def _create_journal_snapshot(
+        self, generation: int, data: dict[str, Any], base_size: int
+    ) -> _JournalSnapshot | None:
+        """Return a snapshot of the data written to the main file."""
+        stored = data["data"]
+        snapshot = _JournalSnapshot(
+            generation, data["version"], data["minor_version"], base_size
+        )
+        if isinstance(stored, list):
+            items = _JournalItems()
+            if not self._journal_item_changes(items, stored, None):
+                return None
+            snapshot.keyed[None] = items
+            return snapshot
+        if not isinstance(stored, Mapping):
+            return None
+        for key, value in stored.items():
+            if isinstance(value, list):
+                items = _JournalItems()
+                if self._journal_item_changes(items, value, None):
+                    snapshot.keyed[key] = items
+                    continue
+            snapshot.values[key] = _digest(self._encode(value))
+        return snapshot
+
+    def _journal_item_changes(
+        self, items: _JournalItems, value: list[Any], records: list[bytes] | None
+    ) -> bool:
+        """Update the items and add the records of the changed ones.
+
+        Returns False if the list is not made of objects with a unique id.
+        """
+        tracked = items.items
+        ids_by_identity = items.ids_by_identity
+        unchanged = 0
+        changed: dict[str, tuple[Any, bytes, bytes]] = {}
+        for item in value:
+            if id(item) in ids_by_identity:
+                unchanged += 1
+                continue
+            encoded = self._encode(item)
+            decoded = json_util.json_loads(encoded)
+            if (
+                not isinstance(decoded, dict)
+                or not isinstance(item_id := self._journal_item_id(decoded), str)
+                or item_id in changed
+            ):
+                return False
+            changed[item_id] = (item, encoded, _digest(encoded))
+
+        seen = unchanged + sum(item_id in tracked for item_id in changed)
+        removed: set[str] = set()
+        if seen != len(tracked):
+            # Only look for the removed items when some are missing
+            current = {
+                ids_by_identity[id(item)]
+                for item in value
+                if id(item) in ids_by_identity
+            } | changed.keys()
+            if len(current) != len(value):
+                return False
+            removed = tracked.keys() - current
+
+        for item_id, (item, encoded, digest) in changed.items():
+            if (old := tracked.get(item_id)) is not None:
+                del ids_by_identity[id(old[0])]
+                if old[1] == digest:
+                    tracked[item_id] = (item, digest)
+                    ids_by_identity[id(item)] = item_id
+                    continue
+            tracked[item_id] = (item, digest)
+            ids_by_identity[id(item)] = item_id
+            if records is not None:
+                records.append(
+                    b"".join((json_helper.json_bytes(item_id), b",", encoded))
+                )
+        for item_id in removed:
+            del ids_by_identity[id(tracked.pop(item_id)[0])]
+            if records is not None:
+                records.append(json_helper.json_bytes(item_id))
+        return True
+
+    def _journal_changes(
+        self, snapshot: _JournalSnapshot, data: dict[str, Any]
+    ) -> list[bytes] | None:
+        """Update the snapshot and return the journal records of the changes.
+
+        Returns None if the changes can not be journaled.
+        """
+        stored = data["data"]
+        if (
+            data["version"] != snapshot.version
+            or data["minor_version"] != snapshot.minor_version
+        ):
+            return None
+        if isinstance(stored, list):
+            if None not in snapshot.keyed:
+                return None
+            stored = {None: stored}
+        elif (
+            not isinstance(stored, Mapping)
+            or stored.keys() != snapshot.keyed.keys() | snapshot.values.keys()
+        ):
+            return None
+        generation = str(snapshot.generation).encode()
+        records: list[bytes] = []
+        for key, value in stored.items():
+            prefix = b"".join((b"[", generation, b",", json_helper.json_bytes(key)))
+            if (items := snapshot.keyed.get(key)) is not None:
+                item_records: list[bytes] = []
+                if not isinstance(value, list) or not self._journal_item_changes(
+                    items, value, item_records
+                ):
+                    return None
+                records.extend(
+                    b"".join((prefix, b",", record, b"]")) for record in item_records
+                )
+                continue
+            encoded = self._encode(value)
+            if (digest := _digest(encoded)) != snapshot.values[key]:
+                snapshot.values[key] = digest
+                records.append(b"".join((prefix, b",null,", encoded, b"]")))
+        return records
+
+    def _write_journal(self, path: str, data: dict[str, Any]) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if the main file has to be written instead.
+        """
+        if (snapshot := self._journal_snapshot) is None:
+            return False
+        # The snapshot is only kept if the journal is written
+        self._journal_snapshot = None
+        if (records := self._journal_changes(snapshot, data)) is None:
+            return False
+        journal = b"".join(record + b"\n" for record in records)
+        if snapshot.journal_size + len(journal) > max(
+            JOURNAL_MIN_COMPACT_SIZE, snapshot.base_size
+        ):
+            return False
+        if journal:
+            journal_path = f"{path}{JOURNAL_SUFFIX}"
+            _LOGGER.debug(
+                "Appending %s changes for %s to %s",
+                len(records),
+                self.key,
+                journal_path,
+            )
+            try:
+                fd = os.open(
+                    journal_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if self._private else 0o644,
+                )
+                with open(fd, "wb") as fdesc:
+                    fdesc.write(journal)
+                    if self._atomic_writes:
+                        fdesc.flush()
+                        os.fsync(fdesc.fileno())
+            except OSError as err:
+                _LOGGER.exception("Appending to journal failed: %s", journal_path)
+                raise WriteError(err) from err
+            snapshot.journal_size += len(journal)
+        self._journal_snapshot = snapshot
+        return True
+
+    def _compact_journal(self) -> None:
+        """Write the main file with the changes of the journal."""
+        data = json_util.load_json(self.path)
+        if not isinstance(data, dict) or not isinstance(
+            generation := data.get("journal"), int
+        ):
+            return
+        self._load_journal(generation, data["data"])
+        self._write_data(self.path, data, compact=True)
+
+    def _load_journal(self, generation: int, stored: Any) -> None:
+        """Apply the changes journaled since the main file was written."""
+        try:
+            with open(f"{self.path}{JOURNAL_SUFFIX}", "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+        item_id_of = self._journal_item_id
+        keyed: dict[str | None, dict[str, Any]] = {}
+        for line in lines:
+            try:
+                record = json_util.json_loads(line)
+            except JSON_DECODE_EXCEPTIONS:
+                # The write of the last record was interrupted
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            # Records are [generation, key, item_id] for a removed item
+            # and [generation, key, item_id, value] otherwise, where the
+            # item_id is None for a value journaled as a whole
+            if (
+                not isinstance(record, list)
+                or len(record) not in (3, 4)
+                or record[0] != generation
+                or not isinstance(key := record[1], str | None)
+                or not isinstance(item_id := record[2], str | None)
+                or (item_id is None and len(record) == 3)
+            ):
+                continue
+            if item_id is None:
+                stored[key] = record[3]
+                keyed.pop(key, None)
+                continue
+            if (items := keyed.get(key)) is None:
+                items = keyed[key] = {
+                    item_id_of(item): item
+                    for item in (stored if key is None else stored[key])
+                }
+            if len(record) == 4:
+                items[item_id] = record[3]
+            else:
+                items.pop(item_id, None)
+        for key, items in keyed.items():
+            if key is None:
+                stored[:] = items.values()
+            else:
+                stored[key] = list(items.values())
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -570,5 +926,12 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
+        self._journal_snapshot = None
+
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journaled:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
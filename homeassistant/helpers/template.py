@@ -12,8 +12,11 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -22,6 +25,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -58,9 +62,12 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
+    CompressedState,
     Context,
+    CoreState,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -94,6 +101,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +122,13 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_TEMPLATE_CODE_CACHE: HassKey[TemplateCodeCache] = HassKey("template.code_cache")
+
+TEMPLATE_CODE_CACHE_STORAGE_KEY = "core.template_code_cache"
+TEMPLATE_CODE_CACHE_STORAGE_VERSION = 1
+TEMPLATE_CODE_CACHE_SAVE_DELAY = 60
+# Compiled code of at most this many templates is persisted
+TEMPLATE_CODE_CACHE_SIZE = 2048
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -125,15 +140,23 @@ _RESERVED_NAMES = {
     "jinja_pass_arg",
 }
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# The fields of a state a template can depend on. A template only
+# needs to re-render when one of the fields it read has changed.
+STATE_FIELDS = frozenset(
+    {"state", "attributes", "last_changed", "last_reported", "last_updated", "context"}
+)
+
+# Map each collectable property to the state field it reads,
+# None if it can only change when the entity is added or removed.
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, str | None] = {
+    "state": "state",
+    "attributes": "attributes",
+    "last_changed": "last_changed",
+    "last_updated": "last_updated",
+    "context": "context",
+    "domain": None,
+    "object_id": None,
+    "name": "attributes",
 }
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
@@ -146,6 +169,11 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
 
+# Set while a template from the configuration is compiled, the compiled
+# code of other templates like the ones from the template editor is not
+# persisted
+_persist_code: ContextVar[bool] = ContextVar("_persist_code", default=False)
+
 #
 # CACHED_TEMPLATE_STATES is a rough estimate of the number of entities
 # on a typical system. It is used as the initial size of the LRU cache
@@ -392,11 +420,14 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
+        "entity_fields",
         "exception",
         "filter",
         "filter_lifecycle",
         "has_time",
         "is_static",
+        "iteration_fields",
         "rate_limit",
         "template",
     )
@@ -415,6 +446,11 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The state fields and attributes read from each entity in entities
+        self.entity_fields: dict[str, set[str]] = {}
+        self.entity_attributes: dict[str, set[str]] = {}
+        # The state fields read from states while iterating all states or a domain
+        self.iteration_fields: set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -457,6 +493,57 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_entity(self, entity_id: str) -> None:
+        """Record that the whole state of an entity was read."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self.entity_fields[entity_id] = set(STATE_FIELDS)
+
+    def _collect_entity_field(self, entity_id: str, field: str | None) -> None:
+        """Record that a field of the state of an entity was read."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (fields := self.entity_fields.get(entity_id)) is None:
+            fields = self.entity_fields[entity_id] = set()
+        if field is not None:
+            fields.add(field)
+
+    def _collect_entity_attribute(self, entity_id: str, name: str) -> None:
+        """Record that a single attribute of the state of an entity was read."""
+        self._collect_entity_field(entity_id, None)
+        if (attributes := self.entity_attributes.get(entity_id)) is None:
+            attributes = self.entity_attributes[entity_id] = set()
+        attributes.add(name)
+
+    def inputs_changed(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return if a state change changed anything the template read.
+
+        Only called for entities passing the filter.
+        """
+        if self.exception is not None:
+            return True
+        fields: collections.abc.Set[str] = set()
+        attributes: collections.abc.Set[str] = set()
+        if entity_id in self.entities:
+            if (entity_fields := self.entity_fields.get(entity_id)) is None:
+                # Collected without recording which fields were read
+                return True
+            fields = entity_fields
+            attributes = self.entity_attributes.get(entity_id, attributes)
+        if self.all_states or split_entity_id(entity_id)[0] in self.domains:
+            fields = fields | self.iteration_fields
+        for field in fields:
+            if getattr(old_state, field) != getattr(new_state, field):
+                return True
+        if "attributes" in fields or not attributes:
+            return False
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return any(
+            old_attributes.get(name, _SENTINEL) != new_attributes.get(name, _SENTINEL)
+            for name in attributes
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -572,8 +659,12 @@ class Template:
             )
         return ret
 
-    def ensure_valid(self) -> None:
-        """Return if template is valid."""
+    def ensure_valid(self, *, persist_code: bool = False) -> None:
+        """Return if template is valid.
+
+        If persist_code is True, the compiled code is persisted across
+        restarts. It should only be set for templates from the configuration.
+        """
         if self.is_static or self._compiled_code is not None:
             return
 
@@ -583,10 +674,13 @@ class Template:
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
+            token = _persist_code.set(persist_code)
             try:
                 self._compiled_code = self._env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
+            finally:
+                _persist_code.reset(token)
 
     def render(
         self,
@@ -1051,18 +1145,38 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._cache: dict[str, Any] = {}
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, field: str | None) -> None:
+        if (render_info := _render_info.get()) is None:
+            return
+        if self._collect:
+            render_info._collect_entity_field(self._entity_id, field)  # noqa: SLF001
+        elif field is not None:
+            # States that are not collected come from iterating
+            # all states or a domain, which is tracked as a whole
+            render_info.iteration_fields.add(field)
+
+    def _collect_whole_state(self) -> None:
+        if (render_info := _render_info.get()) is None:
+            return
+        if self._collect:
+            render_info._collect_entity(self._entity_id)  # noqa: SLF001
+        else:
+            render_info.iteration_fields.update(STATE_FIELDS)
+
+    def _get_attribute(self, name: str, default: Any = None) -> Any:
+        """Return a single attribute, only collecting that attribute."""
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info._collect_entity_attribute(self._entity_id, name)  # noqa: SLF001
+        else:
+            self._collect_state("attributes")
+        return self._state.attributes.get(name, default)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES[item])
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1081,55 +1195,55 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
-    @property
-    def last_changed(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_changed(self) -> datetime:
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
-    @property
-    def last_reported(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_reported(self) -> datetime:
         """Wrap State.last_reported."""
-        self._collect_state()
+        self._collect_state("last_reported")
         return self._state.last_reported
 
-    @property
-    def last_updated(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_updated(self) -> datetime:
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.object_id
 
     @property
     def name(self) -> str:  # type: ignore[override]
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.name
 
     @property
@@ -1146,7 +1260,8 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state("attributes")
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1157,9 +1272,50 @@ class TemplateStateBase(State):
 
     def __eq__(self, other: object) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_whole_state()
         return self._state.__eq__(other)
 
+    @property
+    def last_changed_timestamp(self) -> float:
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state("last_changed")
+        return self._state.last_changed_timestamp
+
+    @property
+    def last_reported_timestamp(self) -> float:
+        """Wrap State.last_reported_timestamp."""
+        self._collect_state("last_reported")
+        return self._state.last_reported_timestamp
+
+    def as_dict(self) -> ReadOnlyDict[str, datetime | collections.abc.Collection[Any]]:
+        """Wrap State.as_dict."""
+        self._collect_whole_state()
+        return self._state.as_dict()
+
+    @property
+    def as_dict_json(self) -> bytes:
+        """Wrap State.as_dict_json."""
+        self._collect_whole_state()
+        return self._state.as_dict_json
+
+    @property
+    def json_fragment(self) -> orjson.Fragment:
+        """Wrap State.json_fragment."""
+        self._collect_whole_state()
+        return self._state.json_fragment
+
+    @property
+    def as_compressed_state(self) -> CompressedState:
+        """Wrap State.as_compressed_state."""
+        self._collect_whole_state()
+        return self._state.as_compressed_state
+
+    @property
+    def as_compressed_state_json(self) -> bytes:
+        """Wrap State.as_compressed_state_json."""
+        self._collect_whole_state()
+        return self._state.as_compressed_state_json
+
 
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
@@ -1205,7 +1361,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect._collect_entity(entity_id)  # noqa: SLF001
 
 
 def _state_generator(
@@ -1615,22 +1771,13 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     if _area_id is None:
         return []
     ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
+    # Entities tied to a device in the area that don't themselves have an
+    # area specified inherit the area from the device, unless they are disabled.
+    return [
         entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
+        for entry in entity_registry.async_entries_for_effective_area(ent_reg, _area_id)
+        if entry.area_id is not None or not entry.disabled_by
     ]
-    dev_reg = device_registry.async_get(hass)
-    # We also need to add entities tied to a device in the area that don't themselves
-    # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -1887,7 +2034,7 @@ def is_state(hass: HomeAssistant, entity_id: str, state: str | list[str]) -> boo
 def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) -> bool:
     """Test if a state's attribute is a specific value."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        attr = state_obj.attributes.get(name, _SENTINEL)
+        attr = state_obj._get_attribute(name, _SENTINEL)  # noqa: SLF001
         if attr is _SENTINEL:
             return False
         return bool(attr == value)
@@ -1897,7 +2044,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2862,6 +3009,109 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+async def async_load_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code persisted by the previous run."""
+    code_cache = TemplateCodeCache(hass)
+    await code_cache.async_load()
+    hass.data[_TEMPLATE_CODE_CACHE] = code_cache
+
+
+def _code_cache_version() -> str:
+    """Return the version compiled code in the cache must match."""
+    return f"{__version__}-{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+
+
+class TemplateCodeCache:
+    """Persist compiled template code across restarts.
+
+    Code is stored marshalled and keyed by a hash of the template source
+    and the environment that compiled it. Only the code of the
+    TEMPLATE_CODE_CACHE_SIZE most recently used templates is kept, and
+    the templates not used since the start are dropped once started.
+    The whole cache is dropped when Home Assistant, Python or Jinja
+    changes version.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass,
+            TEMPLATE_CODE_CACHE_STORAGE_VERSION,
+            TEMPLATE_CODE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        # Templates are compiled from the event loop and from executor threads
+        self._lock = threading.Lock()
+        self._code: LRU[str, CodeType] = LRU(TEMPLATE_CODE_CACHE_SIZE)
+        self._marshalled: LRU[str, str] = LRU(TEMPLATE_CODE_CACHE_SIZE)
+        self._used: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        if (data := await self._store.async_load()) is not None and data[
+            "version"
+        ] == _code_cache_version():
+            # The code is stored from the least to the most recently used
+            for key, marshalled in data["code"].items():
+                self._marshalled[key] = marshalled
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code for a key, decoding it on first use.
+
+        May be called from any thread.
+        """
+        with self._lock:
+            if (code := self._code.get(key)) is not None:
+                self._marshalled.get(key)
+                self._used.add(key)
+                return code
+            if (marshalled := self._marshalled.get(key)) is None:
+                return None
+            try:
+                code = marshal.loads(base64.b64decode(marshalled))
+            except (EOFError, TypeError, ValueError):
+                code = None
+            if not isinstance(code, CodeType):
+                _LOGGER.debug("Discarding invalid cached template code for %s", key)
+                del self._marshalled[key]
+                return None
+            self._code[key] = code
+            self._used.add(key)
+            return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store newly compiled code.
+
+        May be called from any thread.
+        """
+        marshalled = base64.b64encode(marshal.dumps(code)).decode()
+        with self._lock:
+            self._code[key] = code
+            self._marshalled[key] = marshalled
+            self._used.add(key)
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, TEMPLATE_CODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        # The templates of the configuration are all compiled once started
+        drop_unused = self._hass.state is CoreState.running
+        with self._lock:
+            code = {
+                key: marshalled
+                for key, marshalled in reversed(self._marshalled.items())
+                if not drop_unused or key in self._used
+            }
+        return {"version": _code_cache_version(), "code": code}
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2875,6 +3125,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Environments with a custom log function are not shared,
+        # so their code is not worth persisting
+        self.use_code_cache = log_fn is None
+        self._code_cache_variant = (bool(limited), bool(strict))
+        self._code_cache_fingerprint: str | None = None
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3230,9 +3485,39 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not self.use_code_cache
+            or not isinstance(source, str)
+            or (code_cache := self.hass.data.get(_TEMPLATE_CODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+        else:
+            key = self._code_cache_key(source)
+            if (cached := code_cache.get(key)) is not None:
+                compiled = cached
+            else:
+                compiled = super().compile(source)
+                if _persist_code.get():
+                    code_cache.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
+    def _code_cache_key(self, source: str) -> str:
+        """Return the key of the compiled code of a source in the code cache."""
+        if (fingerprint := self._code_cache_fingerprint) is None:
+            # Compiled code looks up filters, tests and globals by name,
+            # so it can only be reused by an environment with the same names.
+            fingerprint = self._code_cache_fingerprint = repr(
+                (
+                    self._code_cache_variant,
+                    sorted(self.filters),
+                    sorted(self.tests),
+                    sorted(self.globals),
+                    sorted(self.extensions),
+                )
+            )
+        return hashlib.sha256(f"{fingerprint}\n{source}".encode()).hexdigest()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
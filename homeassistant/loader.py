@@ -30,7 +30,7 @@ import voluptuous as vol
 
 from . import generated
 from .const import Platform
-from .core import HomeAssistant, callback
+from .core import CoreState, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -133,6 +133,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+# Seconds each integration and platform took to import during startup
+# keyed by domain and platform name, None being the integration itself
+DATA_IMPORT_TIMINGS: HassKey[dict[str, dict[str | None, float]]] = HassKey(
+    "import_timings"
+)
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -271,6 +276,39 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
+
+
+@callback
+def async_get_import_timings(
+    hass: HomeAssistant,
+) -> dict[str, dict[str | None, float]]:
+    """Return how long integrations and their platforms took to import."""
+    return hass.data.get(DATA_IMPORT_TIMINGS, {})
+
+
+@callback
+def _async_startup_import_timings(
+    hass: HomeAssistant,
+) -> dict[str, dict[str | None, float]] | None:
+    """Return the import timings to record, None once started."""
+    if hass.state is CoreState.running:
+        return None
+    return hass.data.get(DATA_IMPORT_TIMINGS)
+
+
+def _record_import_time(
+    timings: dict[str, dict[str | None, float]],
+    domain: str,
+    platform_names: Iterable[str | None],
+    took: float,
+) -> None:
+    """Record the import time of an integration or its platforms."""
+    names = list(platform_names)
+    domain_timings = timings.setdefault(domain, {})
+    for name in names:
+        # Platforms imported together share the time
+        domain_timings[name] = took / len(names)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -990,7 +1028,9 @@ class Integration:
         if self._component_future:
             return await self._component_future
 
-        if debug := _LOGGER.isEnabledFor(logging.DEBUG):
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        import_timings = _async_startup_import_timings(self.hass)
+        if timed := debug or import_timings is not None:
             start = time.perf_counter()
 
         # Some integrations fail on import because they call functions incorrectly.
@@ -1001,12 +1041,16 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
-            if debug:
-                _LOGGER.debug(
-                    "Component %s import took %.3f seconds (loaded_executor=False)",
-                    self.domain,
-                    time.perf_counter() - start,
-                )
+            if timed:
+                took = time.perf_counter() - start
+                if import_timings is not None:
+                    _record_import_time(import_timings, domain, (None,), took)
+                if debug:
+                    _LOGGER.debug(
+                        "Component %s import took %.3f seconds (loaded_executor=False)",
+                        domain,
+                        took,
+                    )
             return comp
 
         self._component_future = self.hass.loop.create_future()
@@ -1037,13 +1081,17 @@ class Integration:
         finally:
             self._component_future = None
 
-        if debug:
-            _LOGGER.debug(
-                "Component %s import took %.3f seconds (loaded_executor=%s)",
-                self.domain,
-                time.perf_counter() - start,
-                load_executor,
-            )
+        if timed:
+            took = time.perf_counter() - start
+            if import_timings is not None:
+                _record_import_time(import_timings, domain, (None,), took)
+            if debug:
+                _LOGGER.debug(
+                    "Component %s import took %.3f seconds (loaded_executor=%s)",
+                    domain,
+                    took,
+                    load_executor,
+                )
 
         return comp
 
@@ -1145,7 +1193,9 @@ class Integration:
             import_futures.append((platform_name, import_future))
 
         if load_executor_platforms or load_event_loop_platforms:
-            if debug := _LOGGER.isEnabledFor(logging.DEBUG):
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            import_timings = _async_startup_import_timings(self.hass)
+            if debug or import_timings is not None:
                 start = time.perf_counter()
 
             try:
@@ -1198,6 +1248,14 @@ class Integration:
                         time.perf_counter() - start,
                     )
 
+            if import_timings is not None:
+                _record_import_time(
+                    import_timings,
+                    domain,
+                    (platform_name for platform_name, _ in import_futures),
+                    time.perf_counter() - start,
+                )
+
         if in_progress_imports:
             for platform_name, future in in_progress_imports.items():
                 platforms[platform_name] = await future
@@ -7,7 +7,9 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import tempfile
 from timeit import default_timer as timer
+from typing import Any
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -308,3 +310,330 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass: core.HomeAssistant) -> float:
+    """Match 100k MQTT messages against a growing number of wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    messages_to_match = 10**5
+    total = 0.0
+
+    for subscription_count in (10, 100, 1000, 2000, 5000):
+        trie: TopicTrie[int] = TopicTrie()
+        for idx in range(subscription_count):
+            if idx % 2:
+                trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+            else:
+                trie.add(f"tasmota/discovery/device_{idx}/#", idx)
+        topics = [
+            f"zigbee2mqtt/device_{idx}/state" for idx in range(1, subscription_count, 2)
+        ]
+        size = len(topics)
+
+        start = timer()
+        for idx in range(messages_to_match):
+            trie.match(topics[idx % size])
+        runtime = timer() - start
+
+        total += runtime
+        print(
+            f"{subscription_count} wildcard subscriptions:"
+            f" {messages_to_match / runtime:.0f} messages/s"
+        )
+
+    return total
+
+
+@benchmark
+async def websocket_state_diff_fan_out(hass: core.HomeAssistant) -> float:
+    """Send 20k state changes to 1, 10 and 50 websocket subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    events_to_fire = 2 * 10**4
+    entity_count = 1000
+    total = 0.0
+
+    for connection_count in (1, 10, 50):
+        sent: list[bytes] = []
+        unsubs: list[Callable[[], None]] = []
+        for idx in range(connection_count):
+            message_id_as_bytes = str(idx + 1).encode()
+
+            @core.callback
+            def forward(
+                event: core.Event[core.EventStateChangedData],
+                message_id_as_bytes: bytes = message_id_as_bytes,
+                sent: list[bytes] = sent,
+            ) -> None:
+                """Queue the message the same way a subscription does."""
+                sent.append(
+                    messages.cached_state_diff_message(message_id_as_bytes, event)
+                )
+
+            unsubs.append(hass.bus.async_listen(EVENT_STATE_CHANGED, forward))
+
+        start = timer()
+        for idx in range(events_to_fire):
+            hass.states.async_set(
+                f"sensor.power_{idx % entity_count}",
+                str(idx),
+                {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+            )
+        runtime = timer() - start
+
+        assert len(sent) == events_to_fire * connection_count
+        total += runtime
+        print(
+            f"{connection_count} connections:"
+            f" {runtime / events_to_fire * 10**6:.1f}µs per state change,"
+            f" {runtime / len(sent) * 10**6:.2f}µs per message"
+        )
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
+@benchmark
+async def storage_journal_writes(hass: core.HomeAssistant) -> float:
+    """Edit one of 20k registry entries 200 times with and without a journal."""
+    # pylint: disable=import-outside-toplevel
+    import os
+
+    from homeassistant.helpers.json import json_bytes, json_fragment
+    from homeassistant.helpers.storage import JOURNAL_SUFFIX, Store
+
+    entry_count = 2 * 10**4
+    edits = 200
+    total = 0.0
+
+    def _entry(idx: int, name: str | None) -> json_fragment:
+        return json_fragment(
+            json_bytes(
+                {
+                    "entity_id": f"sensor.power_{idx}",
+                    "id": f"{idx:032x}",
+                    "name": name,
+                    "platform": "benchmark",
+                    "unique_id": f"power_{idx}",
+                }
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        for journaled in (False, True):
+            store = Store[dict[str, list[json_fragment]]](
+                hass, 1, f"benchmark_{journaled}", journaled=journaled
+            )
+            entries = [_entry(idx, None) for idx in range(entry_count)]
+            await store.async_save({"entities": entries})
+            written = 0
+
+            start = timer()
+            for edit in range(edits):
+                entries[edit] = _entry(edit, f"Power {edit}")
+                await store.async_save({"entities": entries})
+                if journaled:
+                    written = os.path.getsize(f"{store.path}{JOURNAL_SUFFIX}")
+                else:
+                    written += os.path.getsize(store.path)
+            runtime = timer() - start
+
+            total += runtime
+            print(
+                f"journaled={journaled}: {written / edits:.0f} bytes per edit,"
+                f" {runtime / edits * 1000:.2f}ms per edit"
+            )
+
+    return total
+
+
+async def _recorder_state_writes(hass: core.HomeAssistant, bulk_insert: bool) -> float:
+    """Record 20k state changes of 1000 entities with a SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components import recorder
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    events_to_record = 2 * 10**4
+    entity_count = 1000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        await hass.async_start()
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {
+                recorder.DOMAIN: {
+                    recorder.CONF_DB_URL: f"sqlite:///{tmp_dir}/benchmark.db",
+                    recorder.CONF_COMMIT_INTERVAL: 1,
+                    recorder.CONF_DB_BULK_INSERT: bulk_insert,
+                }
+            },
+        )
+        instance = recorder.get_instance(hass)
+        await instance.async_block_till_done()
+
+        start = timer()
+        for idx in range(events_to_record):
+            hass.states.async_set(
+                f"sensor.power_{idx % entity_count}",
+                str(idx),
+                {"unit_of_measurement": "W", "device_class": "power"},
+            )
+        await instance.async_block_till_done()
+        runtime = timer() - start
+
+        await hass.async_stop()
+
+    print(f"{events_to_record / runtime:.0f} state changes/s")
+    return runtime
+
+
+@benchmark
+async def recorder_state_writes(hass: core.HomeAssistant) -> float:
+    """Record 20k state changes through the session."""
+    return await _recorder_state_writes(hass, bulk_insert=False)
+
+
+@benchmark
+async def recorder_state_writes_bulk_insert(hass: core.HomeAssistant) -> float:
+    """Record 20k state changes with bulk inserts."""
+    return await _recorder_state_writes(hass, bulk_insert=True)
+
+
+@benchmark
+async def state_memory(hass: core.HomeAssistant) -> float:
+    """Measure the memory held by the states of 10k entities."""
+    # pylint: disable=import-outside-toplevel
+    import gc
+    import json
+    import tracemalloc
+
+    entity_count = 10**4
+    updates = 5
+
+    def _attributes(idx: int, update: int) -> dict[str, Any]:
+        kind = idx % 4
+        if kind == 0:
+            return {
+                "state_class": "measurement",
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "friendly_name": f"Room {idx} Temperature",
+            }
+        if kind == 1:
+            return {
+                "supported_color_modes": ["color_temp", "hs"],
+                "color_mode": "color_temp" if update % 2 else None,
+                "brightness": 255 if update % 2 else None,
+                "friendly_name": f"Light {idx}",
+                "supported_features": 40,
+            }
+        if kind == 2:
+            return {"device_class": "motion", "friendly_name": f"Motion {idx}"}
+        # Attributes parsed from a payload like MQTT discovered entities
+        return json.loads(
+            json.dumps(
+                {
+                    "state_class": "total_increasing",
+                    "unit_of_measurement": "kWh",
+                    "device_class": "energy",
+                    "friendly_name": f"Plug {idx} Energy",
+                }
+            )
+        )
+
+    # The recorder and the websocket api always listen to state changes
+    hass.bus.async_listen(EVENT_STATE_CHANGED, core.callback(lambda event: None))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = timer()
+    for update in range(updates):
+        for idx in range(entity_count):
+            hass.states.async_set(
+                f"sensor.entity_{idx}", str(update + idx % 7), _attributes(idx, update)
+            )
+    runtime = timer() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(f"{held / entity_count:.0f} bytes per state")
+    return runtime
+
+
+@benchmark
+async def entity_registry_lookups(hass: core.HomeAssistant) -> float:
+    """Look up 20k registry entries by area, category and platform."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+    )
+
+    entity_count = 2 * 10**4
+    entities_per_device = 10
+    area_count = 50
+    category_count = 100
+    platform_count = 20
+    lookups = 1000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await ar.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        area_reg = ar.async_get(hass)
+        dev_reg = dr.async_get(hass)
+        ent_reg = er.async_get(hass)
+
+        area_ids = [
+            area_reg.async_create(f"Area {idx}").id for idx in range(area_count)
+        ]
+        device_ids: list[str] = []
+        for idx in range(entity_count // entities_per_device):
+            device = dr.DeviceEntry(area_id=area_ids[idx % area_count])
+            dev_reg.devices[device.id] = device
+            device_ids.append(device.id)
+        for idx in range(entity_count):
+            entry = ent_reg.async_get_or_create(
+                "sensor",
+                f"platform_{idx % platform_count}",
+                str(idx),
+                device_id=device_ids[idx // entities_per_device],
+            )
+            ent_reg.async_update_entity(
+                entry.entity_id,
+                # Every third entity overrides the area of its device
+                area_id=area_ids[idx % area_count] if idx % 3 == 0 else None,
+                categories={"automation": f"category_{idx % category_count}"},
+            )
+
+        start = timer()
+        for idx in range(lookups):
+            # Moving a device moves its entities without an area of their own
+            dev_reg.async_update_device(
+                device_ids[idx], area_id=area_ids[(idx + 1) % area_count]
+            )
+            er.async_entries_for_effective_area(ent_reg, area_ids[idx % area_count])
+            er.async_entries_for_category(
+                ent_reg, "automation", f"category_{idx % category_count}"
+            )
+            er.async_entries_for_platform(ent_reg, f"platform_{idx % platform_count}")
+        runtime = timer() - start
+
+    print(f"{runtime / lookups * 1000:.3f}ms per device move and lookups")
+    return runtime
@@ -29,7 +29,7 @@ from .core import (
     callback,
 )
 from .exceptions import DependencyError, HomeAssistantError
-from .helpers import issue_registry as ir, singleton, translation
+from .helpers import issue_registry as ir, setup_scheduler, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
@@ -458,10 +458,11 @@ async def _async_setup_component(
     if entries := hass.config_entries.async_entries(
         domain, include_ignore=False, include_disabled=False
     ):
+        scheduler = setup_scheduler.async_get(hass)
         await asyncio.gather(
             *(
                 create_eager_task(
-                    entry.async_setup_locked(hass, integration=integration),
+                    scheduler.async_setup_entry(entry, integration),
                     name=(
                         f"config entry setup {entry.title} {entry.domain} "
                         f"{entry.entry_id}"
@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -18,11 +19,13 @@ from homeassistant.components.camera import (
     async_register_webrtc_provider,
 )
 from homeassistant.components.camera.const import (
+    DATA_CAMERA_PREFS,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
     StreamType,
 )
+from homeassistant.components.camera.frame_cache import CameraFrameCache
 from homeassistant.components.camera.helper import get_camera_from_entity_id
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.const import (
@@ -128,6 +131,113 @@ async def test_get_image_from_camera_with_width_height_scaled(
     assert image.content == EMPTY_8_6_JPEG
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_coalesced(hass: HomeAssistant) -> None:
+    """Test concurrent requests for an image share a single fetch."""
+    fetched = asyncio.Event()
+
+    async def _camera_image(*args, **kwargs) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+
+    assert mock_camera.call_count == 1
+    assert [image.content for image in images] == [b"Test"] * 3
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_frame_cache(hass: HomeAssistant) -> None:
+    """Test the images are served from the cache within the max age."""
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    demo_camera._attr_frame_cache_max_age = 10
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        # The thumbnail is scaled from the cached frame
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        assert image.content == EMPTY_8_6_JPEG
+        assert mock_camera.call_count == 1
+
+        demo_camera._attr_frame_cache_max_age = 0
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 2
+        # No frames are kept without a max age
+        assert not demo_camera.frame_cache._frames
+
+        # The max age of the preferences overrides the one of the camera
+        await hass.data[DATA_CAMERA_PREFS].async_update(
+            "camera.demo_camera", frame_cache_max_age=10
+        )
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 3
+
+
+async def test_frame_cache_fetch_timeout(hass: HomeAssistant) -> None:
+    """Test the caller waiting the longest governs the timeout of a fetch."""
+    fetched = asyncio.Event()
+
+    async def _fetch(width: int | None, height: int | None) -> camera.Image:
+        await fetched.wait()
+        return camera.Image("image/jpeg", b"Test")
+
+    frame_cache = CameraFrameCache(_fetch)
+    with pytest.raises(TimeoutError):
+        await frame_cache.async_get_image(None, None, 0, 0.01)
+
+    short = hass.async_create_task(frame_cache.async_get_image(None, None, 0, 0.01))
+    long = hass.async_create_task(frame_cache.async_get_image(None, None, 0, 10))
+    await asyncio.sleep(0.05)
+    fetched.set()
+    assert (await short).content == b"Test"
+    assert (await long).content == b"Test"
+
+
+async def test_frame_cache_still_stream(hass: HomeAssistant) -> None:
+    """Test the frames are kept until the last still stream ends."""
+    fetch = AsyncMock(return_value=camera.Image("image/jpeg", b"Test"))
+    frame_cache = CameraFrameCache(fetch)
+
+    with frame_cache.async_still_stream():
+        await frame_cache.async_get_image(None, None, 1)
+        await frame_cache.async_get_image(None, None, 1)
+        assert fetch.call_count == 1
+        # A caller without a max age leaves the frames of the stream
+        await frame_cache.async_get_image(1, 1, 0)
+        assert frame_cache._frames.keys() == {(None, None)}
+
+    assert not frame_cache._frames
+
+
 @pytest.mark.usefixtures("image_mock_url")
 async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     """Grab an image from camera entity that we cannot scale."""
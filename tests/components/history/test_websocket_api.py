@@ -10,6 +10,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import Statistics
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -454,6 +455,258 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_columnar_history_during_period(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test columnar_history_during_period streams states in chunks."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass)
+    start_time = dt_util.utcnow()
+
+    sensor_one_timestamps = []
+    for state in ("2", "3", "4", "5"):
+        hass.states.async_set("sensor.one", state)
+        sensor_one_timestamps.append(
+            hass.states.get("sensor.one").last_updated_timestamp
+        )
+        await async_recorder_block_till_done(hass)
+    # Attribute changes are not significant
+    hass.states.async_set("sensor.one", "5", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on")
+    sensor_two_timestamp = hass.states.get("sensor.two").last_updated_timestamp
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/columnar_history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two", "sensor.unknown"],
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response["event"] == {
+        "entity_id": "sensor.one",
+        "lu": [
+            pytest.approx(start_time.timestamp()),
+            pytest.approx(sensor_one_timestamps[0]),
+            pytest.approx(sensor_one_timestamps[1]),
+        ],
+        "s": ["1", "2", "3"],
+    }
+    response = await client.receive_json()
+    assert response["event"] == {
+        "entity_id": "sensor.one",
+        "lu": [
+            pytest.approx(sensor_one_timestamps[2]),
+            pytest.approx(sensor_one_timestamps[3]),
+        ],
+        "s": ["4", "5"],
+    }
+    response = await client.receive_json()
+    assert response["event"] == {
+        "entity_id": "sensor.two",
+        "lu": [pytest.approx(sensor_two_timestamp)],
+        "s": ["on"],
+    }
+    response = await client.receive_json()
+    assert response["event"] == {
+        "start_time": pytest.approx(start_time.timestamp()),
+        "end_time": ANY,
+    }
+
+
+async def test_columnar_history_during_period_shared_timestamps(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test columnar_history_during_period keeps rows sharing a timestamp."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    state_time = dt_util.utcnow()
+    start_time = state_time - timedelta(seconds=1)
+
+    with freeze_time(state_time):
+        for state in ("1", "2", "3", "4", "5"):
+            hass.states.async_set("sensor.one", state)
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/columnar_history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    states = []
+    while "entity_id" in (event := (await client.receive_json())["event"]):
+        assert event["lu"] == [pytest.approx(state_time.timestamp())] * len(event["s"])
+        states.extend(event["s"])
+    assert states == ["1", "2", "3", "4", "5"]
+    assert event["start_time"] == pytest.approx(start_time.timestamp())
+
+
+async def test_columnar_history_during_period_bad_start_time(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test columnar_history_during_period bad start time."""
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/columnar_history_during_period",
+            "entity_ids": ["sensor.pet"],
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_graph_history_during_period(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test graph_history_during_period picks the resolution from the width."""
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    now = dt_util.utcnow()
+    period_start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=48)
+    imported_stats = [
+        {
+            "start": period_start + timedelta(hours=hour),
+            "mean": hour + 0.5,
+            "min": hour,
+            "max": hour + 1,
+        }
+        for hour in range(3)
+    ]
+    recorder_mock.async_import_statistics(
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "recorder",
+            "statistic_id": "sensor.temperature",
+            "unit_of_measurement": "°C",
+        },
+        imported_stats,
+        Statistics,
+    )
+    hass.states.async_set("sensor.temperature", "21")
+    hass.states.async_set("sensor.humidity", "40")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/graph_during_period",
+            "start_time": period_start.isoformat(),
+            "end_time": (period_start + timedelta(hours=49)).isoformat(),
+            "entity_ids": ["sensor.temperature", "sensor.humidity"],
+            "width": 10,
+            "minimal_response": True,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["resolution"] == "hour"
+    assert result["statistics"] == {
+        "sensor.temperature": [
+            {
+                "start": (period_start + timedelta(hours=hour)).timestamp(),
+                "end": (period_start + timedelta(hours=hour + 1)).timestamp(),
+                "mean": hour + 0.5,
+                "min": hour,
+                "max": hour + 1,
+            }
+            for hour in range(3)
+        ]
+    }
+    # The states after the last rollup fill the tail of the graph
+    assert result["states"].keys() == {"sensor.temperature", "sensor.humidity"}
+    assert result["states"]["sensor.temperature"][0]["s"] == "21"
+    assert result["states"]["sensor.humidity"][0]["s"] == "40"
+
+    # There is no tail when the rollups cover the whole period
+    await client.send_json_auto_id(
+        {
+            "type": "history/graph_during_period",
+            "start_time": period_start.isoformat(),
+            "end_time": (period_start + timedelta(hours=3)).isoformat(),
+            "entity_ids": ["sensor.temperature"],
+            "width": 1,
+            "minimal_response": True,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["resolution"] == "hour"
+    assert len(result["statistics"]["sensor.temperature"]) == 3
+    assert result["states"] == {}
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/graph_during_period",
+            "start_time": (now - timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.temperature", "sensor.humidity"],
+            "width": 1000,
+            "minimal_response": True,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["resolution"] == "raw"
+    assert result["statistics"] == {}
+    assert result["states"]["sensor.temperature"][0]["s"] == "21"
+    assert result["states"]["sensor.humidity"][0]["s"] == "40"
+
+
+async def test_graph_history_during_period_bad_start_time(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test graph_history_during_period bad start time."""
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/graph_during_period",
+            "entity_ids": ["sensor.pet"],
+            "start_time": "cats",
+            "width": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -5,14 +5,18 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
 
 from homeassistant.components import influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.spool import InfluxSpool
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -65,12 +69,45 @@ def mock_client_fixture(
         yield client
 
 
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep the spool of the tests out of the testing config."""
+    hass.config.config_dir = str(tmp_path)
+
+
+class LineProtocol:
+    """Match the points written in line protocol, ignoring their time."""
+
+    def __init__(self, body) -> None:
+        """Encode the expected points."""
+        points = [
+            {
+                **point,
+                "time": None,
+                "fields": {
+                    key: float(value) if type(value) is int else value
+                    for key, value in point["fields"].items()
+                },
+            }
+            for point in body
+        ]
+        self.lines = make_lines({"points": points}).splitlines()
+
+    def __eq__(self, other) -> bool:
+        """Compare to the lines written without their timestamp."""
+        return [line.rsplit(" ", 1)[0] for line in other] == self.lines
+
+    def __repr__(self) -> str:
+        """Return the expected lines."""
+        return repr(self.lines)
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +116,9 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        LineProtocol(body), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1059,11 +1098,12 @@ async def test_event_listener_tags_attributes(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
     """Test the event listener when some attributes should be tags."""
-    config = {"tags_attributes": ["friendly_fake"]}
+    config = {"tags_attributes": ["friendly_fake", "none_fake"]}
     config.update(config_ext)
     await _setup(hass, mock_client, config, get_write_api)
 
-    attrs = {"friendly_fake": "tag_str", "field_fake": "field_str"}
+    # The attributes without a value are not tags
+    attrs = {"friendly_fake": "tag_str", "none_fake": None, "field_fake": "field_str"}
     body = [
         {
             "measurement": "fake.something",
@@ -1387,6 +1427,113 @@ async def test_event_listener_scheduled_write(
     assert write_api.call_count == 3
 
 
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test the events are spooled while the writes fail and written later."""
+    config = {"include": {"domains": ["fake"]}}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    # Write fails, the point is spooled
+    hass.states.async_set("fake.entity_id", 1)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 1
+
+    await async_update_entity(hass, "sensor.influxdb_spooled_events")
+    assert hass.states.get("sensor.influxdb_spooled_events").state == "1"
+
+    # Write works again, the spooled point is written first
+    write_api.side_effect = None
+    write_api.reset_mock()
+    hass.states.async_set("fake.entity_id", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    point = {
+        "measurement": "fake.entity_id",
+        "tags": {"domain": "fake", "entity_id": "entity_id"},
+    }
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(
+        [{**point, "fields": {"value": 1.0}}, {**point, "fields": {"value": 2.0}}]
+    )
+
+    await async_update_entity(hass, "sensor.influxdb_spooled_events")
+    assert hass.states.get("sensor.influxdb_spooled_events").state == "0"
+
+
+def test_spool_consume(tmp_path: Path) -> None:
+    """Test the written points are skipped and compacted away."""
+    path = str(tmp_path / "influxdb.spool")
+    spool = InfluxSpool(path, 1024)
+    assert spool.append([f"point{index}" for index in range(6)]) == 0
+    assert spool.points == 6
+
+    # The written points are skipped without rewriting the file
+    spool.consume(2)
+    assert spool.peek(2) == ["point2", "point3"]
+    assert spool.points == 4
+    assert spool.size == 28
+    assert Path(path).read_text().startswith("point0\n")
+
+    # The file is rewritten once half of it was written
+    spool.consume(1)
+    assert Path(path).read_text() == "point3\npoint4\npoint5\n"
+    assert spool.peek(5) == ["point3", "point4", "point5"]
+
+    # The points are kept over a restart
+    spool.consume(1)
+    spool.compact()
+    spool = InfluxSpool(path, 1024)
+    spool.load()
+    assert spool.points == 2
+    assert spool.peek(5) == ["point4", "point5"]
+
+    spool.consume(2)
+    assert spool.points == 0
+    assert not Path(path).exists()
+
+
+def test_spool_bounded(tmp_path: Path) -> None:
+    """Test the written points count toward the size until compacted away."""
+    path = str(tmp_path / "influxdb.spool")
+    spool = InfluxSpool(path, 28)
+    assert spool.append([f"point{index}" for index in range(4)]) == 0
+    spool.consume(1)
+    assert Path(path).read_text().startswith("point0\n")
+
+    # The spool is compacted to make room for the new points
+    assert spool.append(["point4"]) == 0
+    assert Path(path).read_text() == "point1\npoint2\npoint3\npoint4\n"
+    assert spool.size == 28
+
+    # Points which do not fit are dropped
+    assert spool.append(["point5"]) == 1
+    assert spool.points == 4
+
+
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
     [
@@ -1426,6 +1573,9 @@ async def test_event_listener_backlog_full(
 
         assert get_write_api(mock_client).call_count == 0
 
+    await async_update_entity(hass, "sensor.influxdb_dropped_events")
+    assert hass.states.get("sensor.influxdb_dropped_events").state == "1"
+
 
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
@@ -292,6 +292,100 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_context_origins(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test get_events attributes contexts the same with the context origins."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    # States without a previous state are not shown in the logbook
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.porch", STATE_OFF)
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    context_origins_manager = get_instance(hass).context_origins_manager
+    assert context_origins_manager.covers(now.timestamp())
+
+    automation_context = core.Context(
+        id="01GTDGKBCH00GW0X276W5TEDDD",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {
+            ATTR_NAME: "Mock automation",
+            ATTR_ENTITY_ID: "automation.alarm",
+            ATTR_SOURCE: "state of binary_sensor.dog_food_ready",
+        },
+        context=automation_context,
+    )
+    hass.bus.async_fire(
+        EVENT_SCRIPT_STARTED,
+        {ATTR_NAME: "Mock script", ATTR_ENTITY_ID: "script.mock_script"},
+        context=automation_context,
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, context=automation_context)
+    state_context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDE")
+    hass.states.async_set("switch.hall", STATE_ON, context=state_context)
+    await async_wait_recording_done(hass)
+    # The origins of contexts that left the recently written rows
+    # are found in the database
+    context_origins_manager._first_rows.clear()
+    hass.states.async_set("light.kitchen", STATE_OFF, context=state_context)
+    hass.states.async_set("light.porch", STATE_ON, context=core.Context())
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def _async_get_events(msg_id: int) -> list[dict[str, Any]]:
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen", "light.porch"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    results = await _async_get_events(1)
+    with patch.object(
+        type(context_origins_manager), "covers", return_value=False
+    ) as covers:
+        assert await _async_get_events(2) == results
+    assert covers.called
+
+    assert [
+        {
+            key: value
+            for key, value in result.items()
+            if key.startswith("context_") and key != "context_id"
+        }
+        for result in results
+    ] == [
+        {
+            "context_domain": "automation",
+            "context_entity_id": "automation.alarm",
+            "context_event_type": "automation_triggered",
+            "context_message": "triggered by state of binary_sensor.dog_food_ready",
+            "context_name": "Mock automation",
+            "context_source": "state of binary_sensor.dog_food_ready",
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+        },
+        {
+            "context_entity_id": "switch.hall",
+            "context_state": "on",
+        },
+        {},
+    ]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -122,6 +122,76 @@ async def help_create_test_certificate_file(
     await hass.async_add_executor_job(_create_file)
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        (
+            "sensor/kitchen/temperature",
+            [
+                "sensor/kitchen/temperature",
+                "sensor/+/temperature",
+                "sensor/#",
+                "#",
+                "+/+/+",
+            ],
+        ),
+        ("sensor/kitchen", ["sensor/#", "#"]),
+        ("sensor", ["sensor/#", "#"]),
+        ("sensor/kitchen/humidity", ["sensor/#", "#", "+/+/+"]),
+        ("light/kitchen/state", ["#", "+/+/+"]),
+        ("$SYS/broker/uptime", ["$SYS/#"]),
+        ("other", ["#"]),
+    ],
+)
+def test_topic_trie_match(topic: str, expected: list[str]) -> None:
+    """Test matching topics against topic filters in a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "sensor/kitchen/temperature",
+        "sensor/+/temperature",
+        "sensor/#",
+        "#",
+        "+/+/+",
+        "$SYS/#",
+    ):
+        trie.add(topic_filter, topic_filter)
+
+    # Matches are returned in the order the filters were added
+    assert trie.match(topic) == sorted(
+        expected,
+        key=[
+            "sensor/kitchen/temperature",
+            "sensor/+/temperature",
+            "sensor/#",
+            "#",
+            "+/+/+",
+            "$SYS/#",
+        ].index,
+    )
+
+
+def test_topic_trie_remove() -> None:
+    """Test removing values from a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/+/state", "first")
+    trie.add("home/+/state", "second")
+    trie.add("home/#", "third")
+
+    assert trie.match("home/kitchen/state") == ["first", "second", "third"]
+
+    trie.remove("home/+/state", "first")
+    assert trie.match("home/kitchen/state") == ["second", "third"]
+
+    trie.remove("home/+/state", "second")
+    trie.remove("home/#", "third")
+    assert trie.match("home/kitchen/state") == []
+
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", "first")
+    with pytest.raises(KeyError):
+        trie.remove("home/#", "third")
+
+
 @pytest.mark.parametrize(
     ("option", "content"),
     [
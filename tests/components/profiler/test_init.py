@@ -1,11 +1,12 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun.api import FrozenDateTimeFactory
 from lru import LRU
@@ -25,18 +26,23 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_EVENT_LISTENER_PROFILE,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_EVENT_LISTENER_PROFILE,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.loop_monitor import LAG_BUCKETS
 from homeassistant.util import dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -447,3 +453,125 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_event_listener_profile(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test profiling the event listeners."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    @callback
+    def _slow_listener(event: Event) -> None:
+        """Listen to test events."""
+
+    hass.bus.async_listen("test_event", _slow_listener)
+    client = await hass_ws_client(hass)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_EVENT_LISTENER_PROFILE, {}, blocking=True
+    )
+    with pytest.raises(
+        HomeAssistantError, match="Event listener profiling already started"
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_EVENT_LISTENER_PROFILE, {}, blocking=True
+        )
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+
+    await client.send_json_auto_id({"type": "profiler/event_listeners"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    listeners = [
+        stats
+        for stats in response["result"]["listeners"]
+        if stats["event_type"] == "test_event"
+    ]
+    assert listeners == [
+        {
+            "event_type": "test_event",
+            "integration": "tests",
+            "listener": (
+                f"{__name__}.test_event_listener_profile.<locals>._slow_listener"
+            ),
+            "count": 2,
+            "total": ANY,
+            "p99": ANY,
+        }
+    ]
+    assert response["result"]["integrations"]["tests"]["count"] >= 2
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_EVENT_LISTENER_PROFILE, {}, blocking=True
+    )
+    assert "_slow_listener for test_event of tests: 2 calls" in caplog.text
+    with pytest.raises(
+        HomeAssistantError, match="Event listener profiling not running"
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_EVENT_LISTENER_PROFILE, {}, blocking=True
+        )
+
+    # The runs are kept once stopped
+    hass.bus.async_fire("test_event")
+    await client.send_json_auto_id({"type": "profiler/event_listeners"})
+    response = await client.receive_json()
+    assert response["result"]["running"] is False
+    assert [
+        stats["count"]
+        for stats in response["result"]["listeners"]
+        if stats["event_type"] == "test_event"
+    ] == [2]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@patch("homeassistant.helpers.loop_monitor.LAG_SAMPLE_INTERVAL", 0.01)
+async def test_loop_health(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the scheduling lag of the event loop is exposed."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    async with asyncio.timeout(5):
+        while True:
+            await client.send_json_auto_id({"type": "profiler/loop_health"})
+            response = await client.receive_json()
+            assert response["success"]
+            if sum(response["result"]["lag_counts"]) >= 2:
+                break
+            await asyncio.sleep(0.01)
+
+    health = response["result"]
+    assert health["lag_buckets"] == list(LAG_BUCKETS)
+    assert health["slow_callback_count"] == 0
+    assert health["slow_callbacks"] == []
+
+    await async_update_entity(hass, "sensor.profiler_event_loop_lag_99th_percentile")
+    state = hass.states.get("sensor.profiler_event_loop_lag_99th_percentile")
+    assert state is not None
+    assert float(state.state) >= 0
+    assert state.attributes["unit_of_measurement"] == "ms"
+    state = hass.states.get("sensor.profiler_slow_event_loop_callbacks")
+    assert state is not None
+    assert state.state == "0"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
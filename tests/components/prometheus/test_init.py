@@ -1,5 +1,6 @@
 """The tests for the Prometheus exporter."""
 
+from collections.abc import Generator
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
@@ -460,11 +461,22 @@ def test_entity_metric_with_value_assert_helpers() -> None:
     climate_entity_metric.assert_in_metrics(metrics)
 
 
+@pytest.fixture(
+    name="collect_on_scrape", params=[False, True], ids=["on_change", "on_scrape"]
+)
+def collect_on_scrape_fixture(request: pytest.FixtureRequest) -> Generator[bool]:
+    """Collect the metrics on state changes and on scrape."""
+    # Collect on each scrape, the tests change states between scrapes
+    with mock.patch(f"{PROMETHEUS_PATH}.EXPOSITION_CACHE_TTL", -1):
+        yield request.param
+
+
 @pytest.fixture(name="client")
 async def setup_prometheus_client(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
     namespace: str,
+    collect_on_scrape: bool,
 ):
     """Initialize an hass_client with Prometheus component."""
     # Reset registry
@@ -473,7 +485,7 @@ async def setup_prometheus_client(
     prometheus_client.PlatformCollector(registry=prometheus_client.REGISTRY)
     prometheus_client.GCCollector(registry=prometheus_client.REGISTRY)
 
-    config = {}
+    config = {prometheus.CONF_COLLECT_ON_SCRAPE: collect_on_scrape}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
     assert await async_setup_component(
@@ -1250,6 +1262,41 @@ async def test_update(
     ).withValue(0.0).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [True])
+async def test_collect_on_scrape_cached(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test the metrics collected on scrape are cached for the next scrapes."""
+    body = await generate_latest_metrics(client)
+    temperature = EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    )
+    state_changes = EntityMetric(
+        metric_name="state_change_total",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    )
+    temperature.withValue(15.6).assert_in_metrics(body)
+    state_changes.withValue(1).assert_in_metrics(body)
+
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 16.2)
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 17.1)
+    await hass.async_block_till_done()
+    assert await generate_latest_metrics(client) == body
+
+    with mock.patch(f"{PROMETHEUS_PATH}.EXPOSITION_CACHE_TTL", -1):
+        body = await generate_latest_metrics(client)
+    temperature.withValue(17.1).assert_in_metrics(body)
+    state_changes.withValue(3).assert_in_metrics(body)
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
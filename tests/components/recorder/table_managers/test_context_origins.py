@@ -0,0 +1,128 @@
+"""Test the context origins manager."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import Events, States
+from homeassistant.components.recorder.table_managers import context_origins
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.ulid import ulid_to_bytes
+
+from ..common import async_recorder_block_till_done, async_wait_recording_done
+
+
+async def test_context_origins(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test the origins of contexts with more than one row are tracked."""
+    manager = recorder_mock.context_origins_manager
+    start_ts = time.time()
+    shared_context = Context()
+    single_context = Context()
+
+    hass.bus.async_fire("test_event", {"data": 1}, context=shared_context)
+    hass.states.async_set("light.kitchen", "on", context=shared_context)
+    hass.states.async_set("light.hall", "on", context=single_context)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        event_id = session.query(Events.event_id).filter(
+            Events.context_id_bin == ulid_to_bytes(shared_context.id)
+        )[0][0]
+
+    assert manager.get_many(
+        [ulid_to_bytes(shared_context.id), ulid_to_bytes(single_context.id)]
+    ) == [(False, event_id, hass.states.get("light.kitchen").last_updated_timestamp)]
+    assert manager.covers(time.time())
+    assert not manager.covers(start_ts - 60)
+
+
+async def test_context_origin_found_in_database(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the origin is found in the database once it left the recent rows."""
+    manager = recorder_mock.context_origins_manager
+    context = Context()
+
+    hass.states.async_set("light.kitchen", "on", context=context)
+    await async_wait_recording_done(hass)
+    manager._first_rows.clear()
+
+    hass.states.async_set("light.hall", "on", context=context)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        state_id = session.query(States.state_id).filter(
+            States.state == "on", States.context_id_bin == ulid_to_bytes(context.id)
+        )[0][0]
+
+    assert [origin[:2] for origin in manager.get_many([ulid_to_bytes(context.id)])] == [
+        (True, state_id)
+    ]
+
+
+@pytest.mark.parametrize("recorder_config", [{"commit_interval": 1}])
+async def test_context_origins_found_in_database_batched(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the origins of the contexts of a batch are found with one query."""
+    manager = recorder_mock.context_origins_manager
+    contexts = [Context(), Context()]
+
+    for context in contexts:
+        hass.states.async_set("light.kitchen", context.id, context=context)
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    manager._first_rows.clear()
+
+    with patch.object(
+        context_origins,
+        "find_contexts_first_states",
+        wraps=context_origins.find_contexts_first_states,
+    ) as find_contexts_first_states:
+        for context in contexts:
+            hass.states.async_set("light.hall", context.id, context=context)
+            hass.states.async_set("light.porch", context.id, context=context)
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert find_contexts_first_states.call_count == 1
+    with session_scope(hass=hass, read_only=True) as session:
+        state_ids = [
+            session.query(States.state_id).filter(
+                States.context_id_bin == ulid_to_bytes(context.id)
+            )[0][0]
+            for context in contexts
+        ]
+    assert [
+        origin[:2]
+        for origin in manager.get_many(
+            [ulid_to_bytes(context.id) for context in contexts]
+        )
+    ] == [(True, state_id) for state_id in state_ids]
+
+
+async def test_context_origins_eviction(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test evicting an origin stops covering the time before it was recorded."""
+    manager = recorder_mock.context_origins_manager
+    manager._origins.set_size(1)
+    start_ts = time.time()
+    assert manager.covers(start_ts)
+
+    first_context = Context()
+    second_context = Context()
+    hass.bus.async_fire("test_event", context=first_context)
+    hass.bus.async_fire("test_event", context=first_context)
+    await async_wait_recording_done(hass)
+    assert manager.covers(start_ts)
+
+    hass.bus.async_fire("test_event", context=second_context)
+    hass.bus.async_fire("test_event", context=second_context)
+    await async_wait_recording_done(hass)
+    assert not manager.covers(start_ts)
+    assert manager.get_many([ulid_to_bytes(first_context.id)]) == []
+    assert len(manager.get_many([ulid_to_bytes(second_context.id)])) == 1
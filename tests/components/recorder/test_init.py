@@ -22,6 +22,7 @@ from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
+    CONF_DB_BULK_INSERT,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
@@ -130,10 +131,12 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_time_buckets=False,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_bulk_insert=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -1473,6 +1476,96 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_DB_BULK_INSERT: True}])
+async def test_saving_with_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving states and events with bulk inserts."""
+    instance = get_instance(hass)
+    assert instance._bulk_insert_buffer is not None
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.async_set("test.one", "s1", attributes)
+    hass.states.async_set("test.two", "s2", attributes)
+    hass.states.async_set("test.one", "s3", attributes)
+    hass.states.async_set("test.one", "s4", {"test_attr": 6})
+    hass.bus.async_fire("test_event", {"test_attr": 5})
+    hass.bus.async_fire("test_event", {"test_attr": 5})
+    await async_wait_recording_done(hass)
+    # States referencing states committed in the previous commit
+    hass.states.async_set("test.two", "s5", attributes)
+    await async_wait_recording_done(hass)
+    assert not instance._bulk_insert_buffer
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s5"].entity_id == "test.two"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+
+        assert json_loads(states_by_state["s1"].shared_attrs) == attributes
+        assert json_loads(states_by_state["s4"].shared_attrs) == {"test_attr": 6}
+        assert session.query(StateAttributes).count() == 2
+        assert session.query(StatesMeta).count() == 2
+
+        events = list(
+            session.query(Events, EventData)
+            .filter(Events.event_type_id.in_(select_event_type_ids(("test_event",))))
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+        )
+        assert len(events) == 2
+        assert all(
+            event_data.to_native() == {"test_attr": 5} for _, event_data in events
+        )
+        assert events[0][0].data_id == events[1][0].data_id
+
+
+async def test_bulk_insert_not_supported(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test falling back to the session when bulk inserts are not supported."""
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_insert",
+        return_value=False,
+    ):
+        instance = await async_setup_recorder_instance(
+            hass, {CONF_DB_BULK_INSERT: True}
+        )
+    assert instance._bulk_insert_buffer is None
+    assert "Bulk inserts are not supported by the sqlite database" in caplog.text
+
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 1
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
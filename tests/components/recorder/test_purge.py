@@ -26,7 +26,11 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.queries import (
+    delete_states_rows_before,
+    disconnect_states_rows_before,
+    select_event_type_ids,
+)
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
@@ -359,6 +363,135 @@ async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert events.count() == 2
 
 
+async def test_disconnect_states_rows_before(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test all links to the states of a time bucket are removed before deleting.
+
+    MySQL checks the foreign key of each row while a delete runs, so the
+    states being deleted must not link to each other either. Run with
+    --dburl to test against MySQL or PostgreSQL.
+    """
+    await _add_test_states(hass)
+    purge_before_ts = (dt_util.utcnow() - timedelta(days=4)).timestamp()
+
+    with session_scope(hass=hass) as session:
+        old_state_ids = {
+            state.state_id
+            for state in session.query(States).filter(
+                States.last_updated_ts < purge_before_ts
+            )
+        }
+        # The states to purge link to each other
+        assert (
+            session.query(States)
+            .filter(States.old_state_id.in_(old_state_ids))
+            .filter(States.last_updated_ts < purge_before_ts)
+            .count()
+            == 3
+        )
+
+        session.execute(disconnect_states_rows_before(purge_before_ts))
+        assert (
+            session.query(States).filter(States.old_state_id.in_(old_state_ids)).count()
+            == 0
+        )
+
+        session.execute(delete_states_rows_before(purge_before_ts))
+
+    with session_scope(hass=hass) as session:
+        assert {state.state for state in session.query(States)} == {
+            "dontpurgeme_4",
+            "dontpurgeme_5",
+        }
+
+
+@pytest.mark.parametrize("recorder_config", [{"purge_time_buckets": True}])
+async def test_purge_old_states_and_events_by_time_bucket(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting old states and events one time bucket at a time."""
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+    with freeze_time(eleven_days_ago):
+        hass.states.async_set("test.stale", "purgeme")
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 7
+        assert session.query(StateAttributes).count() == 4
+
+    assert "test.stale" in recorder_mock.states_manager._last_committed_id
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    # The first call purges the bucket eleven days ago
+    assert not purge_old_data(recorder_mock, purge_before, repack=False)
+    assert "test.stale" not in recorder_mock.states_manager._last_committed_id
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+        assert session.query(StateAttributes).count() == 2
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 4
+
+    # The second call purges the bucket five days ago
+    assert not purge_old_data(recorder_mock, purge_before, repack=False)
+    # Nothing older than purge_before is left
+    assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+    with session_scope(hass=hass) as session:
+        state_map_by_state = {state.state: state for state in session.query(States)}
+        assert state_map_by_state.keys() == {"dontpurgeme_4", "dontpurgeme_5"}
+        dontpurgeme_5 = state_map_by_state["dontpurgeme_5"]
+        dontpurgeme_4 = state_map_by_state["dontpurgeme_4"]
+        assert dontpurgeme_5.old_state_id == dontpurgeme_4.state_id
+        assert dontpurgeme_4.old_state_id is None
+        assert session.query(StateAttributes).count() == 1
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 2
+
+
+@pytest.mark.parametrize("recorder_config", [{"purge_time_buckets": True}])
+async def test_purge_time_bucket_bounded(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a time bucket holds at most the states of the purge batches."""
+    eleven_days_ago = dt_util.utcnow().replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(days=11)
+    for seconds in range(4):
+        with freeze_time(eleven_days_ago + timedelta(seconds=seconds)):
+            hass.states.async_set("test.bounded", str(seconds))
+    # More states than a bucket holds have the same timestamp
+    with freeze_time(eleven_days_ago + timedelta(seconds=10)):
+        for index in range(3):
+            hass.states.async_set(f"test.same_time_{index}", "on")
+    await async_wait_recording_done(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    def _purge_and_count() -> tuple[bool, int]:
+        finished = purge_old_data(
+            recorder_mock,
+            purge_before,
+            repack=False,
+            events_batch_size=1,
+            states_batch_size=1,
+        )
+        with session_scope(hass=hass) as session:
+            return finished, session.query(States).count()
+
+    with patch.object(recorder_mock, "max_bind_vars", 2):
+        assert _purge_and_count() == (False, 5)
+        assert _purge_and_count() == (False, 3)
+        # The states with the same timestamp are purged together
+        assert _purge_and_count() == (False, 0)
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, recorder_mock: Recorder
 ) -> None:
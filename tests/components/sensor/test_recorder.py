@@ -36,6 +36,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import _mean_min_max
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -5506,3 +5507,64 @@ async def test_clean_up_repairs(
         ("sensor", "test_issue_1"),
         ("sensor", "test_issue_2"),
     }
+
+
+@pytest.mark.parametrize(
+    ("states", "mean"),
+    [
+        # A single state holds for the whole period
+        ([(7.0, 60)], 7.0),
+        # The last state before the period holds until the next change
+        ([(1.0, -200), (10.0, -100), (20.0, 150)], 15.0),
+        # Without a state before the period, the period starts at the first
+        ([(10.0, 60), (20.0, 180)], 15.0),
+        # The last of the states with the same timestamp holds
+        ([(1.0, 0), (5.0, 0), (3.0, 60)], 3.4),
+        ([(1.0, -100), (5.0, -50), (3.0, 60)], 3.4),
+        # A state changed at the end of the period
+        ([(7.0, 300)], 0.0),
+    ],
+)
+def test_mean_min_max(states: list[tuple[float, int]], mean: float) -> None:
+    """Test the time weighted average, min and max of the states of a period."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    end = start + timedelta(minutes=5)
+
+    def _fstates(entity_id: str) -> list[tuple[float, State]]:
+        return [
+            (
+                fstate,
+                State(
+                    entity_id,
+                    str(fstate),
+                    last_updated=start + timedelta(seconds=offset),
+                ),
+            )
+            for fstate, offset in states
+        ]
+
+    values = [fstate for fstate, _ in states]
+    assert _mean_min_max([_fstates("sensor.test")], start, end) == (
+        [pytest.approx(mean)],
+        [min(values)],
+        [max(values)],
+    )
+
+    # The statistics of each entity only depend on its own states
+    other = [
+        (
+            -5.0,
+            State("sensor.other", "-5.0", last_updated=start + timedelta(seconds=30)),
+        )
+    ]
+    assert _mean_min_max([other, _fstates("sensor.test"), other], start, end) == (
+        [-5.0, pytest.approx(mean), -5.0],
+        [-5.0, min(values), -5.0],
+        [-5.0, max(values), -5.0],
+    )
+
+
+def test_mean_min_max_no_entities() -> None:
+    """Test the statistics without entities."""
+    start = dt_util.utcnow()
+    assert _mean_min_max([], start, start + timedelta(minutes=5)) == ([], [], [])
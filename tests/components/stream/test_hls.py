@@ -445,6 +445,43 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_max_segment_bytes(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the oldest segments are dropped once over the memory budget."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    part = Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=FAKE_PAYLOAD)
+    segment_size = 2 * len(FAKE_PAYLOAD)
+    with patch(
+        "homeassistant.components.stream.hls.MAX_SEGMENT_BYTES", 2 * segment_size
+    ):
+        for sequence in range(4):
+            segment = Segment(sequence=sequence, duration=SEGMENT_DURATION)
+            segment.init = INIT_BYTES
+            segment.parts = [part, part]
+            hls.put(segment)
+            await hass.async_block_till_done()
+
+    assert hls.sequences == [2, 3]
+    assert hls.bytes_held == 2 * segment_size
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["segment_bytes_held"] == 2 * segment_size
+    assert diagnostics["segments_evicted"] == 2
+
+    # The parts of a segment are served as a whole
+    segment_response = await hls_client.get("/segment/3.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD * 2
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -18,6 +18,7 @@ from homeassistant.components.stream.const import (
 )
 from homeassistant.components.stream.core import Orientation, Part
 from homeassistant.components.stream.fmp4utils import find_box
+from homeassistant.components.stream.lookback import LookbackSpool
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
@@ -97,6 +98,35 @@ async def test_record_lookback(hass: HomeAssistant, filename, h264_video) -> Non
     await stream.stop()
 
 
+def test_lookback_spool() -> None:
+    """Test the lookback spool overwrites the oldest segments."""
+    spool = LookbackSpool(100)
+    for sequence in range(4):
+        segment = Segment(sequence=sequence, init=b"init")
+        parts = [Part(duration=1, has_keyframe=True, data=bytes([sequence]) * 26)]
+        spool.write(segment, parts, 1)
+
+    # The first segment was overwritten by the last one
+    assert spool.read(0) is None
+    assert spool.bytes_held == 90
+    assert spool.lookback(2, before=4) == [2, 3]
+    assert spool.lookback(0, before=3) == [2]
+    assert spool.lookback(10, before=4) == [1, 2, 3]
+
+    segment = spool.read(2)
+    assert segment.init == b"init"
+    assert segment.duration == 1
+    assert segment.get_data() == b"\x02" * 26
+
+    # Segments larger than the spool are not spooled
+    spool.write(Segment(sequence=4, init=b"init"), [Part(1, True, b"0" * 100)], 1)
+    assert spool.read(4) is None
+    assert spool.lookback(10, before=5) == [1, 2, 3]
+
+    spool.close()
+    assert spool.read(3) is None
+
+
 async def test_record_path_not_allowed(hass: HomeAssistant, h264_video) -> None:
     """Test where the output path is not allowed by home assistant configuration."""
 
@@ -172,6 +202,68 @@ async def test_recorder_discontinuity(
     assert os.path.exists(filename)
 
 
+async def test_recorder_lookback_spool(
+    hass: HomeAssistant, filename, h264_video
+) -> None:
+    """Test recorder save with the lookback read from the spool."""
+
+    # Run
+    segment_1 = Segment(sequence=1, stream_id=0)
+    add_parts_to_segment(segment_1, h264_video)
+    lookback_spool = LookbackSpool(1024 * 1024)
+    lookback_spool.write(segment_1, segment_1.parts, 4)
+    segment_2 = Segment(sequence=2, stream_id=1)
+    add_parts_to_segment(segment_2, h264_video)
+    segment_2.duration = 4
+
+    provider_ready = asyncio.Event()
+
+    class MockStream(Stream):
+        """Mock Stream so we can patch add_provider."""
+
+        async def start(self):
+            """Make Stream.start a noop that gives up async context."""
+            await asyncio.sleep(0)
+
+        def add_provider(self, fmt, timeout=OUTPUT_IDLE_TIMEOUT):
+            """Add a finished event to Stream.add_provider."""
+            provider = Stream.add_provider(self, fmt, timeout)
+            provider_ready.set()
+            return provider
+
+    with (
+        patch.object(hass.config, "is_allowed_path", return_value=True),
+        patch("homeassistant.components.stream.Stream", wraps=MockStream),
+        patch("homeassistant.components.stream.recorder.RecorderOutput.recv"),
+        patch.object(
+            lookback_spool, "read", wraps=lookback_spool.read
+        ) as mock_spool_read,
+    ):
+        stream = create_stream(hass, "blank", {}, dynamic_stream_settings())
+        stream._lookback_spool = lookback_spool
+        make_recording = hass.async_create_task(
+            stream.async_record(filename, lookback=4)
+        )
+        await provider_ready.wait()
+
+        recorder_output = stream.outputs()[RECORDER_PROVIDER]
+        recorder_output.idle_timer.start()
+        recorder_output._segments.append(segment_2)
+
+        # Fire the IdleTimer
+        future = dt_util.utcnow() + timedelta(seconds=30)
+        async_fire_time_changed(hass, future)
+
+        await make_recording
+    # Assert
+    mock_spool_read.assert_called_once_with(1)
+    assert os.path.exists(filename)
+    with av.open(filename) as recording, av.open(h264_video) as source:
+        assert recording.duration == pytest.approx(2 * source.duration, rel=0.1)
+
+    lookback_spool.close()
+
+
 async def test_recorder_no_segments(hass: HomeAssistant, filename) -> None:
     """Test recorder behavior with a stream failure which causes no segments."""
 
@@ -42,7 +42,9 @@ from homeassistant.components.stream.const import (
 )
 from homeassistant.components.stream.core import Orientation, StreamSettings
 from homeassistant.components.stream.exceptions import StreamClientError
+from homeassistant.components.stream.lookback import LookbackSpool
 from homeassistant.components.stream.worker import (
+    SegmentBuffer,
     StreamEndedError,
     StreamState,
     StreamWorkerError,
@@ -215,7 +217,7 @@ class FakePyAvBuffer:
         self.segments = []
         self.audio_packets = []
         self.video_packets = []
-        self.memory_file: io.BytesIO | None = None
+        self.memory_file: SegmentBuffer | None = None
 
     def add_stream(self, template=None):
         """Create an output buffer that captures packets for test to examine."""
@@ -278,7 +280,7 @@ class MockPyAv:
 
     def open(self, stream_source, *args, **kwargs):
         """Return a stream or buffer depending on args."""
-        if isinstance(stream_source, io.BytesIO):
+        if isinstance(stream_source, SegmentBuffer):
             self.capture_buffer.memory_file = stream_source
             return self.capture_buffer
         return self.container
@@ -289,9 +291,12 @@ def run_worker(
     stream: Stream,
     stream_source: str,
     stream_settings: StreamSettings | None = None,
+    lookback_spool: LookbackSpool | None = None,
 ) -> None:
     """Run the stream worker under test."""
-    stream_state = StreamState(hass, stream.outputs, stream._diagnostics)
+    stream_state = StreamState(
+        hass, stream.outputs, stream._diagnostics, lookback_spool
+    )
     stream_worker(
         stream_source,
         {},
@@ -307,6 +312,7 @@ async def async_decode_stream(
     packets: PacketSequence,
     py_av: MockPyAv | None = None,
     stream_settings: StreamSettings | None = None,
+    lookback_spool: LookbackSpool | None = None,
 ) -> FakePyAvBuffer:
     """Start a stream worker that decodes incoming stream packets into output segments."""
     stream = Stream(
@@ -330,7 +336,7 @@ async def async_decode_stream(
         ),
     ):
         try:
-            run_worker(hass, stream, STREAM_SOURCE, stream_settings)
+            run_worker(hass, stream, STREAM_SOURCE, stream_settings, lookback_spool)
         except StreamEndedError:
             # Tests only use a limited number of packets, then the worker exits as expected. In
             # production, stream ending would be unexpected.
@@ -391,6 +397,24 @@ async def test_stream_worker_success(hass: HomeAssistant) -> None:
     assert len(decoded_stream.audio_packets) == 0
 
 
+async def test_stream_worker_lookback_spool(hass: HomeAssistant) -> None:
+    """Test the completed segments are written to the lookback spool."""
+    lookback_spool = LookbackSpool(1024 * 1024)
+    decoded_stream = await async_decode_stream(
+        hass, PacketSequence(TEST_SEQUENCE_LENGTH), lookback_spool=lookback_spool
+    )
+    complete_segments = decoded_stream.complete_segments
+    assert lookback_spool.lookback(
+        SEGMENT_DURATION * len(complete_segments), before=len(complete_segments)
+    ) == [segment.sequence for segment in complete_segments]
+    for segment in complete_segments:
+        spooled = lookback_spool.read(segment.sequence)
+        assert spooled.init == segment.init
+        assert spooled.get_data() == segment.get_data()
+        assert spooled.duration == SEGMENT_DURATION
+    lookback_spool.close()
+
+
 async def test_skip_out_of_order_packet(hass: HomeAssistant) -> None:
     """Skip a single out of order packet."""
     packets = list(PacketSequence(TEST_SEQUENCE_LENGTH))
@@ -732,7 +756,7 @@ async def test_update_stream_source(hass: HomeAssistant) -> None:
 
     def blocking_open(stream_source, *args, **kwargs):
         nonlocal last_stream_source
-        if not isinstance(stream_source, io.BytesIO):
+        if not isinstance(stream_source, SegmentBuffer):
             last_stream_source = stream_source
             # Let test know the thread is running
             worker_open.set()
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -11,7 +12,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands as websocket_commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -19,14 +20,15 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, import_profile
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1262,6 +1265,141 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_specific_entities_routed(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions with entity ids only run for their entities."""
+    hass.states.async_set("light.subscribed", "off")
+    hass.states.async_set("light.other", "off")
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    with patch(
+        "homeassistant.components.websocket_api.commands._forward_entity_changes",
+        wraps=websocket_commands._forward_entity_changes,
+    ) as forward_entity_changes:
+        for msg_id in (7, 8):
+            await websocket_client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "subscribe_entities",
+                    "entity_ids": ["light.subscribed"],
+                }
+            )
+            msg = await websocket_client.receive_json()
+            assert msg["success"]
+            msg = await websocket_client.receive_json()
+            assert set(msg["event"]["a"]) == {"light.subscribed"}
+
+        # The subscriptions share one state_changed listener
+        assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+        for _ in range(10):
+            hass.states.async_set("light.other", "on")
+            hass.states.async_set("light.other", "off")
+        hass.states.async_set("light.subscribed", "on")
+        await hass.async_block_till_done()
+
+        for msg_id in (7, 8):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == msg_id
+            assert set(msg["event"]["c"]) == {"light.subscribed"}
+
+    assert [
+        call.args[-1].data["entity_id"]
+        for call in forward_entity_changes.call_args_list
+    ] == ["light.subscribed", "light.subscribed"]
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entity changes within the coalesce window are merged."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window_ms": 100}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert set(msg["event"]["a"]) == {"light.changed", "light.removed"}
+
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.changed", "on", {"color": "green"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.transient", "on")
+    hass.states.async_remove("light.transient")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(milliseconds=150))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.changed": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.changed", "off")
+    await hass.async_block_till_done()
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    # Pending changes are dropped when unsubscribing
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(milliseconds=300))
+    await websocket_client.send_json({"id": 9, "type": "get_connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+    assert msg["result"] == {"messages_coalesced": 5, "bytes_saved": ANY}
+    bytes_saved = msg["result"]["bytes_saved"]
+    assert bytes_saved > 0
+
+    caplog.set_level(logging.DEBUG)
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert f"Coalesced 5 messages saving {bytes_saved} bytes" in caplog.text
+
+
+async def test_subscribe_entities_coalesce_window_invalid(
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test the coalesce window must be within range."""
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window_ms": 1000}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2547,6 +2685,7 @@ async def test_integration_setup_info(
     hass_admin_user: MockUser,
 ) -> None:
     """Test subscribe/unsubscribe bootstrap_integrations."""
+    import_profile.async_get(hass).preloaded["august"] = 1.5
     with patch(
         "homeassistant.components.websocket_api.commands.async_get_setup_timings",
         return_value={
@@ -2561,8 +2700,8 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "preload_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "preload_seconds": 0.0},
     ]
 
 
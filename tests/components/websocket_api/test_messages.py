@@ -6,10 +6,14 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
+    coalesced_state_diff_message,
     message_to_json_bytes,
+    separate_state_diff_messages_size,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -281,6 +285,91 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_coalesced_state_diff_message() -> None:
+    """Test merging the changes of several entities into one message."""
+    old = State("light.changed", "off", {"color": "red", "effect": "none"})
+    middle = State("light.changed", "on", {"color": "green", "effect": "none"})
+    new = State("light.changed", "on", {"color": "blue"})
+    added = State("light.added", "on")
+    removed = State("light.removed", "on")
+
+    def _event(entity_id: str, old_state: State | None, new_state: State | None):
+        return Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        )
+
+    transient = (
+        _event("light.transient", None, State("light.transient", "on")),
+        _event("light.transient", State("light.transient", "on"), None),
+    )
+    assert coalesced_state_diff_message(5, {}) is None
+    assert coalesced_state_diff_message(5, {"light.transient": transient}) is None
+
+    message = coalesced_state_diff_message(
+        5,
+        {
+            "light.changed": (
+                _event("light.changed", old, middle),
+                _event("light.changed", middle, new),
+            ),
+            "light.added": (_event("light.added", None, added),) * 2,
+            "light.removed": (_event("light.removed", removed, None),) * 2,
+            "light.transient": transient,
+        },
+    )
+    assert json_loads(message) == {
+        "id": 5,
+        "type": "event",
+        "event": {
+            "a": {"light.added": added.as_compressed_state},
+            "c": {
+                "light.changed": {
+                    "+": {
+                        "s": "on",
+                        "lc": new.last_changed_timestamp,
+                        "c": new.context.id,
+                        "a": {"color": "blue"},
+                    },
+                    "-": {"a": ["effect"]},
+                }
+            },
+            "r": ["light.removed"],
+        },
+    }
+
+
+async def test_separate_state_diff_messages_size() -> None:
+    """Test estimating the size of the changes sent one message per event."""
+    added = State("light.added", "on")
+    removed = State("light.removed", "on")
+    added_event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.added", "old_state": None, "new_state": added},
+    )
+    removed_event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.removed", "old_state": removed, "new_state": None},
+    )
+    changes = {
+        "light.added": (added_event, added_event),
+        "light.removed": (removed_event, removed_event),
+    }
+
+    assert separate_state_diff_messages_size(5, {}, {}) == 0
+    # A single event per entity is estimated with the size of its own message
+    assert separate_state_diff_messages_size(
+        125, changes, {"light.added": 1, "light.removed": 1}
+    ) == len(cached_state_diff_message(b"125", added_event)) + len(
+        cached_state_diff_message(b"125", removed_event)
+    )
+    assert separate_state_diff_messages_size(
+        125, changes, {"light.added": 3, "light.removed": 1}
+    ) == 3 * len(cached_state_diff_message(b"125", added_event)) + len(
+        cached_state_diff_message(b"125", removed_event)
+    )
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
@@ -18,7 +18,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import MaxLengthExceeded
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.util.dt import utc_from_timestamp
 
 from tests.common import (
@@ -319,7 +323,7 @@ async def test_loading_saving_data(
     )
     entity_registry.async_update_entity(
         orig_entry2.entity_id,
-        categories={"scope", "id"},
+        categories={"scope": "id"},
         labels={"label1", "label2"},
     )
     orig_entry2 = entity_registry.async_get(orig_entry2.entity_id)
@@ -354,7 +358,7 @@ async def test_loading_saving_data(
     assert attr.evolve(orig_entry4, modified_at=new_entry4.modified_at) == new_entry4
 
     assert new_entry2.area_id == "mock-area-id"
-    assert new_entry2.categories == {"scope", "id"}
+    assert new_entry2.categories == {"scope": "id"}
     assert new_entry2.capabilities == {"max": 100}
     assert new_entry2.config_entry_id == mock_config.entry_id
     assert new_entry2.device_class == "user-class"
@@ -2264,6 +2268,88 @@ async def test_entries_for_category(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_category(entity_registry, "scope1", "")
 
 
+async def test_entries_for_platform(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by platform."""
+    hue_1 = entity_registry.async_get_or_create("light", "hue", "123")
+    entity_registry.async_get_or_create("light", "deconz", "456")
+    hue_2 = entity_registry.async_get_or_create("sensor", "hue", "789")
+
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_1, hue_2]
+
+    entity_registry.async_update_entity_platform(
+        hue_1.entity_id, "deconz", new_unique_id="321"
+    )
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_2]
+
+    entity_registry.async_remove(hue_2.entity_id)
+    assert not er.async_entries_for_platform(entity_registry, "hue")
+    assert len(er.async_entries_for_platform(entity_registry, "deconz")) == 2
+
+
+async def test_entries_for_effective_area(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test getting entity entries in an area directly or through their device."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    hall = area_registry.async_create("Hall")
+
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device_entry.id, area_id=kitchen.id)
+    inherited = entity_registry.async_get_or_create(
+        "light", "hue", "123", config_entry=config_entry, device_id=device_entry.id
+    )
+    own_area = entity_registry.async_get_or_create(
+        "light", "hue", "456", config_entry=config_entry, device_id=device_entry.id
+    )
+    own_area = entity_registry.async_update_entity(own_area.entity_id, area_id=hall.id)
+
+    def entity_ids(area_id: str) -> list[str]:
+        return [
+            entry.entity_id
+            for entry in er.async_entries_for_effective_area(entity_registry, area_id)
+        ]
+
+    # The areas of the devices are looked up on the first call
+    assert entity_ids(kitchen.id) == [inherited.entity_id]
+    assert entity_ids(hall.id) == [own_area.entity_id]
+
+    # The entities without an area follow the area of their device
+    device_registry.async_update_device(device_entry.id, area_id=hall.id)
+    assert not entity_ids(kitchen.id)
+    assert entity_ids(hall.id) == [own_area.entity_id, inherited.entity_id]
+
+    entity_registry.async_update_entity(own_area.entity_id, area_id=None)
+    entity_registry.async_update_entity(inherited.entity_id, area_id=kitchen.id)
+    assert entity_ids(kitchen.id) == [inherited.entity_id]
+    assert entity_ids(hall.id) == [own_area.entity_id]
+
+    # Entities created for a device in an area are in its area
+    other_device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:00")},
+        suggested_area="Kitchen",
+    )
+    other = entity_registry.async_get_or_create(
+        "light", "hue", "789", config_entry=config_entry, device_id=other_device.id
+    )
+    assert entity_ids(kitchen.id) == [inherited.entity_id, other.entity_id]
+
+    device_registry.async_remove_device(other_device.id)
+    assert entity_ids(kitchen.id) == [inherited.entity_id]
+
+    device_registry.async_update_device(device_entry.id, area_id=None)
+    assert entity_ids(kitchen.id) == [inherited.entity_id]
+    assert not entity_ids(hall.id)
+
+
 async def test_get_or_create_thread_safety(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -14,7 +15,7 @@ import jinja2
 import pytest
 
 from homeassistant import core as ha
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.core import (
     Event,
     EventStateChangedData,
@@ -37,6 +38,7 @@ from homeassistant.helpers.event import (
     async_track_same_state,
     async_track_state_added_domain,
     async_track_state_change,
+    async_track_state_change_domain_event,
     async_track_state_change_event,
     async_track_state_change_filtered,
     async_track_state_removed_domain,
@@ -444,6 +446,39 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_entity_in_domain(
+    hass: HomeAssistant,
+) -> None:
+    """Test an entity of a tracked domain runs the action once per change."""
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    track = async_track_state_change_filtered(
+        hass,
+        TrackStates(False, {"light.bowl", "switch.kitchen"}, {"light"}),
+        run_callback,
+    )
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.new", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("switch.other", "on")
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "light.new", "switch.kitchen"]
+
+    hass.states.async_remove("light.new")
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "light.new", "switch.kitchen", "light.new"]
+
+    track.async_remove()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(tracker) == 4
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -552,6 +587,115 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_domain_event(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_domain_event."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    single_domain_tracker = []
+    multiple_domain_tracker = []
+
+    @ha.callback
+    def single_run_callback(event: Event[EventStateChangedData]) -> None:
+        single_domain_tracker.append(
+            (event.data["entity_id"], event.data["old_state"], event.data["new_state"])
+        )
+
+    @ha.callback
+    def multiple_run_callback(event: Event[EventStateChangedData]) -> None:
+        multiple_domain_tracker.append(
+            (event.data["entity_id"], event.data["old_state"], event.data["new_state"])
+        )
+
+    @ha.callback
+    def callback_that_throws(event):
+        raise ValueError
+
+    unsub_single = async_track_state_change_domain_event(
+        hass, "light", single_run_callback, job_type=ha.HassJobType.Callback
+    )
+    unsub_multi = async_track_state_change_domain_event(
+        hass, ["Light", "switch"], multiple_run_callback
+    )
+    unsub_throws = async_track_state_change_domain_event(
+        hass, ["light", "switch"], callback_that_throws
+    )
+    # All domain listeners share a single state_changed listener
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    # Adding state to state machine
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 1
+    assert single_domain_tracker[-1][0] == "light.bowl"
+    assert single_domain_tracker[-1][1] is None
+    assert single_domain_tracker[-1][2].state == "on"
+    assert len(multiple_domain_tracker) == 1
+
+    # Set same state should not trigger a state change/listener
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 1
+    assert len(multiple_domain_tracker) == 1
+
+    # State change on -> off
+    hass.states.async_set("light.Bowl", "off")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 2
+    assert single_domain_tracker[-1][1].state == "on"
+    assert single_domain_tracker[-1][2].state == "off"
+    assert len(multiple_domain_tracker) == 2
+
+    # Attribute change off -> off
+    hass.states.async_set("light.Bowl", "off", {"some_attr": 1})
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 3
+    assert len(multiple_domain_tracker) == 3
+
+    # Removing state
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 4
+    assert single_domain_tracker[-1][2] is None
+    assert len(multiple_domain_tracker) == 4
+
+    # Set state for a different domain
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 4
+    assert len(multiple_domain_tracker) == 5
+
+    # Set state for a domain that is not tracked
+    hass.states.async_set("sensor.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 4
+    assert len(multiple_domain_tracker) == 5
+
+    unsub_single()
+    # Ensure unsubing the listener works
+    hass.states.async_set("light.new", "off")
+    await hass.async_block_till_done()
+    assert len(single_domain_tracker) == 4
+    assert len(multiple_domain_tracker) == 6
+
+    unsub_multi()
+    unsub_throws()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_async_track_state_change_domain_event_with_empty_list(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_track_state_change_domain_event passing an empty list of domains."""
+    unsub_single = async_track_state_change_domain_event(
+        hass, [], ha.callback(lambda event: None)
+    )
+    unsub_single2 = async_track_state_change_domain_event(
+        hass, [], ha.callback(lambda event: None)
+    )
+
+    unsub_single2()
+    unsub_single()
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1915,6 +2059,79 @@ async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     }
 
 
+@pytest.mark.parametrize(
+    ("template_str", "changes"),
+    [
+        (
+            "{{ states('sensor.one') }}",
+            [
+                ("1", {"other": 1}, False),
+                ("1", {"other": 2}, False),
+                ("2", {"other": 2}, True),
+            ],
+        ),
+        (
+            "{{ state_attr('sensor.one', 'watched') }}",
+            [
+                ("2", {}, False),
+                ("2", {"other": 1}, False),
+                ("2", {"watched": 1}, True),
+                ("3", {"watched": 1}, False),
+            ],
+        ),
+        (
+            "{{ states.sensor | map(attribute='state') | join(',') }}",
+            [
+                ("1", {"other": 1}, False),
+                ("2", {"other": 1}, True),
+            ],
+        ),
+        (
+            "{{ states.sensor | map(attribute='entity_id') | join(',') }}",
+            [
+                ("2", {}, False),
+                ("3", {"other": 1}, False),
+            ],
+        ),
+    ],
+)
+async def test_track_template_result_skips_unchanged_inputs(
+    hass: HomeAssistant,
+    template_str: str,
+    changes: list[tuple[str, dict[str, Any], bool]],
+) -> None:
+    """Test templates only re-render when a state field they read changes."""
+    hass.states.async_set("sensor.one", "1")
+    runs = []
+
+    @callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template(template_str, hass), None, 0)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    expected_renders = 0
+    for state, attributes, renders in changes:
+        hass.states.async_set("sensor.one", state, attributes)
+        await hass.async_block_till_done()
+        expected_renders += renders
+        assert info.renders == expected_renders
+
+    assert info.renders_avoided == len(changes) - expected_renders
+    assert len(runs) == expected_renders
+    assert (
+        f"renders={expected_renders} renders_avoided={len(changes) - expected_renders}>"
+    ) in repr(info)
+
+
 async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     """Test tracking template with a wildcard."""
     specific_runs = []
@@ -0,0 +1,148 @@
+"""Test the import profile helper."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import requirements
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import import_profile
+from homeassistant.loader import Integration, async_get_integration
+from homeassistant.setup import DATA_SETUP
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+async def test_save_import_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the imports of the startup are saved once started."""
+    hass.set_state(CoreState.not_running)
+    await import_profile.async_load(hass)
+    integration = await async_get_integration(hass, "group")
+    await integration.async_get_component()
+    await integration.async_get_platforms(["light", "sensor"])
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=import_profile.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[import_profile.STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    data = data["integrations"]
+    assert data.keys() == {"group"}
+    assert data["group"]["platforms"].keys() == {"light", "sensor"}
+    assert isinstance(data["group"]["component"], float)
+
+
+async def test_preload(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test integrations imported at the last startup are preloaded."""
+    hass_storage[import_profile.STORAGE_KEY] = {
+        "version": import_profile.STORAGE_VERSION,
+        "key": import_profile.STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "integrations": {
+                "group": {
+                    "component": 0.5,
+                    "platforms": {"light": 0.1, "missing": 0.1},
+                },
+                "mqtt": {"component": 0.5, "platforms": {}},
+                "zwave_js": {"component": 0.5, "platforms": {}},
+            },
+        },
+    }
+    await import_profile.async_load(hass)
+    profile = import_profile.async_get(hass)
+    assert profile.last_startup["group"]["component"] == 0.5
+
+    # Setup of mqtt started already so it imports it itself
+    hass.data.setdefault(DATA_SETUP, {})["mqtt"] = hass.loop.create_future()
+    integrations = [
+        await async_get_integration(hass, domain)
+        for domain in ("group", "mqtt", "http")
+    ]
+    calls: list[tuple[str, str]] = []
+    get_integration_with_requirements = (
+        requirements.async_get_integration_with_requirements
+    )
+    get_component = Integration.async_get_component
+
+    async def _get_integration_with_requirements(
+        hass: HomeAssistant, domain: str
+    ) -> Integration:
+        calls.append(("requirements", domain))
+        return await get_integration_with_requirements(hass, domain)
+
+    async def _get_component(integration: Integration) -> Any:
+        calls.append(("import", integration.domain))
+        return await get_component(integration)
+
+    with (
+        patch(
+            "homeassistant.requirements.async_get_integration_with_requirements",
+            _get_integration_with_requirements,
+        ),
+        patch.object(Integration, "async_get_component", _get_component),
+    ):
+        profile.async_preload(integrations)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # The requirements are processed before importing
+    assert calls == [("requirements", "group"), ("import", "group")]
+    assert profile.preloaded.keys() == {"group"}
+    assert profile.async_preload_time() == profile.preloaded["group"]
+    assert integrations[0].get_platform_cached("light") is not None
+
+
+async def test_import_profile_of_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the imports recorded by another version are not preloaded."""
+    hass_storage[import_profile.STORAGE_KEY] = {
+        "version": import_profile.STORAGE_VERSION,
+        "key": import_profile.STORAGE_KEY,
+        "data": {
+            "ha_version": "2000.1.0",
+            "integrations": {"group": {"component": 0.5, "platforms": {}}},
+        },
+    }
+    await import_profile.async_load(hass)
+    assert import_profile.async_get(hass).last_startup == {}
+
+
+@pytest.mark.parametrize(
+    "patch_target",
+    [
+        "homeassistant.requirements.async_get_integration_with_requirements",
+        "homeassistant.loader.Integration.async_get_component",
+    ],
+)
+async def test_preload_fails(
+    hass: HomeAssistant, hass_storage: dict[str, Any], patch_target: str
+) -> None:
+    """Test an integration that fails to preload is left to its setup."""
+    hass_storage[import_profile.STORAGE_KEY] = {
+        "version": import_profile.STORAGE_VERSION,
+        "key": import_profile.STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "integrations": {"group": {"component": 0.5, "platforms": {}}},
+        },
+    }
+    await import_profile.async_load(hass)
+    profile = import_profile.async_get(hass)
+    integration = await async_get_integration(hass, "group")
+
+    with patch(patch_target, side_effect=RuntimeError("boom")):
+        profile.async_preload([integration])
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert profile.preloaded == {}
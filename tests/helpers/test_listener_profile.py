@@ -0,0 +1,72 @@
+"""Test the listener profile helper."""
+
+from functools import partial
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers import listener_profile
+
+
+async def test_listener_profile(hass: HomeAssistant) -> None:
+    """Test the runs of the listeners are recorded while running."""
+    profile = listener_profile.async_get(hass)
+
+    @callback
+    def _listener(event: Event, extra: int) -> None:
+        """Listen to test events."""
+
+    hass.bus.async_listen("test_event", partial(_listener, extra=1))
+    hass.bus.async_fire("test_event")
+    assert not profile.running
+    assert profile.async_listener_stats() == []
+
+    profile.async_start()
+    assert profile.running
+    for _ in range(3):
+        hass.bus.async_fire("test_event")
+    profile.async_stop()
+    hass.bus.async_fire("test_event")
+
+    stats = [
+        stats
+        for stats in profile.async_listener_stats()
+        if stats["event_type"] == "test_event"
+    ]
+    assert len(stats) == 1
+    assert stats[0]["integration"] == "tests"
+    assert stats[0]["listener"] == (
+        f"{__name__}.test_listener_profile.<locals>._listener"
+    )
+    assert stats[0]["count"] == 3
+    assert 0 <= stats[0]["p99"] <= stats[0]["total"]
+    assert profile.async_integration_stats()["tests"]["count"] == 3
+
+    # Starting again discards the previous runs
+    profile.async_start()
+    assert profile.async_listener_stats() == []
+    profile.async_stop()
+
+
+async def test_listener_profile_owner(hass: HomeAssistant) -> None:
+    """Test the listeners are attributed to the integration owning them."""
+
+    def _custom_listener(event: Event) -> None:
+        """Listen from a custom integration."""
+
+    _custom_listener.__module__ = "custom_components.my_integration.sensor"
+
+    assert listener_profile._job_owner(HassJob(hass.states.async_set)) == (
+        "homeassistant",
+        "homeassistant.core.StateMachine.async_set",
+    )
+    assert listener_profile._job_owner(
+        HassJob(partial(persistent_notification.async_create, hass))
+    ) == (
+        "persistent_notification",
+        "homeassistant.components.persistent_notification.async_create",
+    )
+    assert listener_profile._job_owner(HassJob(_custom_listener)) == (
+        "my_integration",
+        "custom_components.my_integration.sensor"
+        ".test_listener_profile_owner.<locals>._custom_listener",
+    )
@@ -0,0 +1,65 @@
+"""Test the loop monitor helper."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import loop_monitor
+
+
+async def _wait_for_samples(monitor: loop_monitor.LoopMonitor, samples: int) -> None:
+    """Wait until the monitor took a number of samples."""
+    async with asyncio.timeout(5):
+        while sum(monitor.health()["lag_counts"]) < samples:
+            await asyncio.sleep(0.01)
+
+
+@patch.object(loop_monitor, "LAG_SAMPLE_INTERVAL", 0.01)
+async def test_loop_monitor(hass: HomeAssistant) -> None:
+    """Test the scheduling lag is sampled and slow callbacks are recorded."""
+    monitor = loop_monitor.LoopMonitor(hass.loop)
+    monitor.start()
+    await _wait_for_samples(monitor, 3)
+
+    health = monitor.health()
+    assert health["lag_buckets"] == list(loop_monitor.LAG_BUCKETS)
+    assert len(health["lag_counts"]) == len(loop_monitor.LAG_BUCKETS) + 1
+    assert health["slow_callback_count"] == 0
+    assert health["slow_callbacks"] == []
+    assert 0 <= health["lag_p50"] <= health["lag_p99"] <= health["lag_max"]
+
+    def _block_loop() -> None:
+        time.sleep(loop_monitor.SLOW_CALLBACK_THRESHOLD * 3)
+
+    samples = sum(health["lag_counts"])
+    _block_loop()
+    await _wait_for_samples(monitor, samples + 1)
+    await hass.async_add_executor_job(monitor.stop)
+
+    health = monitor.health()
+    assert monitor.slow_callback_count == health["slow_callback_count"] == 1
+    slow_callback = health["slow_callbacks"][0]
+    assert slow_callback["duration"] >= loop_monitor.SLOW_CALLBACK_THRESHOLD
+    assert slow_callback["integration"] is None
+    assert slow_callback["task"] is not None
+    assert "test_loop_monitor" in slow_callback["task"]
+    assert slow_callback["stack"][-1].endswith("in _block_loop")
+    assert monitor.lag_max >= loop_monitor.SLOW_CALLBACK_THRESHOLD
+    slow_bucket = loop_monitor.LAG_BUCKETS.index(loop_monitor.SLOW_CALLBACK_THRESHOLD)
+    assert sum(health["lag_counts"][slow_bucket:]) >= 1
+    assert monitor.recent_lag(1.0) == monitor.lag_max
+
+
+def test_frame_integration() -> None:
+    """Test finding the integration of a stack."""
+
+    code = compile(
+        "import sys\nframe = sys._getframe()",
+        "/config/custom_components/my_integration/sensor.py",
+        "exec",
+    )
+    namespace: dict = {}
+    exec(code, namespace)  # noqa: S102
+    assert loop_monitor._frame_integration(namespace["frame"]) == "my_integration"
+    assert loop_monitor._frame_integration(None) is None
@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun import freeze_time
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -534,3 +536,85 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_dump_reuses_unchanged_states(hass: HomeAssistant) -> None:
+    """Test dumps reuse the stored states of the entities that did not change."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = async_get(hass)
+    first = {
+        stored_state.state.entity_id: stored_state
+        for stored_state in data.async_get_stored_states()
+    }
+
+    hass.states.async_set("input_boolean.b1", "off")
+    second = {
+        stored_state.state.entity_id: stored_state
+        for stored_state in data.async_get_stored_states()
+    }
+    assert second["input_boolean.b0"] is first["input_boolean.b0"]
+    assert second["input_boolean.b1"] is not first["input_boolean.b1"]
+    assert second["input_boolean.b1"].state.state == "off"
+
+    # The time the entity was last seen is updated once a day
+    with freeze_time(dt_util.utcnow() + timedelta(days=1, seconds=1)):
+        third = {
+            stored_state.state.entity_id: stored_state
+            for stored_state in data.async_get_stored_states()
+        }
+    assert third["input_boolean.b0"] is not second["input_boolean.b0"]
+    assert third["input_boolean.b0"].last_seen > second["input_boolean.b0"].last_seen
+
+
+async def test_stored_states_decoded_when_accessed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only decoded when they are accessed."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {
+                "state": {
+                    "entity_id": "input_boolean.b0",
+                    "state": "on",
+                    "attributes": {"friendly_name": "B0"},
+                    "last_changed": now.isoformat(),
+                    "last_updated": now.isoformat(),
+                    "context": {"id": "01J9ZQ0FJ3RBGZ3VTV5B1D8Q1X", "user_id": None},
+                },
+                "extra_data": {"native_value": 1},
+                "last_seen": now.isoformat(),
+            }
+        ],
+    }
+    data = async_get(hass)
+    await data.async_load()
+    stored_state = data.last_states["input_boolean.b0"]
+    assert stored_state._state is None
+    assert isinstance(stored_state._last_seen, str)
+
+    # Stored states that were not accessed are dumped as they were loaded
+    assert (
+        json_round_trip(stored_state.json_fragment)
+        == (hass_storage[STORAGE_KEY]["data"][0])
+    )
+
+    state = stored_state.state
+    assert state.state == "on"
+    assert state.attributes == {"friendly_name": "B0"}
+    assert state.last_changed == now
+    assert stored_state.state is state
+    assert stored_state.last_seen == now
+    assert stored_state.extra_data.as_dict() == {"native_value": 1}
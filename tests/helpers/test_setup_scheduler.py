@@ -0,0 +1,162 @@
+"""Test the setup scheduler helper."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import setup_scheduler
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import (
+    MockConfigEntry,
+    MockModule,
+    async_fire_time_changed,
+    mock_integration,
+)
+
+
+async def test_startup_critical_path(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the setups of the startup are recorded and saved once started."""
+    hass.set_state(CoreState.not_running)
+    base_entry = MockConfigEntry(domain="base", title="Base")
+    base_entry.add_to_hass(hass)
+    cloud_entry = MockConfigEntry(domain="cloud", title="Cloud")
+    cloud_entry.add_to_hass(hass)
+    hass_storage[setup_scheduler.STORAGE_KEY] = {
+        "version": setup_scheduler.STORAGE_VERSION,
+        "key": setup_scheduler.STORAGE_KEY,
+        "data": {"cloud": {cloud_entry.entry_id: 2.0}, "other": {"gone": 1.0}},
+    }
+    integrations = {
+        "base": mock_integration(
+            hass, MockModule("base", async_setup_entry=AsyncMock(return_value=True))
+        ),
+        "cloud": mock_integration(
+            hass,
+            MockModule(
+                "cloud",
+                dependencies=["base"],
+                async_setup_entry=AsyncMock(return_value=True),
+                partial_manifest={"iot_class": "cloud_polling"},
+            ),
+        ),
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+    await setup_scheduler.async_load(hass)
+    scheduler = setup_scheduler.async_get(hass)
+    scheduler.async_plan(integrations)
+
+    # The base setup goes first as the cloud setup depends on it
+    assert scheduler._priority(base_entry) == 2.0
+    assert scheduler._priority(cloud_entry) == 2.0
+
+    assert await async_setup_component(hass, "cloud", {})
+    assert [
+        (step["domain"], step["title"], step["resource_class"])
+        for step in scheduler.async_critical_path()
+    ] == [("base", "Base", "local"), ("cloud", "Cloud", "cloud")]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=setup_scheduler.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[setup_scheduler.STORAGE_KEY]["data"]
+    assert data.keys() == {"base", "cloud"}
+    assert data["cloud"].keys() == {cloud_entry.entry_id}
+
+
+async def test_setups_not_limited_once_running(hass: HomeAssistant) -> None:
+    """Test the config entries set up once running are not recorded."""
+    MockConfigEntry(domain="cloud").add_to_hass(hass)
+    mock_integration(
+        hass,
+        MockModule(
+            "cloud",
+            async_setup_entry=AsyncMock(return_value=True),
+            partial_manifest={"iot_class": "cloud_push"},
+        ),
+    )
+
+    assert await async_setup_component(hass, "cloud", {})
+    assert setup_scheduler.async_get(hass).async_critical_path() == []
+
+
+async def test_slots_by_priority(hass: HomeAssistant) -> None:
+    """Test the waiting setups get a slot by priority."""
+    slots = setup_scheduler._ResourceSlots(1)
+    order: list[str] = []
+
+    async def _setup(name: str, priority: float) -> None:
+        await slots.acquire(priority)
+        order.append(name)
+        await asyncio.sleep(0)
+        slots.release()
+
+    await slots.acquire(0)
+    tasks = [
+        hass.async_create_task(_setup(name, priority))
+        for name, priority in (("low", 1.0), ("high", 5.0), ("medium", 3.0))
+    ]
+    await asyncio.sleep(0)
+    assert order == []
+
+    slots.release()
+    await asyncio.gather(*tasks)
+    assert order == ["high", "medium", "low"]
+    assert slots.active == 0
+
+
+async def test_slot_wait_timeout(hass: HomeAssistant) -> None:
+    """Test a setup waiting too long for a slot goes ahead anyway."""
+    slots = setup_scheduler._ResourceSlots(1)
+    await slots.acquire(0)
+
+    with patch.object(setup_scheduler, "SLOT_WAIT_TIMEOUT", 0):
+        await slots.acquire(1)
+    assert slots.active == 2
+
+    slots.release()
+    slots.release()
+    assert slots.active == 0
+
+
+async def test_resource_class(hass: HomeAssistant) -> None:
+    """Test the resource class of the config entries."""
+    stick = mock_integration(
+        hass,
+        MockModule(
+            "stick",
+            partial_manifest={"usb": [{"vid": "10C4"}], "iot_class": "local_push"},
+        ),
+    )
+    cloud = mock_integration(
+        hass, MockModule("remote", partial_manifest={"iot_class": "cloud_polling"})
+    )
+    for data, integration, resource_class in (
+        ({"device": "/dev/ttyUSB0"}, stick, setup_scheduler.ResourceClass.USB),
+        ({"device": {"path": "COM3"}}, stick, setup_scheduler.ResourceClass.USB),
+        # Discovered over USB but talking to a network server
+        ({"url": "ws://localhost:3000"}, stick, setup_scheduler.ResourceClass.LOCAL),
+        (
+            {"device": {"path": "socket://192.168.1.2:6638"}},
+            stick,
+            setup_scheduler.ResourceClass.LOCAL,
+        ),
+        ({}, cloud, setup_scheduler.ResourceClass.CLOUD),
+    ):
+        assert (
+            setup_scheduler._resource_class(
+                MockConfigEntry(domain=integration.domain, data=data), integration
+            )
+            is resource_class
+        )
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1181,201 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        unchanged = {"id": "unchanged", "value": 1}
+        await store.async_save(
+            {
+                "items": [
+                    unchanged,
+                    {"id": "changed", "value": 1},
+                    {"id": "removed", "value": 1},
+                ],
+                "other": 1,
+            }
+        )
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        base = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+
+        data = {
+            "items": [
+                unchanged,
+                {"id": "changed", "value": 2},
+                {"id": "added", "value": 1},
+            ],
+            "other": 2,
+        }
+        await store.async_save(data)
+        # The main file is not rewritten
+        assert (
+            await hass.async_add_executor_job(json.loads, Path(store.path).read_text())
+            == base
+        )
+        journal = await hass.async_add_executor_job(Path(journal_path).read_bytes)
+        generation = base["journal"]
+        assert [json.loads(line) for line in journal.splitlines()] == [
+            [generation, "items", "changed", {"id": "changed", "value": 2}],
+            [generation, "items", "added", {"id": "added", "value": 1}],
+            [generation, "items", "removed"],
+            [generation, "other", None, 2],
+        ]
+
+        # Saving the same data again does not append anything
+        await store.async_save(
+            {
+                "items": [unchanged, *(dict(item) for item in data["items"][1:])],
+                "other": 2,
+            }
+        )
+        assert (
+            await hass.async_add_executor_job(Path(journal_path).read_bytes) == journal
+        )
+
+        # Malformed records and an incomplete record at the end are ignored
+        await hass.async_add_executor_job(
+            Path(journal_path).write_bytes,
+            journal
+            + f'[{generation},"items",1,{{"id":"bad"}}]\n'.encode()
+            + f'[{generation},["items"],"bad",{{"id":"bad"}}]\n'.encode()
+            + f'[{generation},"other",null]\n'.encode()
+            + b'{"other":4}\n'
+            + f'[{generation},"items","added",{{"id":'.encode(),
+        )
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert await store2.async_load() == data
+
+        # The first write after loading compacts the journal
+        data["other"] = 3
+        await store2.async_save(data)
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert await store3.async_load() == data
+
+        await store3.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_helper_encoder(tmpdir: py.path.local) -> None:
+    """Test a journaled store with the helper encoder journals compact JSON."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journaled=True, encoder=JSONEncoder
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        await store.async_save({"items": [{"id": "item", "value": 1}]})
+        await store.async_save({"items": [{"id": "item", "value": 2}]})
+        journal = await hass.async_add_executor_job(Path(journal_path).read_bytes)
+        assert journal.endswith(b',"items","item",{"id":"item","value":2}]\n')
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compacts(tmpdir: py.path.local) -> None:
+    """Test a journaled store compacts the journal when it grows too large."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "value": 0} for idx in range(10)]
+        await store.async_save({"items": items})
+
+        with patch.object(storage, "JOURNAL_MIN_COMPACT_SIZE", 0):
+            for value in range(1, 20):
+                items[0] = {"id": "0", "value": value}
+                await store.async_save({"items": items})
+                journal_exists = await hass.async_add_executor_job(
+                    os.path.exists, journal_path
+                )
+                if not journal_exists:
+                    break
+            else:
+                pytest.fail("The journal was never compacted")
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert await store2.async_load() == {"items": items}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compacted_at_shutdown(
+    tmpdir: py.path.local,
+) -> None:
+    """Test the journal is compacted at shutdown for versions without it."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        await store.async_save({"items": [{"id": "item", "value": 1}]})
+        data = {"items": [{"id": "item", "value": 2}]}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        hass.set_state(CoreState.final_write)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        main = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert main["data"] == data
+
+        # Writes while stopping go to the main file
+        data = {"items": [{"id": "item", "value": 3}]}
+        await store.async_save(data)
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        main = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert main["data"] == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_list(tmpdir: py.path.local) -> None:
+    """Test a journaled store of a list journals each item by its id."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+
+        def _item_id(item: dict[str, Any]) -> Any:
+            return item["key"]["name"]
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journaled=True, journal_item_id=_item_id
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        unchanged = {"key": {"name": "unchanged"}, "value": 1}
+        await store.async_save([unchanged, {"key": {"name": "changed"}, "value": 1}])
+        base = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+
+        data = [unchanged, {"key": {"name": "changed"}, "value": 2}]
+        await store.async_save(data)
+        journal = await hass.async_add_executor_job(Path(journal_path).read_bytes)
+        assert [json.loads(line) for line in journal.splitlines()] == [
+            [base["journal"], None, "changed", {"key": {"name": "changed"}, "value": 2}]
+        ]
+
+        store2 = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journaled=True, journal_item_id=_item_id
+        )
+        assert await store2.async_load() == data
+
+        await hass.async_stop(force=True)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -13,6 +15,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +25,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -33,10 +37,11 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import (
     area_registry as ar,
+    config_validation as cv,
     device_registry as dr,
     entity,
     entity_registry as er,
@@ -6601,3 +6606,125 @@ async def test_merge_response_not_mutate_original_object(
 
     tpl = template.Template(_template, hass)
     assert tpl.async_render()
+
+
+async def test_code_cache(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test compiled template code is persisted and reused after a restart."""
+    await template.async_load_code_cache(hass)
+    template.Template("{{ 40 + 2 }}", hass).ensure_valid(persist_code=True)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.TEMPLATE_CODE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.TEMPLATE_CODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["code"]) == 1
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_code_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+    mock_compile.assert_not_called()
+
+
+async def test_code_cache_version_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is discarded when the version changes."""
+    await template.async_load_code_cache(hass)
+    template.Template("{{ 40 + 2 }}", hass).ensure_valid(persist_code=True)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.TEMPLATE_CODE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+
+    hass.data.pop(template._ENVIRONMENT)
+    with patch(
+        "homeassistant.helpers.template._code_cache_version", return_value="old"
+    ):
+        await template.async_load_code_cache(hass)
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as mock_compile:
+        template.Template("{{ 40 + 2 }}", hass).ensure_valid()
+    assert mock_compile.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "marshalled",
+    [
+        "not base64",
+        base64.b64encode(b"not marshal").decode(),
+        base64.b64encode(marshal.dumps(42)).decode(),
+    ],
+)
+async def test_code_cache_invalid_code(
+    hass: HomeAssistant, hass_storage: dict[str, Any], marshalled: str
+) -> None:
+    """Test invalid cached template code is discarded and compiled again."""
+    await template.async_load_code_cache(hass)
+    template.Template("{{ 40 + 2 }}", hass).ensure_valid(persist_code=True)
+    await _async_save_code_cache(hass)
+    data = hass_storage[template.TEMPLATE_CODE_CACHE_STORAGE_KEY]["data"]
+    data["code"] = dict.fromkeys(data["code"], marshalled)
+
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_code_cache(hass)
+    assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+
+
+async def _async_save_code_cache(hass: HomeAssistant) -> None:
+    """Save the template code cache."""
+    await hass.async_block_till_done()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+
+async def test_code_cache_only_persists_config_templates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the code of templates from the configuration is persisted."""
+    await template.async_load_code_cache(hass)
+    template.Template("{{ 40 + 1 }}", hass).ensure_valid()
+    assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+    cv.template("{{ 40 + 3 }}")
+    await _async_save_code_cache(hass)
+
+    data = hass_storage[template.TEMPLATE_CODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["code"]) == 1
+
+
+async def test_code_cache_bounded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code cache keeps the most recently used templates."""
+    hass.set_state(CoreState.starting)
+    with patch.object(template, "TEMPLATE_CODE_CACHE_SIZE", 2):
+        await template.async_load_code_cache(hass)
+    for value in range(3):
+        template.Template(f"{{{{ {value} }}}}", hass).ensure_valid(persist_code=True)
+    await _async_save_code_cache(hass)
+    data = hass_storage[template.TEMPLATE_CODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["code"]) == 2
+
+    # Simulate a restart, the templates not used once started are dropped
+    hass.data.pop(template._ENVIRONMENT)
+    with patch.object(template, "TEMPLATE_CODE_CACHE_SIZE", 3):
+        await template.async_load_code_cache(hass)
+    template.Template("{{ 2 }}", hass).ensure_valid()
+    hass.set_state(CoreState.running)
+    template.Template("{{ 3 }}", hass).ensure_valid(persist_code=True)
+    await _async_save_code_cache(hass)
+    data = hass_storage[template.TEMPLATE_CODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["code"]) == 2
+    assert data["code"].keys() == {
+        hass.data[template._ENVIRONMENT]._code_cache_key("{{ 2 }}"),
+        hass.data[template._ENVIRONMENT]._code_cache_key("{{ 3 }}"),
+    }
@@ -13,7 +13,7 @@ import re
 import threading
 import time
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1165,6 +1165,36 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listener_profiler(hass: HomeAssistant) -> None:
+    """Test the time each listener takes is passed to the listener profiler."""
+    runs = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    @ha.callback
+    def failing_listener(event):
+        """Mock failing listener."""
+        raise ValueError
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", failing_listener)
+    hass.bus.async_fire("test")
+    assert runs == []
+
+    hass.bus.async_set_listener_profiler(
+        lambda event_type, job, took: runs.append((event_type, job.target, took))
+    )
+    hass.bus.async_fire("test")
+    assert runs == [("test", listener, ANY), ("test", failing_listener, ANY)]
+    assert all(took >= 0 for _, _, took in runs)
+
+    hass.bus.async_set_listener_profiler(None)
+    hass.bus.async_fire("test")
+    assert len(runs) == 2
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1590,73 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test async_set shares equal attributes and values between states."""
+    hass.states.async_set("light.bowl", "on", {"color_mode": "hs", "level": 1})
+    hass.states.async_set("light.kitchen", "on", {"color_mode": "hs", "level": 1})
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    assert kitchen.attributes is bowl.attributes
+
+    # Equal values of different types are not shared
+    hass.states.async_set("light.hall", "on", {"color_mode": "hs", "level": True})
+    hall = hass.states.get("light.hall")
+    assert hall.attributes is not bowl.attributes
+    assert hall.attributes["level"] is True
+
+    # Containers with equal values of different types are not shared
+    hass.states.async_set("light.a", "on", {"hs_color": (30, 100)})
+    hass.states.async_set("light.b", "on", {"hs_color": (30.0, 100.0)})
+    hs_color = hass.states.get("light.b").attributes["hs_color"]
+    assert [type(value) for value in hs_color] == [float, float]
+
+    # Mappings with containers still share their strings
+    color_mode = "".join(("h", "s"))  # noqa: FLY002
+    hass.states.async_set(
+        "light.kitchen", "on", {"color_mode": color_mode, "modes": [color_mode]}
+    )
+    kitchen = hass.states.get("light.kitchen")
+    assert kitchen.attributes == {"color_mode": "hs", "modes": ["hs"]}
+    assert kitchen.attributes["color_mode"] is bowl.attributes["color_mode"]
+
+    # Internal callers may pass no attributes
+    hass.states.async_set_internal(
+        "light.empty", "on", None, False, None, None, time.time()
+    )
+    assert hass.states.get("light.empty").attributes == {}
+
+
+async def test_statemachine_creates_datetimes_lazily(hass: HomeAssistant) -> None:
+    """Test the datetimes of states are created when they are accessed."""
+    now = dt_util.utcnow()
+    with freeze_time(now):
+        hass.states.async_set("light.bowl", "on")
+    state = hass.states.get("light.bowl")
+    assert state._last_updated is None
+    assert state._last_changed is None
+    assert state._last_reported is None
+    assert state.last_updated == state.last_changed == state.last_reported == now
+    assert state.last_changed is state.last_changed
+
+    later = now + timedelta(seconds=10)
+    with freeze_time(later):
+        hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    # The datetime of the last change is shared since it was already created
+    assert state2.last_changed is state.last_changed
+    assert state2._last_updated is None
+    assert state2.last_updated == state2.last_reported == later
+    assert state2.as_dict()["last_updated"] == later.isoformat()
+
+    even_later = later + timedelta(seconds=10)
+    with freeze_time(even_later):
+        hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert state2._last_reported is None
+    assert state2.last_reported_timestamp == even_later.timestamp()
+    assert state2.last_reported == even_later
+    assert state2.last_updated == later
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -14,7 +14,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
@@ -1381,6 +1381,22 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_import_timings_recorded_during_startup(hass: HomeAssistant) -> None:
+    """Test import times are recorded until Home Assistant is running."""
+    integration = await loader.async_get_integration(hass, "group")
+    hass.set_state(CoreState.starting)
+
+    await integration.async_get_component()
+    await integration.async_get_platforms(["light"])
+    assert loader.async_get_import_timings(hass) == {
+        "group": {None: pytest.approx(0, abs=1), "light": pytest.approx(0, abs=1)}
+    }
+
+    hass.set_state(CoreState.running)
+    await integration.async_get_platforms(["sensor"])
+    assert loader.async_get_import_timings(hass)["group"].keys() == {None, "light"}
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture